@@ -0,0 +1,102 @@
+"""
+Tiempo de AndreaniBot.fetch_api_requisitions contra las páginas grabadas de Oracle HCM.
+
+Un servidor local responde tests/fixtures/oracle_hcm_andreani_requisitions.json
+agregando una latencia fija por request (la del portal real ronda los
+150-300 ms), de modo que el resultado depende de la cantidad de páginas y no
+de la red del momento.
+
+Con --browser se mide también el respaldo con Selenium
+(fetch_browser_requisitions) sobre un listado HTML armado con la primera página
+de la misma grabación, que es lo que muestra el primer render del portal. El
+HTML es estático: no incluye el JavaScript de la SPA ni su propio pedido a la
+API, así que el tiempo del navegador es una cota inferior. Requiere Chrome.
+
+Uso:
+    python benchmarks/bench_andreani_api.py [--latency-ms 200] [--runs 5] [--browser]
+"""
+import argparse
+import html
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+from helpers import StubServer, load_fixture  # noqa: E402
+from src.sites.andreani import AndreaniBot  # noqa: E402
+
+
+def listing_html(bot, page):
+    """Listado de Candidate Experience con las tarjetas que lee LISTING_SPEC."""
+    cards = "\n".join(
+        f'<li class="job-list-item"><a class="job-list-item__link" href="{bot.job_url(requisition["Id"])}">'
+        f'<span class="job-tile__title">{html.escape(requisition["Title"])}</span></a></li>'
+        for requisition in page["items"][0]["requisitionList"]
+    )
+    return f"<!DOCTYPE html><html><head><meta charset='utf-8'></head><body><ul>{cards}</ul></body></html>"
+
+
+def report(name, timings, detail):
+    print(f"{name}: {detail}")
+    print(f"  mediana {statistics.median(timings):.2f}s | mín {min(timings):.2f}s | máx {max(timings):.2f}s")
+
+
+def time_runs(fetch, runs):
+    """Retorna (último resultado, tiempos por corrida) de `fetch`."""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result  = fetch()
+        timings.append(time.perf_counter() - started)
+    return result, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="Latencia simulada por request")
+    parser.add_argument("--runs", type=int, default=5, help="Repeticiones")
+    parser.add_argument("--browser", action="store_true", help="Medir también el respaldo con Selenium")
+    args = parser.parse_args()
+
+    pages = load_fixture("oracle_hcm_andreani_requisitions.json")["pages"]
+    bot   = AndreaniBot()
+
+    def respond(request):
+        time.sleep(args.latency_ms / 1000)
+        if request.path.endswith("/jobs"):
+            return 200, listing_html(bot, pages[0])
+        offset = int(re.search(r"offset=(\d+)", request.query["finder"][0]).group(1))
+        return 200, pages[offset // AndreaniBot.PAGE_SIZE]
+
+    with StubServer(respond) as server:
+        bot.API_BASE_URL = server.url
+
+        requisitions, timings = time_runs(bot.fetch_api_requisitions, args.runs)
+        report("Oracle HCM (API)", timings,
+               f"{len(requisitions)} ofertas en {len(server.requests) // args.runs} requests "
+               f"(latencia simulada {args.latency_ms:.0f} ms)")
+
+        if args.browser:
+            from src.driver import get_driver
+
+            with tempfile.TemporaryDirectory() as profile_dir:
+                driver = get_driver(Path(profile_dir))
+                try:
+                    browser_bot = AndreaniBot(driver)
+                    browser_bot.API_BASE_URL = server.url
+                    browser_bot.fetch_browser_requisitions()  # Primera carga de Chrome fuera de la medición
+                    cards, timings = time_runs(browser_bot.fetch_browser_requisitions, args.runs)
+                finally:
+                    driver.quit()
+            report("Navegador (Selenium)", timings, f"{len(cards)} ofertas del primer render")
+
+
+if __name__ == "__main__":
+    main()
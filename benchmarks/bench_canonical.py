@@ -0,0 +1,85 @@
+"""
+Costo por llamada de la canonicalización de URLs.
+
+Compara la función `normalize_url` anterior al registro de reglas (copiada
+abajo tal como estaba en src/history.py) con la implementación de
+src/canonical.py, sin cache y con el cache LRU. Cada URL del corpus se
+consulta varias veces por pasada, como ocurre en los bots (bot,
+check_and_track, historial y cache de veredictos).
+
+Uso:
+    python benchmarks/bench_canonical.py [--urls 2700] [--lookups 4] [--rounds 5]
+"""
+import argparse
+import re
+import time
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+
+from corpus import register_all_sites, synthetic_urls
+
+from src.canonical import canonical_key, normalize_url
+
+LEGACY_TRACKING_PARAMS = {
+    "searchid", "page", "s", "lc",
+    "utm_source", "utm_medium", "utm_campaign", "utm_content", "utm_term",
+}
+
+
+def legacy_normalize_url(url):
+    """`normalize_url` con ramas por portal, previa a src/canonical.py."""
+    if not url:
+        return url
+    try:
+        parsed = urlparse(url.strip())
+        original_params = parse_qs(parsed.query, keep_blank_values=True)
+        clean_params = {
+            k: v for k, v in original_params.items()
+            if k.lower() not in LEGACY_TRACKING_PARAMS
+        }
+        clean_query = urlencode(clean_params, doseq=True)
+        path = parsed.path
+        if "bumeran.com.ar" in parsed.netloc and path.startswith("/empleos/"):
+            path = re.sub(r"-\d+(\.html)$", r"\1", path)
+        return urlunparse((parsed.scheme, parsed.netloc, path, parsed.params, clean_query, ""))
+    except Exception:
+        return url.strip()
+
+
+def per_call(function, urls, lookups, rounds, clear=None):
+    """Mejor tiempo por llamada, en segundos, sobre `rounds` pasadas."""
+    best = float("inf")
+    for _ in range(rounds):
+        if clear is not None:
+            clear()
+        started = time.perf_counter()
+        for url in urls:
+            for _ in range(lookups):
+                function(url)
+        best = min(best, (time.perf_counter() - started) / (len(urls) * lookups))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--urls", type=int, default=2700, help="URLs del corpus sintético")
+    parser.add_argument("--lookups", type=int, default=4, help="Consultas por URL en cada pasada")
+    parser.add_argument("--rounds", type=int, default=5, help="Pasadas (se informa la mejor)")
+    args = parser.parse_args()
+
+    register_all_sites()
+    urls = synthetic_urls(args.urls)
+
+    # Cada pasada arranca con el cache vacío, como un ciclo nuevo del bot.
+    results = [
+        ("normalize_url anterior",      per_call(legacy_normalize_url, urls, args.lookups, args.rounds)),
+        ("normalize_url sin cache",     per_call(normalize_url.__wrapped__, urls, args.lookups, args.rounds)),
+        ("normalize_url con LRU",       per_call(normalize_url, urls, args.lookups, args.rounds, normalize_url.cache_clear)),
+        ("canonical_key con LRU",       per_call(canonical_key, urls, args.lookups, args.rounds, canonical_key.cache_clear)),
+    ]
+    print(f"{len(urls)} URLs x {args.lookups} consultas por pasada:")
+    for label, seconds in results:
+        print(f"  {label:<26} {seconds * 1e6:6.1f} us por llamada")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Memoria y tiempo de consulta de las representaciones del historial en memoria.
+
+Compara, para cada tamaño, el dict {clave: fecha ISO} del almacenamiento
+clásico con FingerprintIndex (huellas de 64 bits + días en arrays) y con el
+BloomFilter opcional (1% de falsos positivos). La memoria se mide con
+tracemalloc y se informa por oferta; la consulta incluye calcular la huella
+de la clave (la mitad de las consultas son claves presentes).
+
+Uso:
+    python benchmarks/bench_fingerprints.py [--sizes 10000,100000]
+"""
+import argparse
+import json
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from corpus import register_all_sites, synthetic_urls
+
+from src.canonical import canonical_key
+from src.fingerprints import BloomFilter, FingerprintIndex, url_fingerprint
+
+
+def measure_memory(build):
+    """Retorna (objeto, bytes que quedan asignados tras construirlo)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    built  = build()
+    after  = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return built, after - before
+
+
+def per_lookup(contains, probes, rounds=3):
+    """Mejor tiempo por consulta, en segundos, de `contains` sobre `probes`."""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for probe in probes:
+            contains(probe)
+        best = min(best, (time.perf_counter() - started) / len(probes))
+    return best
+
+
+def bench_size(size):
+    now     = datetime.now()
+    keys    = list(dict.fromkeys(canonical_key(url) for url in synthetic_urls(size, seed=size)))
+    dates   = {key: (now - timedelta(days=random.randrange(15))).isoformat() for key in keys}
+    raw     = json.dumps(dates)
+    missing = [canonical_key(url) for url in synthetic_urls(min(size, 10000), seed=size + 1)]
+    probes  = random.sample(keys, len(missing) // 2) + missing[: len(missing) // 2]
+    random.shuffle(probes)
+
+    # El dict se arma desde el JSON, como al cargar seen_jobs.json.
+    table, table_bytes = measure_memory(lambda: json.loads(raw))
+    index, index_bytes = measure_memory(
+        lambda: FingerprintIndex((url_fingerprint(key), datetime.fromisoformat(date)) for key, date in dates.items())
+    )
+
+    def build_bloom():
+        bloom = BloomFilter(len(keys))
+        for key in keys:
+            bloom.add(url_fingerprint(key))
+        return bloom
+
+    bloom, bloom_bytes = measure_memory(build_bloom)
+
+    return len(keys), (
+        (table_bytes / len(keys), per_lookup(lambda key: key in table, probes)),
+        (index_bytes / len(keys), per_lookup(lambda key: url_fingerprint(key) in index, probes)),
+        (bloom_bytes / len(keys), per_lookup(lambda key: url_fingerprint(key) in bloom, probes)),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000", help="Tamaños separados por coma (ej: 10000,100000,1000000)")
+    args = parser.parse_args()
+
+    register_all_sites()
+    random.seed(0)
+    print(f"{'entradas':>10}  {'dict[str,str]':>18}  {'FingerprintIndex':>18}  {'Bloom (1%)':>18}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        count, results = bench_size(size)
+        cells = [f"{memory:.1f} B, {seconds * 1e6:.2f} us" for memory, seconds in results]
+        print(f"{count:>10,}  " + "  ".join(f"{cell:>18}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main()
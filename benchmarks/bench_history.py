@@ -0,0 +1,97 @@
+"""
+Historial: almacenamiento JSON clásico contra SQLite (HISTORY_BACKEND).
+
+Para cada tamaño se arma un historial con claves canónicas del corpus
+sintético y se mide, en una carpeta temporal:
+- carga: JsonHistoryStore.load (lee, normaliza y reescribe el JSON) contra el
+  arranque de SqliteHistoryStore sobre una base ya migrada (incluye la purga);
+- alta: un archivado (el JSON reescribe el archivo completo);
+- consulta: `contains` por clave primaria en SQLite.
+
+Uso:
+    python benchmarks/bench_history.py [--sizes 10000,100000] [--adds 20]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from corpus import register_all_sites, synthetic_urls
+
+from src.canonical import canonical_key
+from src.history import DAYS_TO_REMEMBER, JsonHistoryStore, SqliteHistoryStore
+
+
+def timed(function, repeat=1):
+    """Mediana en segundos de `repeat` llamadas a `function`."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def format_seconds(seconds):
+    if seconds >= 1:
+        return f"{seconds:.1f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds * 1e6:.0f} us"
+
+
+def bench_size(size, adds, folder):
+    now        = datetime.now()
+    limit_date = now - timedelta(days=DAYS_TO_REMEMBER)
+    keys       = [canonical_key(url) for url in synthetic_urls(size, seed=size)]
+    data       = {key: (now - timedelta(days=random.random() * 10)).isoformat() for key in keys}
+    new_keys   = [canonical_key(url) for url in synthetic_urls(adds, seed=size + 1)]
+
+    json_path = os.path.join(folder, f"seen_jobs_{size}.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    json_store = JsonHistoryStore(json_path)
+    json_load  = timed(lambda: json_store.load(limit_date))
+    json_add   = statistics.median(timed(lambda key=key: json_store.add(key, now)) for key in new_keys)
+
+    # La migración desde JSON ocurre una sola vez; se mide el arranque siguiente.
+    legacy_path = os.path.join(folder, f"legacy_{size}.json")
+    with open(legacy_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    db_path     = os.path.join(folder, f"seen_jobs_{size}.db")
+    migrate     = timed(lambda: SqliteHistoryStore(db_path, legacy_path).load(limit_date))
+    sqlite      = SqliteHistoryStore(db_path, legacy_path)
+    sqlite_load = timed(lambda: sqlite.load(limit_date))
+    sqlite_add  = statistics.median(timed(lambda key=key: sqlite.add(key, now)) for key in new_keys)
+    probes      = random.sample(keys, min(10000, size))
+    lookup      = timed(lambda: [sqlite.contains(key) for key in probes]) / len(probes)
+    sqlite.close()
+
+    return json_load, sqlite_load, json_add, sqlite_add, lookup, migrate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000", help="Tamaños separados por coma (ej: 10000,100000,1000000)")
+    parser.add_argument("--adds", type=int, default=20, help="Archivados medidos por tamaño")
+    args = parser.parse_args()
+
+    register_all_sites()
+    random.seed(0)
+    print(f"{'entradas':>10}  {'carga (JSON / SQLite)':>24}  {'alta (JSON / SQLite)':>24}  {'consulta':>9}  {'migración':>10}")
+    with tempfile.TemporaryDirectory() as folder:
+        for size in (int(value) for value in args.sizes.split(",")):
+            json_load, sqlite_load, json_add, sqlite_add, lookup, migrate = bench_size(size, args.adds, folder)
+            print(
+                f"{size:>10,}  {format_seconds(json_load):>11} / {format_seconds(sqlite_load):<10}"
+                f"  {format_seconds(json_add):>11} / {format_seconds(sqlite_add):<10}"
+                f"  {format_seconds(lookup):>9}  {format_seconds(migrate):>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Tiempo del clasificador por trigramas (src/language_id.py) contra el escaneo de frases.
+
+Ambos evalúan las mismas descripciones sintéticas: renglones de avisos en
+español, inglés y portugués mezclados, más los renglones cortos de la interfaz
+del portal, repetidos hasta cada largo pedido. El escáner usa las frases por
+defecto de /addidioma; el clasificador ya tiene armados sus perfiles (se
+construyen una sola vez por proceso). Se informa el mejor tiempo por
+descripción y el throughput.
+
+Uso:
+    python benchmarks/bench_language_id.py [--lengths 2000,8000,20000] [--texts 200]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.keywords_manager import DEFAULT_LANGUAGE_KEYWORD_GROUPS, DEFAULT_LANGUAGE_KEYWORDS  # noqa: E402
+from src.language_filter import PhraseScanner  # noqa: E402
+from src.language_id import get_language_identifier  # noqa: E402
+
+LINES = {
+    "es": [
+        "Buscamos un analista de sistemas para sumarse al equipo de infraestructura de la empresa.",
+        "Vas a participar en el relevamiento de requerimientos y en la documentación de procesos.",
+        "Requisitos: estudios en curso en carreras afines y conocimientos de redes y bases de datos.",
+        "Ofrecemos modalidad híbrida, obra social, capacitaciones y un gran clima de trabajo.",
+    ],
+    "en": [
+        "We are looking for a support engineer to join our infrastructure team in Buenos Aires.",
+        "You will take part in gathering requirements and documenting our internal processes.",
+        "Requirements: a degree in progress in a related field and knowledge of networking.",
+        "We offer a hybrid model, health insurance, training and a great working environment.",
+    ],
+    "pt": [
+        "Buscamos um analista de sistemas para fazer parte da equipe de infraestrutura da empresa.",
+        "Você vai participar do levantamento de requisitos e da documentação dos processos.",
+        "Requisitos: graduação em andamento em áreas afins e conhecimentos de redes e bancos.",
+        "Oferecemos modelo híbrido, plano de saúde, treinamentos e um ótimo ambiente de trabalho.",
+    ],
+}
+INTERFACE = ["Postularme", "Guardar aviso", "Compartir", "Ver más empleos", "Iniciar sesión"]
+
+
+def descriptions(count, length, seed=0):
+    """Retorna `count` descripciones de ~`length` caracteres, reproducibles con `seed`."""
+    rng   = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        language = rng.choice(list(LINES))
+        lines    = []
+        while sum(len(line) + 1 for line in lines) < length:
+            lines.append(rng.choice(INTERFACE) if rng.random() < 0.2 else rng.choice(LINES[language]))
+        texts.append("\n".join(lines))
+    return texts
+
+
+def per_text(classify, texts, rounds=3):
+    """Mejor tiempo por descripción, en segundos, de `classify` sobre `texts`."""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for text in texts:
+            classify(text)
+        best = min(best, (time.perf_counter() - started) / len(texts))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lengths", default="2000,8000,20000", help="Largos de descripción separados por coma")
+    parser.add_argument("--texts", type=int, default=200, help="Descripciones por largo")
+    args = parser.parse_args()
+
+    scanner    = PhraseScanner(DEFAULT_LANGUAGE_KEYWORDS, DEFAULT_LANGUAGE_KEYWORD_GROUPS)
+    identifier = get_language_identifier()
+
+    print(f"{'caracteres':>10}  {'frases (PhraseScanner)':>26}  {'trigramas (identify)':>26}  {'relación':>8}")
+    for length in (int(value) for value in args.lengths.split(",")):
+        texts   = descriptions(args.texts, length, seed=length)
+        phrases = per_text(scanner.scan, texts)
+        ngrams  = per_text(identifier.identify, texts)
+        cells   = [f"{seconds * 1e6:,.0f} us, {length / seconds / 1e6:.1f} MB/s" for seconds in (phrases, ngrams)]
+        print(f"{length:>10,}  " + "  ".join(f"{cell:>26}" for cell in cells) + f"  {ngrams / phrases:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Corpus sintético de URLs de ofertas con la forma de cada portal.
+
+No hay un corpus offline de URLs reales: se generan URLs con los mismos
+segmentos variables que se ven en producción (ids, slugs, hashes de sesión,
+parámetros de tracking y anclas), de manera reproducible con `seed`.
+"""
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+TITLES = [
+    "desarrollador python jr", "analista de sistemas", "soporte tecnico it",
+    "programador java", "desarrollador frontend react", "administrativo de cobranzas",
+    "analista de cuentas a pagar", "help desk", "maquetador web", "pasante programador",
+]
+COMPANIES = ["aliantec", "globant", "hexacta", "banco provincia", "grupo datco", "nubity"]
+
+
+def _slug(rng):
+    text = f"{rng.choice(TITLES)} {rng.choice(COMPANIES)}"
+    return text.replace(" ", "-")
+
+
+def _linkedin(rng):
+    return (f"https://www.linkedin.com/jobs/view/{rng.randrange(10**9, 10**10)}/"
+            f"?refId={rng.getrandbits(64):x}&trackingId={rng.getrandbits(64):x}")
+
+
+def _computrabajo(rng):
+    return (f"https://ar.computrabajo.com/ofertas-de-trabajo/oferta-de-trabajo-de-{_slug(rng)}-"
+            f"{rng.getrandbits(128):032X}#lc=ListOffers-Score-{rng.randrange(40)}")
+
+
+def _bumeran(rng):
+    return f"https://www.bumeran.com.ar/empleos/{_slug(rng)}-{rng.randrange(10**9, 2 * 10**9)}.html?s={rng.getrandbits(48):x}"
+
+
+def _empleosit(rng):
+    return (f"https://www.empleosit.com.ar/display-job/{rng.randrange(10**5, 10**6)}/{_slug(rng)}.html"
+            f"?searchId={rng.getrandbits(40)}&page={rng.randrange(1, 6)}")
+
+
+def _andreani(rng):
+    return f"https://ibmzjb.fa.ocs.oraclecloud.com/hcmUI/CandidateExperience/es/sites/CX_1001/job/{rng.randrange(10**4, 10**5)}"
+
+
+def _bbva(rng):
+    slug = _slug(rng).title()
+    return f"https://bbva.wd3.myworkdayjobs.com/es/BBVA/job/Buenos-Aires/{slug}_{rng.randrange(10**6, 10**7):07d}"
+
+
+def _educacionit(rng):
+    return f"https://empleos.educacionit.com/trabajos/{rng.randrange(10**4, 10**5)}-{_slug(rng)}?utm_source=newsletter"
+
+
+def _vicentelopez(rng):
+    return f"https://empleo.vicentelopez.gov.ar/ofertas/{rng.randrange(10**3, 10**4)}#detalle"
+
+
+def _talentia(rng):
+    return f"https://talentia.frba.utn.edu.ar/ofertas/{rng.randrange(10**4, 10**5)}"
+
+
+SHAPES = (_linkedin, _computrabajo, _bumeran, _empleosit, _andreani, _bbva, _educacionit, _vicentelopez, _talentia)
+
+
+def synthetic_urls(count, seed=0):
+    """Retorna `count` URLs repartidas entre los portales, reproducibles con `seed`."""
+    rng = random.Random(seed)
+    return [SHAPES[index % len(SHAPES)](rng) for index in range(count)]
+
+
+def register_all_sites():
+    """Importa los bots para que registren sus reglas de canonicalización."""
+    from src.sites import (  # noqa: F401
+        andreani, bbva, bumeran, computrabajo, educacionit, empleosit, linkedin, talentia, vicentelopez,
+    )
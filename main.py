@@ -114,15 +114,32 @@ if __name__ == "__main__":
     gestionar_venv()
 
     # Ahora que el entorno es seguro, importamos todo
-    import time
-    from src.config import CHECK_INTERVAL_MINUTES
+    from src.config import CHECK_INTERVAL_MINUTES, PARALLEL_WORKERS
     from src.keywords_manager import get_positive_keywords, get_negative_keywords, get_language_keywords
-    from src.driver import get_driver
-    from src.notifications import send_telegram_message
+    from src.runner import SiteRunner
+    from src.history import history
+    from src.notifications import flush_notifications, queue_telegram_message
     from src.sites.bumeran import BumeranBot
     from src.sites.computrabajo import ComputrabajoBot
+    from src.sites.andreani import AndreaniBot
+    from src.sites.educacionit import EducacionITBot
+    from src.sites.bbva import BBVABot
+    from src.sites.vicentelopez import VicenteLopezBot
+    from src.sites.talentia import TalentiaBot
     from src.sites.empleosit import EmpleosITBot
 
+    # Sitios a recorrer en cada ciclo, en orden.
+    SITE_BOTS = [
+        ("BUMERAN", BumeranBot),
+        ("COMPUTRABAJO", ComputrabajoBot),
+        ("ANDREANI", AndreaniBot),
+        ("EDUCACIÓN IT", EducacionITBot),
+        ("BBVA", BBVABot),
+        ("VICENTE LÓPEZ", VicenteLopezBot),
+        ("UTN TALENTIA", TalentiaBot),
+        ("EMPLEOS IT", EmpleosITBot),
+    ]
+
     def run_bot():
         """Punto de entrada principal del bot."""
         pos_list = get_positive_keywords()
@@ -139,67 +156,52 @@ if __name__ == "__main__":
         print(f"\n🌐 Filtros de Idioma ({len(lan_list)} frases activas):")
         print(f"   {', '.join(sorted(lan_list))}")
         print(f"\n⏲️  Intervalo de Espera: {CHECK_INTERVAL_MINUTES} minutos")
+        print(f"⚡ Workers en paralelo: {PARALLEL_WORKERS}")
         print("====================================================")
 
-        try:
-            while True:
-                from src.listener import check_telegram_replies
+        from src.listener import listener, stop_requested
+
+        def shutdown(reason):
+            print(f"\n👋 {reason} Terminando ejecución.")
+            # Ningún worker toma otro sitio; runner.close espera a los que sigan activos.
+            stop_requested.set()
+            runner.close()
+            listener.close()
+            # Entrega las notificaciones encoladas; lo que no salga queda en disco.
+            flush_notifications()
+            history.close()
+            sys.exit(0)
+
+        # Los mensajes de Telegram llegan por long polling en segundo plano y se
+        # procesan en este hilo: mientras corren los sitios (on_idle) y durante la
+        # espera entre ciclos (listener.wait).
+        listener.start()
 
-                # Procesamos respuestas pendientes de Telegram antes de iniciar
-                check_telegram_replies()
+        # Cada worker inicia Chrome recién cuando un sitio lo necesita y lo
+        # conserva entre ciclos (KEEP_BROWSER_WARM). Con PARALLEL_WORKERS = 1
+        # los sitios corren en serie sobre un único navegador (ver src/runner.py).
+        runner = SiteRunner(
+            SITE_BOTS, workers=PARALLEL_WORKERS,
+            on_idle=listener.process_pending, stop_event=stop_requested,
+        )
 
-                driver = get_driver()
+        try:
+            while True:
+                # Procesamos los mensajes de Telegram recibidos antes de iniciar
+                listener.process_pending()
 
                 try:
-                    # --- BUMERAN ---
-                    print("\n🚀 PROCESANDO: BUMERAN")
-                    BumeranBot(driver).search()
-                    check_telegram_replies()
-
-                    # --- COMPUTRABAJO ---
-                    print("\n🚀 PROCESANDO: COMPUTRABAJO")
-                    ComputrabajoBot(driver).search()
-                    check_telegram_replies()
-
-                    # --- ANDREANI ---
-                    print("\n🚀 PROCESANDO: ANDREANI")
-                    from src.sites.andreani import AndreaniBot
-                    AndreaniBot(driver).search()
-                    check_telegram_replies()
-
-                    # --- EDUCACIÓN IT ---
-                    print("\n🚀 PROCESANDO: EDUCACIÓN IT")
-                    from src.sites.educacionit import EducacionITBot
-                    EducacionITBot(driver).search()
-                    check_telegram_replies()
-
-                    # --- BBVA ---
-                    print("\n🚀 PROCESANDO: BBVA")
-                    from src.sites.bbva import BBVABot
-                    BBVABot(driver).search()
-                    check_telegram_replies()
-
-                    # --- VICENTE LÓPEZ ---
-                    print("\n🚀 PROCESANDO: VICENTE LÓPEZ")
-                    from src.sites.vicentelopez import VicenteLopezBot
-                    VicenteLopezBot(driver).search()
-                    check_telegram_replies()
-
-                    # --- UTN TALENTIA ---
-                    print("\n🚀 PROCESANDO: UTN TALENTIA")
-                    from src.sites.talentia import TalentiaBot
-                    TalentiaBot(driver).search()
-                    check_telegram_replies()
-
-                    # --- EMPLEOS IT ---
-                    print("\n🚀 PROCESANDO: EMPLEOS IT")
-                    EmpleosITBot(driver).search()
-                    check_telegram_replies()
+                    # Nueva generación de ofertas notificadas y purga de vencidas.
+                    history.new_cycle()
+                    runner.run()
+
+                    if stop_requested.is_set():
+                        break
 
                     print("\n✅ Ciclo finalizado exitosamente.")
 
                     hours_wait = CHECK_INTERVAL_MINUTES / 60
-                    send_telegram_message(
+                    queue_telegram_message(
                         f"🏁 <b>Ciclo de búsqueda finalizado.</b>\n"
                         f"💤 Durmiendo {int(hours_wait)}hs hasta el próximo turno."
                     )
@@ -207,29 +209,15 @@ if __name__ == "__main__":
                 except Exception as error:
                     print(f"\n❌ Error durante la búsqueda: {error}")
 
-                finally:
-                    print("🔒 Cerrando navegador para liberar memoria.")
-                    driver.quit()
-
                 print(f"💤 Durmiendo {CHECK_INTERVAL_MINUTES} minutos hasta el próximo turno...")
 
-                total_wait_seconds = CHECK_INTERVAL_MINUTES * 60
-                check_interval = 60
-                elapsed = 0
-
-                while elapsed < total_wait_seconds:
-                    try:
-                        from src.listener import check_telegram_replies
-                        check_telegram_replies()
-                    except Exception as e:
-                        print(f"⚠️ Error chequeando Telegram en espera: {e}")
-
-                    time.sleep(check_interval)
-                    elapsed += check_interval
+                if listener.wait(CHECK_INTERVAL_MINUTES * 60):
+                    break
 
         except KeyboardInterrupt:
-            print("\n👋 Bot detenido manualmente. Terminando ejecución.")
-            sys.exit(0)
+            shutdown("Bot detenido manualmente.")
+
+        shutdown("Bot detenido desde Telegram.")
 
     # Iniciar ciclo
     run_bot()
@@ -0,0 +1,183 @@
+r"""
+Canonicalización de URLs de ofertas: registro de reglas por sitio.
+
+Cada portal agrega a las URLs de sus ofertas parámetros o sufijos que cambian
+entre búsquedas pero apuntan al mismo recurso. En lugar de un único
+`normalize_url` con ramas por portal, cada bot declara sus reglas en el
+atributo de clase URL_RULES (ver BaseBot) y se registran al importar su módulo:
+
+    URL_RULES = {
+        "name":            "linkedin",               # Prefijo de la clave canónica
+        "hosts":           ("linkedin.com",),         # Dominios (también subdominios)
+        "tracking_params": ("refId", "trackingId"),   # Query params a descartar
+        "path_rewrites":   ((r"regex", r"reemplazo"),),
+        "id_pattern":      r"/jobs/view/(\d+)",       # Id nativo de la oferta (grupo 1)
+    }
+
+- `normalize_url(url)`: URL limpia (sin fragmento, sin parámetros de tracking y
+  con las reescrituras del sitio aplicadas). Es la que se muestra y se notifica.
+- `canonical_key(url)`: clave estable para el historial. Si el sitio define
+  `id_pattern` y la URL lo contiene, la clave es '<name>:<id>' (el id nativo
+  del portal); si no, la URL normalizada.
+
+Las dos funciones se llaman muchas veces con la misma URL en una pasada (bot,
+check_and_track, historial, cache de veredictos), por lo que tienen un cache
+LRU acotado (CANONICAL_CACHE_SIZE) que se vacía al registrar reglas nuevas.
+"""
+import hashlib
+import re
+from functools import lru_cache
+from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
+
+CANONICAL_CACHE_SIZE = 4096
+
+# Parámetros de query string que ningún portal usa para identificar una oferta.
+GLOBAL_TRACKING_PARAMS = frozenset({
+    "utm_source",  # Parámetros de marketing estándar (Google Analytics, etc.)
+    "utm_medium",
+    "utm_campaign",
+    "utm_content",
+    "utm_term",
+})
+
+
+class SiteRules:
+    """Reglas compiladas de un sitio (ver URL_RULES en el docstring del módulo)."""
+
+    __slots__ = ("name", "hosts", "tracking_params", "path_rewrites", "id_pattern")
+
+    def __init__(self, name, hosts, tracking_params=(), path_rewrites=(), id_pattern=None):
+        self.name            = name
+        self.hosts           = tuple(host.lower() for host in hosts)
+        self.tracking_params = frozenset(param.lower() for param in tracking_params) | GLOBAL_TRACKING_PARAMS
+        self.path_rewrites   = tuple((re.compile(pattern), replacement) for pattern, replacement in path_rewrites)
+        self.id_pattern      = re.compile(id_pattern) if id_pattern else None
+
+    def matches(self, netloc):
+        host = netloc.lower().split(":")[0]
+        return any(host == suffix or host.endswith("." + suffix) for suffix in self.hosts)
+
+    def describe(self):
+        """Representación estable de las reglas (para `rules_version`)."""
+        return repr((
+            self.name, self.hosts, sorted(self.tracking_params),
+            [(pattern.pattern, replacement) for pattern, replacement in self.path_rewrites],
+            self.id_pattern.pattern if self.id_pattern else None,
+        ))
+
+
+_DEFAULT_RULES = SiteRules("", ())
+_registry      = {}  # nombre → SiteRules
+
+
+def register_site_rules(name, hosts, tracking_params=(), path_rewrites=(), id_pattern=None):
+    """
+    Registra (o reemplaza) las reglas de canonicalización de un sitio.
+
+    Args:
+        name (str): Nombre corto del sitio; prefijo de las claves '<name>:<id>'.
+        hosts (iterable[str]): Dominios del sitio (incluye sus subdominios).
+        tracking_params (iterable[str]): Query params propios del sitio a descartar.
+        path_rewrites (iterable[tuple]): Pares (regex, reemplazo) sobre el path.
+        id_pattern (str): Regex sobre el path cuyo grupo 1 es el id nativo de la oferta.
+    """
+    _registry[name] = SiteRules(name, hosts, tracking_params, path_rewrites, id_pattern)
+    rules_for.cache_clear()
+    normalize_url.cache_clear()
+    canonical_key.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def rules_for(netloc):
+    """
+    Reglas del sitio al que pertenece un dominio (reglas globales si no hay).
+
+    Hay pocos dominios distintos, por lo que el resultado se cachea y no se
+    recorre el registro en cada URL.
+    """
+    for rules in _registry.values():
+        if rules.matches(netloc):
+            return rules
+    return _DEFAULT_RULES
+
+
+def rules_version():
+    """
+    Huella de todas las reglas registradas.
+
+    Cambia cuando un sitio modifica sus reglas: los almacenamientos del
+    historial la usan para recalcular las claves guardadas.
+    """
+    described = "\n".join(_registry[name].describe() for name in sorted(_registry))
+    return hashlib.sha1(described.encode("utf-8")).hexdigest()[:16]
+
+
+def _clean(url):
+    """Retorna (URL normalizada, reglas del sitio, path ya reescrito)."""
+    parsed = urlparse(url.strip())
+    rules  = rules_for(parsed.netloc)
+
+    # Conservamos solo los query params que no son de tracking
+    clean_params = {
+        key: values for key, values in parse_qs(parsed.query, keep_blank_values=True).items()
+        if key.lower() not in rules.tracking_params
+    }
+    clean_query = urlencode(clean_params, doseq=True)
+
+    path = parsed.path
+    for pattern, replacement in rules.path_rewrites:
+        path = pattern.sub(replacement, path)
+
+    # Reconstruimos la URL sin fragmento y con query string limpia
+    normalized = urlunparse((parsed.scheme, parsed.netloc, path, parsed.params, clean_query, ""))
+    return normalized, rules, path
+
+
+@lru_cache(maxsize=CANONICAL_CACHE_SIZE)
+def normalize_url(url):
+    """
+    Normaliza una URL antes de compararla, guardarla o notificarla.
+
+    Normalizaciones aplicadas:
+    - Fragmento (#...): ancla de página, no afecta al recurso.
+    - Parámetros de tracking globales (utm_*) y los propios del sitio.
+    - Espacios en blanco al inicio/fin.
+    - Reescrituras de path del sitio (URL_RULES["path_rewrites"]).
+
+    Args:
+        url (str): URL a normalizar.
+
+    Returns:
+        str: URL sin fragmento, tracking params ni sufijos variables.
+    """
+    if not url:
+        return url
+    try:
+        return _clean(url)[0]
+    except Exception:
+        return url.strip()
+
+
+@lru_cache(maxsize=CANONICAL_CACHE_SIZE)
+def canonical_key(url):
+    """
+    Clave estable de una oferta para el historial y los caches.
+
+    Returns:
+        str: '<sitio>:<id nativo>' si el sitio lo permite, si no la URL normalizada.
+             Una clave ya canónica se retorna sin cambios.
+    """
+    if not url:
+        return url
+    prefix = url.split(":", 1)[0]
+    if prefix in _registry and not url.startswith(prefix + "://"):
+        return url
+    try:
+        normalized, rules, path = _clean(url)
+    except Exception:
+        return url.strip()
+    if rules.id_pattern is not None:
+        match = rules.id_pattern.search(path)
+        if match:
+            return f"{rules.name}:{match.group(1)}"
+    return normalized
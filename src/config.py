@@ -38,6 +38,11 @@ def get_env_variable(var_name, default=None, required=True):
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 TELEGRAM_CHAT_ID   = os.getenv("TELEGRAM_CHAT_ID")
 
+# Modo webhook (ver TELEGRAM_MODE): URL pública HTTPS que recibe los updates y
+# token secreto que Telegram envía en cada petición.
+TELEGRAM_WEBHOOK_URL    = os.getenv("TELEGRAM_WEBHOOK_URL")
+TELEGRAM_WEBHOOK_SECRET = os.getenv("TELEGRAM_WEBHOOK_SECRET")
+
 # Ruta al perfil de Chrome para persistir sesiones entre ejecuciones (ej: LinkedIn).
 # Si no se define, se usa la carpeta 'profile/' en la raíz del proyecto.
 CHROME_PROFILE_PATH = os.getenv("CHROME_PROFILE_PATH")
@@ -82,3 +87,114 @@ CHECK_INTERVAL_MINUTES = 360
 
 # Modo sin interfaz gráfica. True para servidores o uso en segundo plano.
 HEADLESS_MODE = True
+
+# Almacenamiento del historial de ofertas archivadas:
+# - "sqlite":  base seen_jobs.db; cada archivado escribe una sola fila. Un
+#              seen_jobs.json existente se migra automáticamente la primera vez.
+# - "journal": archivos planos sin SQLite: snapshot seen_jobs.json + diario
+#              seen_jobs.journal al que cada archivado agrega una línea.
+# - "json":    archivo seen_jobs.json reescrito completo en cada cambio (clásico).
+HISTORY_BACKEND = "sqlite"
+
+# Ciclos durante los que se recuerda una oferta notificada (y no archivada)
+# antes de volver a notificarla. Por defecto, los ciclos de un día (4 con el
+# intervalo de 6 h). 1 = se vuelve a avisar en el ciclo siguiente.
+HISTORY_SESSION_GENERATIONS = max(1, round(24 * 60 / CHECK_INTERVAL_MINUTES))
+
+# Filtro de Bloom delante del historial: descarta sin consultar el
+# almacenamiento las URLs que seguro no están archivadas. Útil con historiales
+# muy grandes en SQLite; cuesta ~2.4 bytes por oferta y un recorrido al iniciar.
+HISTORY_BLOOM_FILTER = False
+
+# Cantidad de sitios procesados en paralelo. Cada worker usa su propio Chrome y
+# su propia carpeta de perfil (<perfil>-worker-N). 1 = ejecución en serie con
+# un único navegador (recomendado en Termux/Android).
+PARALLEL_WORKERS = 1
+
+# Al recibir /stop, segundos que se espera a que terminen los sitios en curso
+# antes de cerrar los navegadores, el historial y la cola de Telegram.
+RUNNER_STOP_TIMEOUT_SECONDS = 60
+
+# Navegador persistente entre ciclos: Chrome queda abierto durante la espera y
+# se reutiliza en el ciclo siguiente (evita el arranque en frío, lento en ARM).
+# False lo cierra al final de cada ciclo para liberar memoria.
+KEEP_BROWSER_WARM = True
+
+# Reciclado del navegador persistente: se reinicia tras esta cantidad de ciclos
+# o si Chrome supera este consumo de memoria (MB). 0 desactiva cada límite.
+BROWSER_RECYCLE_CYCLES = 10
+BROWSER_MAX_MEMORY_MB  = 1500
+
+# Bloqueo de recursos en Chrome (imágenes, fuentes, analítica...) según lo que
+# declara cada sitio en BLOCKED_RESOURCE_TYPES / BLOCKED_HOSTS. También activa
+# la medición de tráfico por página. False carga las páginas completas.
+RESOURCE_BLOCKING_ENABLED = True
+
+# Estrategia de carga de Chrome: "eager" no espera imágenes ni iframes.
+PAGE_LOAD_STRATEGY = "eager"
+
+# Esperas adaptativas (ver BaseBot.wait_*): tiempo máximo por espera, cuánto
+# debe mantenerse estable el DOM y cuánto sin tráfico para considerar la red inactiva.
+WAIT_TIMEOUT_SECONDS = 15
+DOM_STABLE_MS        = 600
+NETWORK_IDLE_MS      = 500
+
+# Pausa "humana" deliberada entre acciones (segundos, al azar entre ambos
+# valores). Es independiente de las esperas: 0 y 0 la desactivan.
+HUMAN_DELAY_MIN_SECONDS = 0.3
+HUMAN_DELAY_MAX_SECONDS = 1.2
+
+# User-Agent estándar de escritorio, compartido por Chrome y por el backend HTTP.
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Backend HTTP: los sitios que lo soportan (USE_HTTP_BACKEND en cada bot) se
+# descargan con requests en lugar de Chrome. False fuerza Selenium para todos.
+HTTP_BACKEND_ENABLED = True
+
+# Método del filtro de idioma aplicado a la descripción de cada oferta:
+# - "phrases": busca las frases configuradas con /addidioma (comportamiento clásico).
+# - "ngram":   identificación estadística por trigramas de caracteres (sin red).
+#              No depende de la lista de frases y tolera encabezados sueltos en inglés.
+LANGUAGE_FILTER_MODE = "phrases"
+
+# Filtro de idioma por lotes: detalles descargados a la vez por página y
+# tiempo máximo (segundos) por descarga.
+LANGUAGE_FETCH_CONCURRENCY     = 4
+LANGUAGE_FETCH_TIMEOUT_SECONDS = 15
+
+# Cache de veredictos del filtro de idioma (verdicts.json): días que se reutiliza
+# el veredicto de una oferta sin volver a descargar su descripción.
+VERDICT_TTL_DAYS = 7
+
+# Modo "ngram": proporción mínima del texto en otro idioma (0 a 1) para descartar la oferta.
+LANGUAGE_ID_MIN_CONFIDENCE = 0.6
+
+# Cola de notificaciones a Telegram (src/notifications.py):
+# - NOTIFY_RATE_PER_SECOND / NOTIFY_BURST: ritmo de envío (Telegram admite ~1 mensaje/s por chat).
+# - NOTIFY_QUEUE_SIZE: mensajes en cola; si se llena, el excedente se guarda en disco.
+# - NOTIFY_MAX_RETRIES: intentos por mensaje ante errores de red o 429 antes de guardarlo.
+# - NOTIFY_FLUSH_TIMEOUT_SECONDS: espera máxima para vaciar la cola al detener el bot.
+NOTIFY_RATE_PER_SECOND         = 1.0
+NOTIFY_BURST                   = 3
+NOTIFY_QUEUE_SIZE              = 500
+NOTIFY_ENQUEUE_TIMEOUT_SECONDS = 5
+NOTIFY_MAX_RETRIES             = 5
+NOTIFY_FLUSH_TIMEOUT_SECONDS   = 30
+
+# Modo resumen: las ofertas de cada sitio se envían juntas, numeradas, al
+# terminar el sitio en lugar de un mensaje por oferta. Se archivan respondiendo
+# "ya lo vi <número>". Con NOTIFY_DIGEST_WINDOW_SECONDS > 0 un sitio largo
+# envía además resúmenes parciales cada esa cantidad de segundos.
+NOTIFY_DIGEST_MODE           = False
+NOTIFY_DIGEST_WINDOW_SECONDS = 0
+
+# Recepción de mensajes de Telegram (src/listener.py):
+# - "polling": long polling desde esta máquina. No requiere exponer puertos (Termux, PC).
+# - "webhook": Telegram envía los mensajes a TELEGRAM_WEBHOOK_URL (servidores con
+#              HTTPS público). Se escucha localmente en WEBHOOK_HOST:WEBHOOK_PORT.
+TELEGRAM_MODE = "polling"
+WEBHOOK_HOST  = "0.0.0.0"
+WEBHOOK_PORT  = 8443
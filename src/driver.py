@@ -1,43 +1,96 @@
+import json
 import os
+import time
+import weakref
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from src.config import HEADLESS_MODE
+from src.config import HEADLESS_MODE, USER_AGENT, RESOURCE_BLOCKING_ENABLED, PAGE_LOAD_STRATEGY
 
 
-def get_driver():
+def get_profile_dir(worker_index=0):
     """
-    Construye y retorna una instancia configurada de Chrome para Selenium.
+    Retorna la carpeta de perfil de Chrome para un worker.
 
-    Detecta automáticamente el entorno de ejecución (PC o Android/Termux)
-    y aplica la configuración correspondiente. El perfil de Chrome es
-    persistente entre ejecuciones para conservar sesiones activas.
+    El worker 0 usa el perfil principal (donde vive la sesión de LinkedIn).
+    Los demás usan subcarpetas propias, ya que Chrome no permite que dos
+    instancias compartan el mismo perfil al mismo tiempo.
     """
-    print("🚗 Inicializando el navegador...")
-
-    chrome_options = Options()
-
-    # Perfil persistente: conserva cookies y sesiones entre ejecuciones.
-    # Ruta configurable via CHROME_PROFILE_PATH en .env; por defecto usa ./profile.
     from src.config import CHROME_PROFILE_PATH
     from pathlib import Path
 
     profile_dir = Path(CHROME_PROFILE_PATH) if CHROME_PROFILE_PATH else Path.cwd() / "profile"
+    if worker_index:
+        profile_dir = profile_dir.parent / f"{profile_dir.name}-worker-{worker_index}"
+    return profile_dir
 
-    if not profile_dir.exists():
+
+# Cache de rutas resueltas por Selenium Manager (chromedriver y binario de Chrome).
+DRIVER_PATHS_FILE = "driver_paths.json"
+
+_cached_paths = None
+
+
+def load_cached_paths():
+    """
+    Retorna las rutas de chromedriver/Chrome resueltas en un arranque anterior.
+
+    Se consultan primero en memoria y luego en DRIVER_PATHS_FILE. Si alguna
+    ruta ya no existe (Chrome se actualizó, se borró el driver), se ignora el
+    cache para que Selenium Manager vuelva a resolverlas.
+
+    Returns:
+        dict | None: {'driver_path': str, 'binary_path': str} o None.
+    """
+    global _cached_paths
+    if _cached_paths is None and os.path.exists(DRIVER_PATHS_FILE):
         try:
-            profile_dir.mkdir(parents=True, exist_ok=True)
-            print(f"📁 Directorio de perfil creado: {profile_dir}")
-        except Exception as e:
-            print(f"⚠️ No se pudo crear directorio de perfil: {e}")
+            with open(DRIVER_PATHS_FILE, "r", encoding="utf-8") as f:
+                _cached_paths = json.load(f)
+        except Exception:
+            _cached_paths = None
+
+    if not _cached_paths:
+        return None
+    driver_path = _cached_paths.get("driver_path")
+    binary_path = _cached_paths.get("binary_path")
+    if not driver_path or not os.path.isfile(driver_path):
+        return None
+    if binary_path and not os.path.isfile(binary_path):
+        return None
+    return _cached_paths
+
+
+def save_cached_paths(driver_path, binary_path):
+    """Guarda las rutas resueltas en memoria y en disco."""
+    global _cached_paths
+    _cached_paths = {"driver_path": driver_path, "binary_path": binary_path or ""}
+    try:
+        with open(DRIVER_PATHS_FILE, "w", encoding="utf-8") as f:
+            json.dump(_cached_paths, f, indent=4)
+    except Exception as e:
+        print(f"⚠️ No se pudo guardar el cache de rutas del driver: {e}")
+
+
+def clear_cached_paths():
+    """Descarta el cache de rutas (por ejemplo, si el driver cacheado no arranca)."""
+    global _cached_paths
+    _cached_paths = None
+    try:
+        if os.path.exists(DRIVER_PATHS_FILE):
+            os.remove(DRIVER_PATHS_FILE)
+    except Exception:
+        pass
+
+
+def build_options(profile_dir):
+    """Construye las opciones de Chrome para la carpeta de perfil indicada."""
+    chrome_options = Options()
 
     print(f"👤 Usando perfil de Chrome: {profile_dir}")
     chrome_options.add_argument(f"--user-data-dir={profile_dir}")
 
     # User-Agent estándar de escritorio para evitar bloqueos por detección de bots.
-    chrome_options.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
 
     if HEADLESS_MODE:
         print("   -> Modo Headless activado")
@@ -58,20 +111,77 @@ def get_driver():
     # Suprime logs de Chrome, mostrando solo errores fatales.
     chrome_options.add_argument("--log-level=3")
 
+    # "eager": driver.get retorna con el DOM listo, sin esperar imágenes ni
+    # iframes. Cada bot espera después las señales que realmente necesita.
+    chrome_options.page_load_strategy = PAGE_LOAD_STRATEGY
+
+    # Log de rendimiento (eventos de red de DevTools) para medir el tráfico de
+    # cada página y los recursos bloqueados (ver NetworkMonitor).
+    if RESOURCE_BLOCKING_ENABLED:
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    return chrome_options
+
+
+def get_driver(profile_dir=None):
+    """
+    Construye y retorna una instancia configurada de Chrome para Selenium.
+
+    Detecta automáticamente el entorno de ejecución (PC o Android/Termux)
+    y aplica la configuración correspondiente. El perfil de Chrome es
+    persistente entre ejecuciones para conservar sesiones activas.
+
+    En PC, las rutas que resuelve Selenium Manager se cachean (ver
+    load_cached_paths), así los arranques siguientes evitan la búsqueda.
+
+    Args:
+        profile_dir (Path): Carpeta de perfil a usar. Por defecto, el perfil
+                            principal (ver get_profile_dir).
+    """
+    from selenium.webdriver.chrome.service import Service
+
+    print("🚗 Inicializando el navegador...")
+
+    # Perfil persistente: conserva cookies y sesiones entre ejecuciones.
+    # Ruta configurable via CHROME_PROFILE_PATH en .env; por defecto usa ./profile.
+    if profile_dir is None:
+        profile_dir = get_profile_dir()
+
+    if not profile_dir.exists():
+        try:
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            print(f"📁 Directorio de perfil creado: {profile_dir}")
+        except Exception as e:
+            print(f"⚠️ No se pudo crear directorio de perfil: {e}")
+
+    chrome_options = build_options(profile_dir)
+
     is_android = "ANDROID_ROOT" in os.environ
 
     try:
         if is_android:
             print("📱 Detectado entorno Android (Termux)")
-            from selenium.webdriver.chrome.service import Service
             chrome_options.binary_location = "/data/data/com.termux/files/usr/bin/chromium-browser"
             service = Service("/data/data/com.termux/files/usr/bin/chromedriver")
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        else:
-            print("💻 Detectado entorno PC (Windows/Linux/Mac)")
-            # Selenium Manager gestiona el driver automáticamente en PC.
-            driver = webdriver.Chrome(options=chrome_options)
+            return webdriver.Chrome(service=service, options=chrome_options)
+
+        print("💻 Detectado entorno PC (Windows/Linux/Mac)")
+
+        cached = load_cached_paths()
+        if cached:
+            print("   -> Usando rutas de chromedriver cacheadas")
+            if cached["binary_path"]:
+                chrome_options.binary_location = cached["binary_path"]
+            try:
+                return webdriver.Chrome(service=Service(cached["driver_path"]), options=chrome_options)
+            except Exception as e:
+                print(f"   ⚠️ El driver cacheado no arrancó ({e}). Resolviendo de nuevo...")
+                clear_cached_paths()
+                chrome_options = build_options(profile_dir)
 
+        # Selenium Manager gestiona el driver automáticamente en PC.
+        driver = webdriver.Chrome(options=chrome_options)
+        save_cached_paths(driver.service.path, chrome_options.binary_location)
         return driver
 
     except Exception as e:
@@ -79,3 +189,290 @@ def get_driver():
         print(f"   {e}")
         print("\n💡 Verificar que Google Chrome esté instalado y actualizado.")
         raise e
+
+
+def _process_tree_rss_mb(root_pid):
+    """
+    Suma la memoria residente (VmRSS) de un proceso y todos sus descendientes.
+
+    Se lee /proc directamente, por lo que solo funciona en Linux/Android.
+
+    Returns:
+        float | None: Megabytes en uso, o None si /proc no está disponible.
+    """
+    if not os.path.isdir("/proc"):
+        return None
+
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                # El nombre del proceso va entre paréntesis y puede tener espacios.
+                fields = f.read().rsplit(")", 1)[1].split()
+            children.setdefault(int(fields[1]), []).append(int(entry))
+        except Exception:
+            continue
+
+    total_kb = 0
+    pending  = [root_pid]
+    while pending:
+        pid = pending.pop()
+        pending.extend(children.get(pid, []))
+        try:
+            with open(f"/proc/{pid}/status", "r") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+        except Exception:
+            continue
+    return total_kb / 1024
+
+
+class BrowserSession:
+    """
+    Mantiene un Chrome "tibio" entre ciclos en lugar de iniciarlo cada vez.
+
+    El driver se crea recién cuando un sitio lo pide y se verifica antes de
+    entregarlo: si Chrome dejó de responder se descarta y se inicia otro.
+    Al terminar cada ciclo se recicla si superó BROWSER_RECYCLE_CYCLES ciclos
+    o BROWSER_MAX_MEMORY_MB de memoria (Chrome acumula memoria con el uso).
+
+    Args:
+        worker_index (int): Worker dueño de la sesión (define la carpeta de perfil).
+    """
+
+    def __init__(self, worker_index=0):
+        from src.config import BROWSER_RECYCLE_CYCLES, BROWSER_MAX_MEMORY_MB
+
+        self.worker_index  = worker_index
+        self.max_cycles    = BROWSER_RECYCLE_CYCLES
+        self.max_memory_mb = BROWSER_MAX_MEMORY_MB
+        self.cycles        = 0
+        self._driver       = None
+
+    @property
+    def is_open(self):
+        """True si hay un navegador iniciado en esta sesión."""
+        return self._driver is not None
+
+    def driver(self):
+        """Retorna un driver en condiciones de uso, iniciándolo o reemplazándolo si hace falta."""
+        if self._driver is not None and not self.is_healthy():
+            self.recycle("el navegador no responde")
+        if self._driver is None:
+            self._driver = get_driver(get_profile_dir(self.worker_index))
+            self.cycles  = 0
+        return self._driver
+
+    def is_healthy(self):
+        """True si Chrome responde a un script trivial."""
+        try:
+            return self._driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def memory_mb(self):
+        """Memoria usada por chromedriver y sus procesos de Chrome, o None si no se puede medir."""
+        try:
+            return _process_tree_rss_mb(self._driver.service.process.pid)
+        except Exception:
+            return None
+
+    def end_cycle(self):
+        """
+        Cuenta un ciclo de uso y recicla el navegador si corresponde.
+
+        Returns:
+            bool: True si el navegador fue reciclado.
+        """
+        if self._driver is None:
+            return False
+
+        self.cycles += 1
+        if self.max_cycles and self.cycles >= self.max_cycles:
+            self.recycle(f"{self.cycles} ciclos de uso")
+            return True
+
+        memory = self.memory_mb()
+        if memory is not None and self.max_memory_mb and memory > self.max_memory_mb:
+            self.recycle(f"{memory:.0f} MB en uso")
+            return True
+        return False
+
+    def recycle(self, reason):
+        """Cierra el navegador actual; el próximo pedido inicia uno nuevo."""
+        print(f"♻️ Reciclando navegador del worker {self.worker_index}: {reason}.")
+        self.close()
+
+    def close(self):
+        """Cierra el navegador si está abierto."""
+        if self._driver is None:
+            return
+        try:
+            self._driver.quit()
+        except Exception as e:
+            print(f"⚠️ Error cerrando navegador: {e}")
+        self._driver = None
+
+
+# ============================================================================
+# POLÍTICA DE RECURSOS (bloqueo de red via DevTools)
+# ============================================================================
+
+# Patrones de URL por tipo de recurso. `Network.setBlockedURLs` filtra por URL,
+# por lo que cada tipo se traduce a las extensiones que lo identifican.
+RESOURCE_TYPE_PATTERNS = {
+    "image":      ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*", "*.avif*"],
+    "font":       ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"],
+    "media":      ["*.mp4*", "*.webm*", "*.mp3*", "*.m3u8*", "*.ogg*"],
+    "stylesheet": ["*.css*"],
+}
+
+# Hosts de analítica y publicidad que ningún bot necesita.
+TRACKER_HOSTS = [
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "googlesyndication.com", "connect.facebook.net", "hotjar.com",
+    "clarity.ms", "newrelic.com", "nr-data.net", "criteo.com", "taboola.com",
+]
+
+# Última política aplicada a cada driver, para no repetir el comando por página.
+_applied_policies = weakref.WeakKeyDictionary()
+
+
+def blocked_url_patterns(resource_types=(), hosts=()):
+    """
+    Traduce tipos de recurso y hosts a patrones de `Network.setBlockedURLs`.
+
+    Args:
+        resource_types (iterable): Claves de RESOURCE_TYPE_PATTERNS ('image', 'font', ...).
+        hosts (iterable): Dominios de terceros a bloquear por completo.
+
+    Returns:
+        list[str]: Patrones con comodines, sin duplicados.
+    """
+    patterns = []
+    for resource_type in resource_types:
+        patterns.extend(RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+    for host in hosts:
+        patterns.append(f"*://{host}/*")
+        patterns.append(f"*.{host}/*")
+    return list(dict.fromkeys(patterns))
+
+
+def apply_resource_policy(driver, resource_types=(), hosts=()):
+    """
+    Bloquea en Chrome los recursos que el sitio declara innecesarios.
+
+    La política se aplica a la pestaña actual y se recuerda por driver: si el
+    sitio siguiente pide la misma, no se vuelve a enviar.
+
+    Returns:
+        bool: True si la política quedó activa.
+    """
+    if not RESOURCE_BLOCKING_ENABLED:
+        return False
+
+    patterns = blocked_url_patterns(resource_types, hosts)
+    if _applied_policies.get(driver) == patterns:
+        return True
+
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        _applied_policies[driver] = patterns
+        return True
+    except Exception as e:
+        print(f"   ⚠️ No se pudo aplicar el bloqueo de recursos: {e}")
+        return False
+
+
+class NetworkStats:
+    """Tráfico de red observado en una página (según el log de rendimiento)."""
+
+    __slots__ = ("requests", "bytes", "blocked", "blocked_by_type")
+
+    def __init__(self):
+        self.requests        = 0
+        self.bytes           = 0
+        self.blocked         = 0
+        self.blocked_by_type = {}
+
+    def add(self, other):
+        self.requests += other.requests
+        self.bytes    += other.bytes
+        self.blocked  += other.blocked
+        for resource_type, count in other.blocked_by_type.items():
+            self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + count
+
+    def describe(self):
+        detail = ", ".join(f"{t}: {n}" for t, n in sorted(self.blocked_by_type.items()))
+        blocked = f"{self.blocked} bloqueados" + (f" ({detail})" if detail else "")
+        return f"{self.requests} requests, {self.bytes / 1024:.0f} KB descargados, {blocked}"
+
+
+class NetworkMonitor:
+    """
+    Lector del log de rendimiento de un driver.
+
+    Cada `poll()` consume los eventos de red acumulados desde la lectura
+    anterior, los suma a un NetworkStats y mantiene el conjunto de requests
+    en curso. Lo usan tanto la medición de tráfico por página como la espera
+    de "red inactiva" (ver BaseBot.wait_network_idle).
+    """
+
+    def __init__(self, driver):
+        self.driver        = driver
+        self.inflight      = set()
+        self.last_activity = time.monotonic()
+        self._types        = {}
+        self.available     = True
+
+    def poll(self):
+        """
+        Returns:
+            NetworkStats | None: Tráfico nuevo, o None si el log no está disponible.
+        """
+        if not self.available:
+            return None
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            self.available = False
+            return None
+
+        stats = NetworkStats()
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except Exception:
+                continue
+            method = message.get("method")
+            params = message.get("params", {})
+            request_id = params.get("requestId")
+
+            if method == "Network.requestWillBeSent":
+                stats.requests += 1
+                self.inflight.add(request_id)
+                self._types[request_id] = (params.get("type") or "Other").lower()
+            elif method == "Network.loadingFinished":
+                stats.bytes += int(params.get("encodedDataLength") or 0)
+                self.inflight.discard(request_id)
+            elif method == "Network.loadingFailed":
+                self.inflight.discard(request_id)
+                if params.get("blockedReason"):
+                    stats.blocked += 1
+                    resource_type = (params.get("type") or self._types.get(request_id) or "other").lower()
+                    stats.blocked_by_type[resource_type] = stats.blocked_by_type.get(resource_type, 0) + 1
+            else:
+                continue
+            self.last_activity = time.monotonic()
+        return stats
+
+    def reset(self):
+        """Olvida los requests en curso (por ejemplo, al navegar a otra página)."""
+        self.inflight.clear()
+        self._types.clear()
+        self.last_activity = time.monotonic()
@@ -0,0 +1,158 @@
+"""
+Representación compacta de conjuntos de URLs.
+
+Guardar cada URL completa como `str` (y su fecha como otro `str` ISO) cuesta
+cientos de bytes por oferta. Para responder "¿ya vi esta URL?" alcanza con una
+huella de 64 bits de la URL normalizada: con 64 bits la probabilidad de que
+dos URLs distintas colisionen es despreciable para historiales de millones de
+ofertas (~3 en 10^8 de que exista alguna colisión entre un millón de URLs).
+
+- `url_fingerprint`: huella de 64 bits (blake2b) de una URL ya normalizada.
+- `FingerprintIndex`: huellas en un `array('Q')` ordenado más la fecha de cada
+  una como días desde FINGERPRINT_EPOCH en un `array('H')` (10 bytes por
+  oferta). Búsqueda binaria para consultar.
+- `BloomFilter`: filtro opcional para descartar rápido las URLs nuevas.
+- `SessionSet`: huellas notificadas por ciclo, con expiración por generaciones.
+"""
+import hashlib
+import math
+from array import array
+from bisect import bisect_left
+from collections import deque
+from datetime import datetime
+
+# Las fechas se guardan como días desde esta fecha en un entero de 16 bits
+# (alcanza hasta el año 2199).
+FINGERPRINT_EPOCH = datetime(2020, 1, 1)
+
+
+def url_fingerprint(url):
+    """Huella de 64 bits de una URL (ya normalizada)."""
+    return int.from_bytes(hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def day_offset(moment):
+    """Días entre FINGERPRINT_EPOCH y `moment`, acotados al rango de uint16."""
+    return min(max((moment - FINGERPRINT_EPOCH).days, 0), 0xFFFF)
+
+
+class FingerprintIndex:
+    """
+    Conjunto ordenado de huellas con la fecha (en días) de cada una.
+
+    Los dos arrays son paralelos: `days[i]` es la fecha de `keys[i]`. Consultar
+    es una búsqueda binaria; agregar desplaza el resto del array (memmove), lo
+    que es despreciable al ritmo de los archivados manuales.
+    """
+
+    def __init__(self, entries=()):
+        """
+        Args:
+            entries (iterable): Pares (huella, datetime) en cualquier orden.
+        """
+        latest = {}
+        for fingerprint, moment in entries:
+            offset = day_offset(moment)
+            if latest.get(fingerprint, -1) < offset:
+                latest[fingerprint] = offset
+
+        ordered   = sorted(latest.items())
+        self.keys = array("Q", (fingerprint for fingerprint, _ in ordered))
+        self.days = array("H", (offset for _, offset in ordered))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, fingerprint):
+        position = bisect_left(self.keys, fingerprint)
+        return position < len(self.keys) and self.keys[position] == fingerprint
+
+    def __iter__(self):
+        return iter(self.keys)
+
+    def add(self, fingerprint, moment):
+        """Agrega una huella (o actualiza su fecha si la nueva es posterior)."""
+        offset   = day_offset(moment)
+        position = bisect_left(self.keys, fingerprint)
+        if position < len(self.keys) and self.keys[position] == fingerprint:
+            self.days[position] = max(self.days[position], offset)
+            return
+        self.keys.insert(position, fingerprint)
+        self.days.insert(position, offset)
+
+    def purge(self, limit_date):
+        """
+        Descarta las huellas con fecha anterior a `limit_date`.
+
+        Returns:
+            int: Cantidad de huellas descartadas.
+        """
+        limit   = day_offset(limit_date)
+        keep    = [i for i, offset in enumerate(self.days) if offset >= limit]
+        removed = len(self.keys) - len(keep)
+        if removed:
+            self.keys = array("Q", (self.keys[i] for i in keep))
+            self.days = array("H", (self.days[i] for i in keep))
+        return removed
+
+    def memory_bytes(self):
+        """Bytes ocupados por los datos de los dos arrays."""
+        return self.keys.itemsize * len(self.keys) + self.days.itemsize * len(self.days)
+
+
+class BloomFilter:
+    """
+    Filtro de Bloom sobre huellas de 64 bits.
+
+    Responde "seguro que no está" sin consultar el almacenamiento; un "puede
+    estar" se confirma contra el índice real. No admite borrados: tras una
+    purga se reconstruye.
+
+    Args:
+        capacity (int): Cantidad de elementos esperada.
+        error_rate (float): Tasa de falsos positivos buscada con esa capacidad.
+    """
+
+    def __init__(self, capacity, error_rate=0.01):
+        capacity        = max(1, int(capacity))
+        self.size       = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits       = bytearray((self.size + 7) // 8)
+
+    def _positions(self, fingerprint):
+        # Doble hashing: las dos mitades de la huella generan las k posiciones.
+        low, high = fingerprint & 0xFFFFFFFF, (fingerprint >> 32) | 1
+        return ((low + i * high) % self.size for i in range(self.hash_count))
+
+    def add(self, fingerprint):
+        for position in self._positions(fingerprint):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, fingerprint):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(fingerprint))
+
+
+class SessionSet:
+    """
+    Huellas de las URLs notificadas, separadas por ciclo (generación).
+
+    `new_cycle()` abre una generación nueva y descarta las que superan
+    `generations`, de modo que la memoria queda acotada aunque el bot corra
+    durante semanas. Con generations = 1 solo se recuerda el ciclo actual.
+    """
+
+    def __init__(self, generations=1):
+        self.generations = deque([set()], maxlen=max(1, int(generations)))
+
+    def __contains__(self, fingerprint):
+        return any(fingerprint in generation for generation in self.generations)
+
+    def __len__(self):
+        return sum(len(generation) for generation in self.generations)
+
+    def add(self, fingerprint):
+        self.generations[-1].add(fingerprint)
+
+    def new_cycle(self):
+        """Abre una generación nueva; la más vieja se descarta si sobra."""
+        self.generations.append(set())
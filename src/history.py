@@ -1,170 +1,599 @@
 import json
 import os
-import re
+import sqlite3
+import threading
+import time
 from datetime import datetime, timedelta
-from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
+
+# normalize_url se re-exporta: los bots y el listener lo importan desde aquí.
+from src.canonical import canonical_key, normalize_url, rules_version
+from src.fingerprints import BloomFilter, FingerprintIndex, SessionSet, url_fingerprint
 
 # Constantes de configuración
 HISTORY_FILE = "seen_jobs.json"
+HISTORY_DB_FILE = "seen_jobs.db"
+HISTORY_JOURNAL_FILE = "seen_jobs.journal"
 DAYS_TO_REMEMBER = 15
 
-# Parámetros de query string que no identifican el recurso y deben ignorarse
-# al comparar URLs. Cada portal de empleo suele agregar sus propios parámetros
-# de sesión o paginación que varían entre búsquedas pero apuntan a la misma oferta.
-TRACKING_PARAMS = {
-    "searchid",    # EmpleosIT: identificador de sesión de búsqueda
-    "page",        # EmpleosIT: página de los resultados de búsqueda
-    "s",           # Bumeran: hash de sesión
-    "lc",          # Computrabajo: posición en el listado de resultados
-    "utm_source",  # Parámetros de marketing estándar (Google Analytics, etc.)
-    "utm_medium",
-    "utm_campaign",
-    "utm_content",
-    "utm_term",
-}
-
-def normalize_url(url):
+# Diario (HISTORY_BACKEND = "journal"): el diario se compacta en el snapshot
+# cuando supera JOURNAL_COMPACT_BYTES o cuando sus líneas (más las entradas
+# vencidas) superan JOURNAL_COMPACT_RATIO veces el tamaño del snapshot, con un
+# mínimo de JOURNAL_COMPACT_MIN_LINES. Las escrituras se sincronizan a disco
+# (fsync) como máximo cada JOURNAL_FSYNC_SECONDS segundos.
+JOURNAL_COMPACT_BYTES     = 256 * 1024
+JOURNAL_COMPACT_RATIO     = 0.5
+JOURNAL_COMPACT_MIN_LINES = 100
+JOURNAL_FSYNC_SECONDS     = 1.0
+
+def _normalized_entries(data, limit_date):
+    """
+    Normaliza las claves de un historial en formato {url: fecha ISO} y descarta
+    las entradas anteriores a `limit_date` o con fechas inválidas.
+
+    Si dos entradas distintas normalizan a la misma URL canónica (ej: misma
+    oferta con searchId diferente), se conserva la fecha más reciente.
     """
-    Normaliza una URL antes de compararla o guardarla.
-
-    Distintos portales de empleo agregan parámetros o sufijos variables a las
-    URLs de sus ofertas que cambian entre búsquedas pero apuntan al mismo recurso.
-    Esta función los elimina para garantizar que la misma oferta siempre produzca
-    la misma clave canónica, independientemente de cómo se accedió a ella.
-
-    Normalizaciones aplicadas:
-    - Fragmento (#...): ancla de página, no afecta al recurso.
-    - Parámetros de tracking definidos en TRACKING_PARAMS.
-    - Espacios en blanco al inicio/fin.
-    - Bumeran: elimina el ID numérico al final del slug de la oferta.
-      La misma oferta puede aparecer con IDs distintos en páginas de
-      resultados diferentes (ej: -aliantec-1118190158.html vs -aliantec-2177247.html).
-
-    Args:
-        url (str): URL a normalizar.
-
-    Returns:
-        str: URL canónica sin fragmento, tracking params ni IDs variables de listing.
+    cleaned_data = {}
+    for url, date_str in data.items():
+        try:
+            seen_date = datetime.fromisoformat(date_str)
+        except (TypeError, ValueError):
+            continue
+        if seen_date <= limit_date:
+            continue
+
+        clean_url = canonical_key(url)
+        if clean_url in cleaned_data:
+            if seen_date > datetime.fromisoformat(cleaned_data[clean_url]):
+                cleaned_data[clean_url] = date_str
+        else:
+            cleaned_data[clean_url] = date_str
+    return cleaned_data
+
+
+def _backup_corrupt_file(path):
+    """
+    Renombra un archivo de historial ilegible a '<archivo>.corrupt-<fecha>'.
+
+    Evita que la próxima escritura lo pise con un historial vacío: el usuario
+    conserva el archivo para recuperarlo a mano.
     """
-    if not url:
-        return url
+    backup_path = f"{path}.corrupt-{datetime.now():%Y%m%d-%H%M%S}"
     try:
-        parsed = urlparse(url.strip())
-
-        # Conservamos solo los query params que no están en la lista de exclusión
-        original_params = parse_qs(parsed.query, keep_blank_values=True)
-        clean_params = {
-            k: v for k, v in original_params.items()
-            if k.lower() not in TRACKING_PARAMS
-        }
-
-        clean_query = urlencode(clean_params, doseq=True)
-
-        path = parsed.path
-
-        # Bumeran agrega un ID numérico al final del slug de cada oferta que varía
-        # según la página de resultados donde aparece. Lo eliminamos para que la
-        # misma oferta siempre tenga la misma clave canónica.
-        if "bumeran.com.ar" in parsed.netloc and path.startswith("/empleos/"):
-            path = re.sub(r"-\d+(\.html)$", r"\1", path)
-
-        # Reconstruimos la URL sin fragmento y con query string limpia
-        normalized = urlunparse((
-            parsed.scheme,
-            parsed.netloc,
-            path,
-            parsed.params,
-            clean_query,
-            ""  # Sin fragmento
-        ))
-        return normalized
-    except Exception:
-        return url.strip()
+        os.replace(path, backup_path)
+        print(f"⚠️ Se guardó una copia del archivo dañado en {backup_path}.")
+    except OSError as e:
+        print(f"⚠️ No se pudo respaldar {path}: {e}")
 
 
-class JobHistory:
-    """
-    Gestiona la persistencia de ofertas vistas para evitar duplicados.
+def _write_snapshot(path, entries):
+    """Escribe un historial {url: fecha} de forma atómica (archivo temporal + rename)."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(entries, f, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
 
-    Mantiene un archivo JSON local ('seen_jobs.json') con pares URL → Fecha.
-    Todas las URLs se almacenan normalizadas (ver normalize_url) para garantizar
-    comparaciones consistentes independientemente de los parámetros de sesión
-    que cada portal pueda agregar.
 
-    Además del historial persistente, mantiene un set en memoria (`session_seen`)
-    con las URLs notificadas en el ciclo actual. Este set se reinicia con cada
-    arranque del bot, garantizando que una oferta no se notifique más de una vez
-    por ciclo aunque aparezca en varias páginas de resultados.
+class JsonHistoryStore:
+    """
+    Almacenamiento clásico: todo el historial en 'seen_jobs.json'.
 
-    Al iniciar, purga automáticamente los registros con más de DAYS_TO_REMEMBER
-    días para evitar que el archivo crezca indefinidamente.
+    Mantiene un dict en memoria y reescribe el archivo completo en cada alta,
+    por lo que cada escritura cuesta O(n). Se conserva para HISTORY_BACKEND = "json".
     """
 
-    def __init__(self):
-        self.seen_jobs    = {}
-        self.session_seen = set()  # URLs notificadas en el ciclo actual (no persiste)
-        self.load()
+    def __init__(self, path=HISTORY_FILE):
+        self.path      = path
+        self.seen_jobs = {}
 
-    def load(self):
-        """
-        Carga el historial desde disco, purga entradas expiradas y normaliza
-        todas las claves URL para garantizar comparaciones consistentes.
-
-        Si dos entradas distintas en disco normalizan a la misma URL canónica
-        (ej: misma oferta con searchId diferente), se conserva la más reciente.
-        Al finalizar, persiste el historial ya limpio y normalizado.
-        """
-        if not os.path.exists(HISTORY_FILE):
+    def load(self, limit_date):
+        """Carga el historial, purga lo expirado, normaliza las claves y lo reescribe."""
+        if not os.path.exists(self.path):
             self.seen_jobs = {}
             return
 
         try:
-            with open(HISTORY_FILE, "r", encoding="utf-8") as f:
+            with open(self.path, "r", encoding="utf-8") as f:
                 data = json.load(f)
+            self.seen_jobs = _normalized_entries(data, limit_date)
+            self.flush()
+        except Exception as e:  # JSON inválido, archivo ilegible o entradas con otro formato
+            print(f"⚠️ Error cargando historial: {e}. Se iniciará uno nuevo.")
+            _backup_corrupt_file(self.path)
+            self.seen_jobs = {}
 
-            cleaned_data = {}
-            limit_date = datetime.now() - timedelta(days=DAYS_TO_REMEMBER)
+    def contains(self, clean_url):
+        return clean_url in self.seen_jobs
 
-            for url, date_str in data.items():
-                try:
-                    seen_date = datetime.fromisoformat(date_str)
-
-                    if seen_date > limit_date:
-                        clean_url = normalize_url(url)
-
-                        # Si dos entradas distintas resultan en la misma URL
-                        # canónica, conservamos la fecha más reciente de las dos
-                        if clean_url in cleaned_data:
-                            existing_date = datetime.fromisoformat(cleaned_data[clean_url])
-                            if seen_date > existing_date:
-                                cleaned_data[clean_url] = date_str
-                        else:
-                            cleaned_data[clean_url] = date_str
-                except ValueError:
-                    continue
+    def fingerprints(self):
+        return (url_fingerprint(url) for url in self.seen_jobs)
 
-            self.seen_jobs = cleaned_data
-            self.save()
+    def add(self, clean_url, seen_at):
+        self.seen_jobs[clean_url] = seen_at.isoformat()
+        self.flush()
 
-        except (json.JSONDecodeError, Exception) as e:
-            print(f"⚠️ Error cargando historial: {e}. Se iniciará uno nuevo.")
-            self.seen_jobs = {}
+    def purge(self, limit_date):
+        """Descarta las entradas vencidas y reescribe el archivo si hubo cambios."""
+        live    = _normalized_entries(self.seen_jobs, limit_date)
+        removed = len(self.seen_jobs) - len(live)
+        if removed:
+            self.seen_jobs = live
+            self.flush()
+        return removed
 
-    def save(self):
-        """Persiste el historial en disco (JSON)."""
+    def flush(self):
         try:
-            with open(HISTORY_FILE, "w", encoding="utf-8") as f:
+            with open(self.path, "w", encoding="utf-8") as f:
                 json.dump(self.seen_jobs, f, indent=4)
         except Exception as e:
             print(f"⚠️ No se pudo guardar el historial: {e}")
 
+    def __len__(self):
+        return len(self.seen_jobs)
+
+    def close(self):
+        pass
+
+
+class JournalHistoryStore:
+    """
+    Historial en archivos planos: snapshot JSON + diario de altas (JSON Lines).
+
+    - 'seen_jobs.json' es el snapshot (mismo formato que JsonHistoryStore).
+    - 'seen_jobs.journal' recibe una línea {"url", "seen_at"} por cada alta:
+      archivar cuesta O(1) en disco, sin reescribir el historial.
+
+    En memoria solo se guarda un FingerprintIndex (huella de 64 bits + días,
+    ver src/fingerprints.py): ~10 bytes por oferta en lugar de dos strings.
+    Las URLs completas quedan únicamente en disco.
+
+    Al iniciar se lee el snapshot y se reproduce el diario. Una línea truncada
+    por un corte a mitad de escritura se descarta sin afectar al resto, y un
+    snapshot ilegible se respalda (ver _backup_corrupt_file) en lugar de
+    reemplazarse en silencio por un historial vacío.
+
+    La compactación (volcar todo al snapshot y vaciar el diario) solo ocurre
+    al superar los umbrales JOURNAL_COMPACT_*, y corre en un hilo aparte: el
+    diario actual se renombra a '.compacting', las altas siguientes van a un
+    diario nuevo y el hilo combina el snapshot con el '.compacting' leyéndolos
+    de disco. Si el proceso se corta antes de terminar, el '.compacting' se
+    vuelve a reproducir en el próximo arranque.
+    """
+
+    def __init__(self, path=HISTORY_FILE, journal_path=HISTORY_JOURNAL_FILE):
+        self.path            = path
+        self.journal_path    = journal_path
+        self.compacting_path = f"{journal_path}.compacting"
+        self.index           = FingerprintIndex()
+        self._journal        = None
+        self._journal_lines  = 0
+        self._last_fsync     = 0.0
+        self._unsynced       = False
+        self._compactor      = None
+
+    def load(self, limit_date):
+        """Lee el snapshot, reproduce el diario, purga lo vencido y compacta si corresponde."""
+        data          = self._read_snapshot()
+        snapshot_size = len(data)
+        replayed      = 0
+        for journal in (self.compacting_path, self.journal_path):
+            replayed += self._replay(journal, data)
+
+        entries             = _normalized_entries(data, limit_date)
+        self.index          = FingerprintIndex(
+            (url_fingerprint(url), datetime.fromisoformat(date_str)) for url, date_str in entries.items()
+        )
+        self._journal_lines = replayed
+        expired             = len(data) - len(entries)
+
+        if self._needs_compaction(snapshot_size, extra=expired) or os.path.exists(self.compacting_path):
+            _write_snapshot(self.path, entries)
+            for journal in (self.compacting_path, self.journal_path):
+                if os.path.exists(journal):
+                    os.remove(journal)
+            self._journal_lines = 0
+        self._open_journal()
+
+    def _read_snapshot(self):
+        """Snapshot {url: fecha} desde disco ({} si no existe o está dañado)."""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"⚠️ Error cargando el snapshot del historial: {e}.")
+            _backup_corrupt_file(self.path)
+            return {}
+
+    @staticmethod
+    def _replay(journal_path, data):
+        """Aplica las líneas de un diario sobre `data`. Retorna la cantidad aplicada."""
+        if not os.path.exists(journal_path):
+            return 0
+
+        applied = 0
+        with open(journal_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    url, seen_at = entry["url"], entry["seen_at"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    print(f"⚠️ Línea {line_number} de {journal_path} ilegible (escritura interrumpida). Se omite.")
+                    continue
+                try:
+                    if url not in data or datetime.fromisoformat(data[url]) < datetime.fromisoformat(seen_at):
+                        data[url] = seen_at
+                except (TypeError, ValueError):
+                    data[url] = seen_at
+                applied += 1
+        return applied
+
+    def _needs_compaction(self, snapshot_size=None, extra=0):
+        if snapshot_size is None:
+            snapshot_size = len(self.index)
+        try:
+            journal_bytes = os.path.getsize(self.journal_path)
+        except OSError:
+            journal_bytes = 0
+        return (
+            journal_bytes > JOURNAL_COMPACT_BYTES
+            or self._journal_lines + extra > max(JOURNAL_COMPACT_MIN_LINES, snapshot_size * JOURNAL_COMPACT_RATIO)
+        )
+
+    def _open_journal(self):
+        # Si la última línea quedó truncada, la próxima alta empieza en una línea nueva.
+        truncated = False
+        if os.path.exists(self.journal_path) and os.path.getsize(self.journal_path):
+            with open(self.journal_path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                truncated = f.read(1) != b"\n"
+        self._journal = open(self.journal_path, "a", encoding="utf-8")
+        if truncated:
+            self._journal.write("\n")
+
+    def contains(self, clean_url):
+        return url_fingerprint(clean_url) in self.index
+
+    def fingerprints(self):
+        return iter(self.index)
+
+    def add(self, clean_url, seen_at):
+        self.index.add(url_fingerprint(clean_url), seen_at)
+        try:
+            self._journal.write(json.dumps({"url": clean_url, "seen_at": seen_at.isoformat()}) + "\n")
+            self._journal.flush()
+            self._journal_lines += 1
+            self._unsynced       = True
+            if time.monotonic() - self._last_fsync >= JOURNAL_FSYNC_SECONDS:
+                self._fsync()
+        except Exception as e:
+            print(f"⚠️ No se pudo guardar el historial: {e}")
+            return
+
+        if self._needs_compaction():
+            self._start_compaction()
+
+    def purge(self, limit_date):
+        """Descarta de memoria lo vencido; en disco se elimina en la próxima compactación."""
+        return self.index.purge(limit_date)
+
+    def _fsync(self):
+        os.fsync(self._journal.fileno())
+        self._last_fsync = time.monotonic()
+        self._unsynced   = False
+
+    def _start_compaction(self):
+        """Rota el diario y combina snapshot + diario rotado en segundo plano."""
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        if os.path.exists(self.compacting_path):
+            return  # Quedó una compactación anterior sin terminar
+
+        self._fsync()
+        self._journal.close()
+        os.replace(self.journal_path, self.compacting_path)
+        self._open_journal()
+        self._journal_lines = 0
+
+        limit_date = datetime.now() - timedelta(days=DAYS_TO_REMEMBER)
+
+        def compact():
+            try:
+                data = self._read_snapshot()
+                self._replay(self.compacting_path, data)
+                _write_snapshot(self.path, _normalized_entries(data, limit_date))
+                os.remove(self.compacting_path)
+            except Exception as e:
+                print(f"⚠️ No se pudo compactar el historial: {e}")
+
+        self._compactor = threading.Thread(target=compact, name="history-compactor", daemon=True)
+        self._compactor.start()
+
+    def flush(self):
+        """Sincroniza a disco las altas pendientes del diario."""
+        if self._journal is not None and self._unsynced:
+            self._fsync()
+
+    def __len__(self):
+        return len(self.index)
+
+    def close(self):
+        self.flush()
+        if self._compactor is not None:
+            self._compactor.join()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+
+class SqliteHistoryStore:
+    """
+    Historial en una base SQLite ('seen_jobs.db') en modo WAL.
+
+    Cada oferta es una fila (clave canónica, fecha, vencimiento):
+    - Consultar es una búsqueda por clave primaria (índice sobre la clave).
+    - Archivar es un único upsert de una fila, sin reescribir el resto.
+    - La purga de DAYS_TO_REMEMBER días es un único DELETE sobre el índice
+      de la columna de vencimiento.
+
+    Si existe un 'seen_jobs.json' de versiones anteriores, se importa la
+    primera vez y se renombra a 'seen_jobs.json.migrated' como respaldo.
+
+    La tabla `meta` guarda la versión de las reglas de canonicalización con
+    que se calcularon las claves (ver rules_version); si las reglas cambian,
+    las claves se recalculan al cargar.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS seen_jobs ("
+        "  url        TEXT PRIMARY KEY,"
+        "  seen_at    TEXT NOT NULL,"
+        "  expires_at REAL NOT NULL"
+        ") WITHOUT ROWID",
+        "CREATE INDEX IF NOT EXISTS idx_seen_jobs_expires_at ON seen_jobs (expires_at)",
+        "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    )
+
+    UPSERT = (
+        "INSERT INTO seen_jobs (url, seen_at, expires_at) VALUES (?, ?, ?) "
+        "ON CONFLICT (url) DO UPDATE SET "
+        "  seen_at    = excluded.seen_at,"
+        "  expires_at = excluded.expires_at "
+        "WHERE excluded.expires_at > seen_jobs.expires_at"
+    )
+
+    def __init__(self, path=HISTORY_DB_FILE, json_path=HISTORY_FILE):
+        self.path      = path
+        self.json_path = json_path
+        self._conn     = None
+
+    @property
+    def conn(self):
+        """
+        Conexión a la base, abierta (y creada si no existe) en el primer uso.
+
+        Así importar el módulo no crea 'seen_jobs.db'. La conexión se comparte
+        entre hilos; JobHistory serializa el acceso.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in self.SCHEMA:
+                conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _expires_at(seen_at):
+        return seen_at.timestamp() + DAYS_TO_REMEMBER * 86400
+
+    def load(self, limit_date):
+        """Importa el JSON heredado (si existe) y purga las entradas vencidas."""
+        if os.path.exists(self.json_path):
+            self.migrate_json(limit_date)
+        self.rekey(limit_date)
+        deleted = self.purge(limit_date)
+        if deleted:
+            print(f"🧹 Historial: {deleted} ofertas vencidas purgadas.")
+
+    def purge(self, limit_date):
+        """Elimina las entradas vencidas con un único DELETE sobre el índice de vencimiento."""
+        return self.conn.execute(
+            "DELETE FROM seen_jobs WHERE expires_at <= ?", (self._expires_at(limit_date),)
+        ).rowcount
+
+    def migrate_json(self, limit_date):
+        """Importa 'seen_jobs.json' en una sola transacción y lo renombra."""
+        try:
+            with open(self.json_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"⚠️ No se pudo leer {self.json_path} para migrarlo: {e}")
+            return
+
+        rows = [
+            (url, date_str, self._expires_at(datetime.fromisoformat(date_str)))
+            for url, date_str in _normalized_entries(data, limit_date).items()
+        ]
+        with self.conn:
+            self.conn.execute("BEGIN")
+            self.conn.executemany(self.UPSERT, rows)
+        os.replace(self.json_path, f"{self.json_path}.migrated")
+        print(f"📦 Historial migrado a SQLite: {len(rows)} ofertas desde {self.json_path}.")
+
+    def rekey(self, limit_date):
+        """Recalcula las claves guardadas si cambiaron las reglas de canonicalización."""
+        version = rules_version()
+        row     = self.conn.execute("SELECT value FROM meta WHERE key = 'rules_version'").fetchone()
+        if row is not None and row[0] == version:
+            return
+
+        data = dict(self.conn.execute("SELECT url, seen_at FROM seen_jobs"))
+        rows = [
+            (url, date_str, self._expires_at(datetime.fromisoformat(date_str)))
+            for url, date_str in _normalized_entries(data, limit_date).items()
+        ]
+        with self.conn:
+            self.conn.execute("BEGIN")
+            self.conn.execute("DELETE FROM seen_jobs")
+            self.conn.executemany(self.UPSERT, rows)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('rules_version', ?)", (version,)
+            )
+        if data:
+            print(f"🔑 Historial: claves recalculadas con las reglas actuales ({len(data)} → {len(rows)} ofertas).")
+
+    def contains(self, clean_url):
+        row = self.conn.execute("SELECT 1 FROM seen_jobs WHERE url = ?", (clean_url,)).fetchone()
+        return row is not None
+
+    def fingerprints(self):
+        return (url_fingerprint(url) for (url,) in self.conn.execute("SELECT url FROM seen_jobs"))
+
+    def add(self, clean_url, seen_at):
+        try:
+            self.conn.execute(self.UPSERT, (clean_url, seen_at.isoformat(), self._expires_at(seen_at)))
+        except sqlite3.Error as e:
+            print(f"⚠️ No se pudo guardar el historial: {e}")
+
+    def flush(self):
+        pass  # Cada alta se confirma en su propia transacción (autocommit).
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM seen_jobs").fetchone()[0]
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def create_history_store():
+    """Crea el almacenamiento configurado en HISTORY_BACKEND ("sqlite", "journal" o "json")."""
+    from src.config import HISTORY_BACKEND
+
+    if HISTORY_BACKEND == "json":
+        return JsonHistoryStore()
+    if HISTORY_BACKEND == "journal":
+        return JournalHistoryStore()
+    return SqliteHistoryStore()
+
+
+class JobHistory:
+    """
+    Gestiona la persistencia de ofertas vistas para evitar duplicados.
+
+    El historial persistente (pares URL → Fecha) vive en un almacenamiento
+    intercambiable según HISTORY_BACKEND: SQLite (por defecto, ver
+    SqliteHistoryStore), snapshot + diario de altas en archivos planos
+    (JournalHistoryStore) o el archivo JSON clásico (JsonHistoryStore).
+    Cada oferta se guarda por su clave canónica (ver canonical_key en
+    src/canonical.py): el id nativo del portal cuando las reglas del sitio lo
+    permiten, o la URL normalizada. Así la misma oferta coincide aunque se
+    llegue a ella con parámetros de sesión distintos.
+
+    El historial se carga recién en el primer uso: las reglas de cada sitio se
+    registran al importar su módulo, y las claves guardadas deben recalcularse
+    con todas ellas.
+
+    Además del historial persistente, mantiene en memoria (`session_seen`) las
+    huellas de 64 bits de las URLs notificadas, agrupadas por ciclo (ver
+    SessionSet en src/fingerprints.py). `new_cycle()` descarta los ciclos que
+    superan HISTORY_SESSION_GENERATIONS, de modo que una oferta no se notifica
+    más de una vez por ciclo y la memoria no crece aunque el bot corra semanas.
+
+    Al iniciar y al comenzar cada ciclo, purga los registros con más de
+    DAYS_TO_REMEMBER días para evitar que el historial crezca indefinidamente.
+    Con HISTORY_BLOOM_FILTER, un filtro de Bloom responde sin consultar el
+    almacenamiento para las URLs que seguro no están archivadas.
+
+    Es seguro usarla desde varios hilos (ejecución paralela de sitios): todas
+    las lecturas-escrituras pasan por un único lock, de modo que el
+    almacenamiento tiene un solo escritor a la vez y `claim` es atómico.
+    """
+
+    # Resultados posibles de `claim`
+    NEW        = "new"
+    ARCHIVED   = "archived"
+    IN_SESSION = "session"
+
+    def __init__(self, store=None):
+        from src.config import HISTORY_BLOOM_FILTER, HISTORY_SESSION_GENERATIONS
+
+        self.store        = store if store is not None else create_history_store()
+        self.session_seen = SessionSet(HISTORY_SESSION_GENERATIONS)  # Huellas notificadas (no persiste)
+        self.use_bloom    = HISTORY_BLOOM_FILTER
+        self._bloom       = None
+        self._loaded      = False
+        self._lock        = threading.RLock()
+
+    @staticmethod
+    def _limit_date():
+        return datetime.now() - timedelta(days=DAYS_TO_REMEMBER)
+
+    def load(self):
+        """Carga el historial desde disco y purga las entradas expiradas."""
+        with self._lock:
+            self.store.load(self._limit_date())
+            self._rebuild_bloom()
+            self._loaded = True
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self.load()
+
+    def _rebuild_bloom(self):
+        if not self.use_bloom:
+            return
+        self._bloom = BloomFilter(max(2 * len(self.store), 1000))
+        for fingerprint in self.store.fingerprints():
+            self._bloom.add(fingerprint)
+
+    def _archived(self, clean_url, fingerprint):
+        if self._bloom is not None and fingerprint not in self._bloom:
+            return False
+        return self.store.contains(clean_url)
+
+    def new_cycle(self):
+        """
+        Comienza un ciclo de búsqueda: abre una generación nueva de
+        `session_seen` y purga del historial las entradas vencidas.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            self.session_seen.new_cycle()
+            if self.store.purge(self._limit_date()):
+                self._rebuild_bloom()
+
+    def save(self):
+        """Persiste los cambios pendientes (en SQLite cada alta ya queda guardada)."""
+        with self._lock:
+            self._ensure_loaded()
+            self.store.flush()
+
     def is_seen(self, url):
         """
         Verifica si una URL ya fue vista, consultando tanto el historial
         persistente como el cache de sesión actual.
         """
-        clean = normalize_url(url)
-        return clean in self.seen_jobs or clean in self.session_seen
+        clean       = canonical_key(url)
+        fingerprint = url_fingerprint(clean)
+        with self._lock:
+            self._ensure_loaded()
+            return fingerprint in self.session_seen or self._archived(clean, fingerprint)
+
+    def is_archived(self, url):
+        """Verifica si una URL está en el historial persistente (ignora la sesión)."""
+        clean = canonical_key(url)
+        with self._lock:
+            self._ensure_loaded()
+            return self._archived(clean, url_fingerprint(clean))
 
     def mark_notified(self, url):
         """
@@ -173,13 +602,46 @@ class JobHistory:
         Impide que la misma oferta se notifique más de una vez por ciclo aunque
         aparezca en varias páginas de resultados. El registro se pierde al reiniciar.
         """
-        self.session_seen.add(normalize_url(url))
+        fingerprint = url_fingerprint(canonical_key(url))
+        with self._lock:
+            self.session_seen.add(fingerprint)
+
+    def claim(self, url):
+        """
+        Verifica y registra una URL en la sesión en un solo paso atómico.
+
+        Dos sitios procesados en paralelo pueden encontrar la misma oferta al
+        mismo tiempo: solo el primero obtiene NEW y la notifica.
+
+        Returns:
+            str: NEW si la URL no había sido vista (y queda registrada en la
+                 sesión), ARCHIVED si está en el historial, IN_SESSION si ya
+                 se notificó en este ciclo.
+        """
+        clean       = canonical_key(url)
+        fingerprint = url_fingerprint(clean)
+        with self._lock:
+            self._ensure_loaded()
+            if self._archived(clean, fingerprint):
+                return self.ARCHIVED
+            if fingerprint in self.session_seen:
+                return self.IN_SESSION
+            self.session_seen.add(fingerprint)
+            return self.NEW
 
     def add_job(self, url):
-        """Registra una URL en el historial permanente con la fecha actual y persiste el cambio."""
-        clean_url = normalize_url(url)
-        self.seen_jobs[clean_url] = datetime.now().isoformat()
-        self.save()
+        """Registra una URL en el historial permanente con la fecha actual."""
+        clean_url = canonical_key(url)
+        with self._lock:
+            self._ensure_loaded()
+            self.store.add(clean_url, datetime.now())
+            if self._bloom is not None:
+                self._bloom.add(url_fingerprint(clean_url))
+
+    def close(self):
+        """Cierra el almacenamiento (al detener el bot)."""
+        with self._lock:
+            self.store.close()
 
 
 # Instancia global compartida por todos los módulos del proyecto
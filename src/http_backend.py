@@ -0,0 +1,421 @@
+"""
+Backend HTTP para portales que renderizan sus listados del lado del servidor.
+
+Algunos sitios (EmpleosIT, EducaciónIT, Vicente López) entregan el HTML
+completo de cada página sin necesidad de JavaScript. Para ellos no hace falta
+levantar Chrome: alcanza con descargar la página con `requests` y leer las
+tarjetas con el parser HTML de la librería estándar.
+
+Componentes:
+- `get_session()`: sesión HTTP compartida con pool de conexiones (keep-alive).
+- `CookieBridge`: sesión HTTP propia de un bot con las cookies y el
+  User-Agent del navegador, para descargar detalles que requieren sesión.
+- `parse_html()`: construye un árbol liviano de nodos (`HTMLNode`).
+- `HTMLNode.select()`: selectores CSS simples ('article h2 a', 'div.item.row',
+  "[data-id='x']", 'span.tag:not(.hide)').
+- `extract_records()`: aplica una especificación declarativa de listado
+  (selector de tarjeta + selectores de campos) y retorna diccionarios planos.
+
+Formato de la especificación de listado (LISTING_SPEC en cada bot):
+
+    {
+        "card": "article",                          # Selector de cada tarjeta
+        "fields": {
+            "title":   ("h2 a", "text"),            # Texto visible del elemento
+            "url":     ("h2 a", "href"),            # Atributo (href se resuelve a URL absoluta)
+            "applied": ("span.postulated", "exists"),  # True si el elemento existe
+        },
+    }
+
+Un selector de campo vacío ("") se refiere a la tarjeta misma.
+
+La misma especificación se usa con el navegador: BaseBot.extract_listing la
+aplica sobre el DOM con un único script inyectado.
+"""
+import re
+import threading
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.config import USER_AGENT
+
+
+# Elementos HTML que no tienen etiqueta de cierre.
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+
+# Elementos cuyo contenido nunca es texto visible.
+HIDDEN_ELEMENTS = {"script", "style", "noscript", "template", "head"}
+
+# Elementos de bloque: al extraer texto visible generan un salto de renglón.
+BLOCK_ELEMENTS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4",
+    "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section",
+    "table", "tr", "td", "th", "ul",
+}
+
+REQUEST_TIMEOUT = 20
+
+_session      = None
+_session_lock = threading.Lock()
+
+
+def create_session():
+    """Crea una sesión HTTP con pool de conexiones y los encabezados de un navegador."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=1)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent":      USER_AGENT,
+        "Accept":          "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "es-AR,es;q=0.9,en;q=0.5",
+    })
+    return session
+
+
+def get_session():
+    """
+    Retorna la sesión HTTP compartida por todos los bots.
+
+    Reutilizar la sesión mantiene abiertas las conexiones TCP/TLS entre
+    páginas del mismo portal (keep-alive), lo que evita el handshake en
+    cada request.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+
+def fetch_html(url, timeout=REQUEST_TIMEOUT):
+    """
+    Descarga una página y retorna su HTML.
+
+    Raises:
+        requests.HTTPError: Si el servidor responde con un código de error.
+    """
+    response = get_session().get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.text
+
+
+class CookieBridge:
+    """
+    Sesión HTTP que replica la identidad del navegador de un bot.
+
+    Copia las cookies y el User-Agent del driver a una sesión de requests
+    propia (con keep-alive), así las páginas de detalle que solo necesitan la
+    sesión, y no JavaScript, se descargan sin abrir pestañas. `sync()` se
+    llama después de cada navegación para tomar las cookies nuevas.
+
+    Solo `sync()` usa el driver: `fetch_html()` puede llamarse desde otros
+    hilos mientras el navegador sigue trabajando.
+
+    Args:
+        driver: WebDriver del bot.
+    """
+
+    def __init__(self, driver):
+        self.driver  = driver
+        self.session = create_session()
+        self._user_agent_synced = False
+
+    def sync(self):
+        """
+        Copia al `session` las cookies visibles para la página actual del navegador.
+
+        Returns:
+            int: Cantidad de cookies sincronizadas.
+        """
+        if not self._user_agent_synced:
+            user_agent = self.driver.execute_script("return navigator.userAgent;")
+            if user_agent:
+                self.session.headers["User-Agent"] = user_agent
+            self._user_agent_synced = True
+
+        cookies = self.driver.get_cookies()
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie.get("domain"),
+                path=cookie.get("path", "/"),
+                secure=cookie.get("secure", False),
+                expires=cookie.get("expiry"),
+            )
+        return len(cookies)
+
+    def fetch_html(self, url, timeout=REQUEST_TIMEOUT):
+        """
+        Descarga una página con las cookies del navegador.
+
+        Raises:
+            requests.HTTPError: Si el servidor responde con un código de error.
+        """
+        response = self.session.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.text
+
+
+# ============================================================================
+# ÁRBOL HTML
+# ============================================================================
+
+class HTMLNode:
+    """Nodo liviano del árbol HTML: etiqueta, atributos, hijos y texto."""
+
+    __slots__ = ("tag", "attrs", "children", "parent")
+
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag      = tag
+        self.attrs    = attrs or {}
+        self.children = []  # HTMLNode o str (texto)
+        self.parent   = parent
+
+    @property
+    def classes(self):
+        return self.attrs.get("class", "").split()
+
+    def iter_elements(self):
+        """Recorre todos los elementos descendientes en orden de documento."""
+        stack = [child for child in reversed(self.children) if isinstance(child, HTMLNode)]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(child for child in reversed(node.children) if isinstance(child, HTMLNode))
+
+    def _collect_text(self, parts, block_breaks):
+        if self.tag in HIDDEN_ELEMENTS:
+            return
+        is_block = block_breaks and self.tag in BLOCK_ELEMENTS
+        if is_block:
+            parts.append("\n")
+        for child in self.children:
+            if isinstance(child, HTMLNode):
+                child._collect_text(parts, block_breaks)
+            else:
+                parts.append(child)
+        if is_block:
+            parts.append("\n")
+
+    @property
+    def text(self):
+        """Texto del nodo con los espacios colapsados (similar a WebElement.text)."""
+        parts = []
+        self._collect_text(parts, block_breaks=False)
+        return " ".join("".join(parts).split())
+
+    def visible_text(self):
+        """
+        Texto visible del nodo respetando los saltos de renglón de los
+        elementos de bloque. Útil para el filtro de idioma, que evalúa
+        la descripción renglón por renglón.
+        """
+        parts = []
+        self._collect_text(parts, block_breaks=True)
+        lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+    def get(self, attr, default=None):
+        return self.attrs.get(attr, default)
+
+    def select(self, selector):
+        """Retorna los descendientes que coinciden con un selector CSS simple."""
+        return select(self, selector)
+
+    def select_one(self, selector):
+        """Retorna el primer descendiente que coincide con el selector, o None."""
+        found = select(self, selector)
+        return found[0] if found else None
+
+    def __repr__(self):
+        return f"<HTMLNode {self.tag} {self.attrs}>"
+
+
+class _TreeBuilder(HTMLParser):
+    """Convierte el HTML en un árbol de HTMLNode tolerando etiquetas sin cerrar."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root    = HTMLNode("#document")
+        self.current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        node = HTMLNode(tag, {name: value or "" for name, value in attrs}, self.current)
+        self.current.children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self.current = node
+
+    def handle_startendtag(self, tag, attrs):
+        node = HTMLNode(tag, {name: value or "" for name, value in attrs}, self.current)
+        self.current.children.append(node)
+
+    def handle_endtag(self, tag):
+        # Subimos hasta la etiqueta abierta correspondiente; si no existe,
+        # ignoramos el cierre (HTML mal formado).
+        node = self.current
+        while node is not None and node.tag != tag:
+            node = node.parent
+        if node is not None and node.parent is not None:
+            self.current = node.parent
+
+    def handle_data(self, data):
+        self.current.children.append(data)
+
+
+def parse_html(html):
+    """
+    Parsea un documento HTML.
+
+    Returns:
+        HTMLNode: Nodo raíz ('#document').
+    """
+    builder = _TreeBuilder()
+    builder.feed(html or "")
+    builder.close()
+    return builder.root
+
+
+# ============================================================================
+# SELECTORES CSS SIMPLES
+# ============================================================================
+
+_COMPOUND_TOKEN = re.compile(
+    r"(?P<tag>^[a-zA-Z][\w-]*|^\*)"
+    r"|\.(?P<cls>[\w-]+)"
+    r"|#(?P<id>[\w-]+)"
+    r"|:not\(\.(?P<not_cls>[\w-]+)\)"
+    r"|\[(?P<attr>[\w-]+)(?:(?P<op>[*^$]?=)['\"]?(?P<value>[^'\"\]]*)['\"]?)?\]"
+)
+
+
+def _parse_compound(compound):
+    """Convierte 'div.item.row:not(.hide)' en una lista de condiciones."""
+    conditions = []
+    position   = 0
+    while position < len(compound):
+        token = _COMPOUND_TOKEN.match(compound, position)
+        if not token or token.end() == position:
+            raise ValueError(f"Selector no soportado: '{compound}'")
+        conditions.append(token.groupdict())
+        position = token.end()
+    return conditions
+
+
+def _matches(node, conditions):
+    for condition in conditions:
+        if condition["tag"] and condition["tag"] != "*" and node.tag != condition["tag"].lower():
+            return False
+        if condition["cls"] and condition["cls"] not in node.classes:
+            return False
+        if condition["id"] and node.attrs.get("id") != condition["id"]:
+            return False
+        if condition["not_cls"] and condition["not_cls"] in node.classes:
+            return False
+        if condition["attr"]:
+            if condition["attr"] not in node.attrs:
+                return False
+            actual, expected, op = node.attrs[condition["attr"]], condition["value"], condition["op"]
+            if op == "=" and actual != expected:
+                return False
+            if op == "*=" and expected not in actual:
+                return False
+            if op == "^=" and not actual.startswith(expected):
+                return False
+            if op == "$=" and not actual.endswith(expected):
+                return False
+    return True
+
+
+def _has_ancestor_chain(node, chain, scope):
+    """Verifica que los selectores de `chain` coincidan con ancestros de `node` (dentro de `scope`)."""
+    ancestor = node.parent
+    for conditions in reversed(chain):
+        while ancestor is not None and ancestor is not scope and not _matches(ancestor, conditions):
+            ancestor = ancestor.parent
+        if ancestor is None or ancestor is scope:
+            return False
+        ancestor = ancestor.parent
+    return True
+
+
+def select(scope, selector):
+    """
+    Busca elementos descendientes de `scope` con un selector CSS simple.
+
+    Soporta: etiqueta, .clase, #id, :not(.clase), [attr], [attr='v'],
+    [attr*='v'], [attr^='v'], [attr$='v'], combinador descendiente (espacio)
+    y grupos separados por coma. Los resultados se retornan en orden de
+    documento y sin duplicados.
+    """
+    groups = []
+    for group in selector.split(","):
+        chain = [_parse_compound(part) for part in group.split()]
+        if chain:
+            groups.append(chain)
+
+    results = []
+    for node in scope.iter_elements():
+        for chain in groups:
+            if _matches(node, chain[-1]) and _has_ancestor_chain(node, chain[:-1], scope):
+                results.append(node)
+                break
+    return results
+
+
+# ============================================================================
+# EXTRACCIÓN DECLARATIVA DE LISTADOS
+# ============================================================================
+
+def read_field(card, selector, attribute, base_url=None):
+    """
+    Lee un campo de una tarjeta según la especificación (selector, atributo).
+
+    Returns:
+        str | bool | None: Texto, valor del atributo, o bool para "exists".
+    """
+    if attribute == "exists":
+        return bool(card.select(selector)) if selector else True
+
+    node = card.select_one(selector) if selector else card
+    if node is None:
+        return None
+    if attribute == "text":
+        return node.text
+    value = node.get(attribute)
+    if value and attribute in ("href", "src") and base_url:
+        value = urljoin(base_url, value)
+    return value
+
+
+def extract_records(root, spec, base_url=None):
+    """
+    Aplica una especificación de listado sobre un documento parseado.
+
+    Args:
+        root (HTMLNode): Documento parseado con `parse_html`.
+        spec (dict): Especificación con las claves 'card' y 'fields'.
+        base_url (str): URL de la página, para resolver enlaces relativos.
+
+    Returns:
+        list[dict]: Un diccionario por tarjeta con los campos pedidos.
+    """
+    records = []
+    for card in root.select(spec["card"]):
+        records.append({
+            name: read_field(card, selector, attribute, base_url)
+            for name, (selector, attribute) in spec["fields"].items()
+        })
+    return records
+
+
+def fetch_records(url, spec):
+    """Descarga una página de listado y retorna sus tarjetas como diccionarios."""
+    return extract_records(parse_html(fetch_html(url)), spec, base_url=url)
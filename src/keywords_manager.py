@@ -1,5 +1,6 @@
 import json
 import os
+import threading
 
 
 KEYWORDS_FILE = "keywords.json"
@@ -70,63 +71,184 @@ DEFAULT_NEGATIVE_KEYWORDS = [
     "business", "webflow",
 ]
 
-DEFAULT_LANGUAGE_KEYWORDS = [
+# Frases por defecto agrupadas por idioma. El agrupamiento permite informar
+# qué idioma se detectó (ver src/language_filter.py).
+DEFAULT_LANGUAGE_KEYWORD_GROUPS = {
     # Inglés
-    "we are looking for", "we are seeking", "you will be", "you will have",
-    "you will work", "you will join", "must have", "nice to have",
-    "about the role", "about the job", "about the company", "about us",
-    "what you'll do", "what you will do", "what we offer", "what we're looking",
-    "who you are", "our team", "our company", "join our",
-    "key responsibilities", "responsibilities", "requirements", "qualifications",
-    "preferred qualifications", "the ideal candidate", "strong knowledge of",
-    "experience with", "experience in", "proficiency in", "familiarity with",
-    "ability to", "we offer", "we provide", "as part of", "as a member",
-    "you'll work", "you'll be", "this role", "this position", "remote work", "work from home",
-    "we believe", "equal opportunity",
+    "en": [
+        "we are looking for", "we are seeking", "you will be", "you will have",
+        "you will work", "you will join", "must have", "nice to have",
+        "about the role", "about the job", "about the company", "about us",
+        "what you'll do", "what you will do", "what we offer", "what we're looking",
+        "who you are", "our team", "our company", "join our",
+        "key responsibilities", "responsibilities", "requirements", "qualifications",
+        "preferred qualifications", "the ideal candidate", "strong knowledge of",
+        "experience with", "experience in", "proficiency in", "familiarity with",
+        "ability to", "we offer", "we provide", "as part of", "as a member",
+        "you'll work", "you'll be", "this role", "this position", "remote work", "work from home",
+        "we believe", "equal opportunity",
+    ],
     # Portugués
-    "estamos à procura", "você irá", "você vai", "você será",
-    "você terá", "você deve", "deve ter",
-    "desejável", "conhecimento em", "experiência com", "experiência em",
-    "nossa empresa", "nossa equipe", "faça parte", "venha fazer",
-    "sobre a vaga", "sobre a empresa",
+    "pt": [
+        "estamos à procura", "você irá", "você vai", "você será",
+        "você terá", "você deve", "deve ter",
+        "desejável", "conhecimento em", "experiência com", "experiência em",
+        "nossa empresa", "nossa equipe", "faça parte", "venha fazer",
+        "sobre a vaga", "sobre a empresa",
+    ],
     # Italiano
-    "stiamo cercando", "cerchiamo", "si offre", "si richiede", "requisiti",
-    "la risorsa", "il candidato", "inserimento",
-    "esperienza in", "esperienza con", "conoscenza di", "ottima conoscenza",
-    "buona conoscenza", "si occuperà", "azienda leader", "offriamo", "chi siamo", "cosa farai",
+    "it": [
+        "stiamo cercando", "cerchiamo", "si offre", "si richiede", "requisiti",
+        "la risorsa", "il candidato", "inserimento",
+        "esperienza in", "esperienza con", "conoscenza di", "ottima conoscenza",
+        "buona conoscenza", "si occuperà", "azienda leader", "offriamo", "chi siamo", "cosa farai",
+    ],
+}
+
+DEFAULT_LANGUAGE_KEYWORDS = [
+    phrase for phrases in DEFAULT_LANGUAGE_KEYWORD_GROUPS.values() for phrase in phrases
 ]
 
 
+def _default_keywords():
+    """Retorna una copia nueva del diccionario de palabras clave por defecto."""
+    return {
+        "search_keywords": list(DEFAULT_SEARCH_KEYWORDS),
+        "negative_keywords": list(DEFAULT_NEGATIVE_KEYWORDS),
+        "language_negative_keywords": list(DEFAULT_LANGUAGE_KEYWORDS),
+    }
+
+
+def _merge_with_defaults(defaults, user_keywords):
+    """Une las palabras por defecto con las del usuario, en minúsculas y sin duplicados."""
+    return list(set([k.lower() for k in defaults] + [k.lower() for k in user_keywords]))
+
+
+class KeywordStore:
+    """
+    Cache en memoria de keywords.json compartido por todo el proceso.
+
+    Evita abrir y parsear el archivo en cada consulta: el contenido solo se
+    vuelve a leer cuando cambia la firma del archivo en disco (mtime y tamaño),
+    por ejemplo si el usuario lo edita a mano. Las escrituras hechas a través
+    de `save` actualizan el cache directamente.
+
+    Cada vez que el contenido cambia se incrementa `version`. Los caches que
+    dependen de las palabras clave (matchers compilados, veredictos de idioma,
+    etc.) pueden comparar este número para saber cuándo reconstruirse.
+
+    Los workers de los sitios leen el store mientras el hilo principal lo
+    modifica con los comandos de Telegram: la recarga, la invalidación y el
+    cache de listas unidas se hacen bajo un mismo lock.
+    """
+
+    def __init__(self):
+        self.version    = 0
+        self._data      = None
+        self._signature = None
+        self._merged    = {}
+        self._lock      = threading.RLock()
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(KEYWORDS_FILE)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+
+    def _replace(self, keywords_data, signature):
+        self._data      = keywords_data
+        self._signature = signature
+        self._merged    = {}
+        self.version   += 1
+
+    def data(self):
+        """
+        Retorna el diccionario de palabras clave, recargándolo solo si el
+        archivo cambió en disco desde la última lectura.
+        """
+        with self._lock:
+            signature = self._file_signature()
+
+            if self._data is not None and signature == self._signature:
+                return self._data
+
+            if signature is None:
+                # El archivo no existe: lo creamos con los valores por defecto.
+                self.save(_default_keywords())
+                return self._data
+
+            try:
+                with open(KEYWORDS_FILE, "r", encoding="utf-8") as f:
+                    keywords_data = json.load(f)
+            except Exception as error:
+                print(f"⚠️ Error cargando keywords: {error}. Usando valores por defecto.")
+                keywords_data = _default_keywords()
+
+            self._replace(keywords_data, signature)
+            return self._data
+
+    def save(self, keywords_data):
+        """Persiste el diccionario en disco y actualiza el cache sin releer el archivo."""
+        with self._lock:
+            with open(KEYWORDS_FILE, "w", encoding="utf-8") as f:
+                json.dump(keywords_data, f, indent=4, ensure_ascii=False)
+            self._replace(keywords_data, self._file_signature())
+
+    def merged(self, key, defaults):
+        """
+        Retorna la unión (por defecto + usuario) para la clave indicada,
+        calculada una sola vez por versión del contenido.
+        """
+        with self._lock:
+            keywords_data = self.data()
+            if key not in self._merged:
+                self._merged[key] = _merge_with_defaults(defaults, keywords_data.get(key, []))
+            return self._merged[key]
+
+    def current_version(self):
+        """Retorna `version`, recargando antes el archivo si cambió en disco."""
+        with self._lock:
+            self.data()
+            return self.version
+
+    def update_list(self, key, edit):
+        """
+        Modifica una lista con lectura, cambio y escritura sin intercalarse.
+
+        Args:
+            key (str): Clave de la lista en keywords.json.
+            edit (callable): Recibe una copia de la lista y la modifica en el
+                lugar. Solo se escribe el archivo si la lista cambió.
+        """
+        with self._lock:
+            keywords_data = dict(self.data())
+            original      = keywords_data.get(key, [])
+            current_list  = list(original)
+            edit(current_list)
+            if current_list != original:
+                keywords_data[key] = current_list
+                self.save(keywords_data)
+
+
+# Instancia global compartida por todos los módulos del proyecto
+keyword_store = KeywordStore()
+
+
 def load_keywords():
     """
-    Carga las palabras clave desde el archivo JSON.
+    Carga las palabras clave desde el archivo JSON (vía el cache en memoria).
 
     Si el archivo no existe, lo crea con los valores por defecto.
     Si el archivo está corrupto o no es accesible, retorna los valores por defecto.
 
     Returns:
         dict: Diccionario con las claves 'search_keywords', 'negative_keywords'
-              y 'language_negative_keywords'.
+              y 'language_negative_keywords'. Es una copia: modificarlo no
+              altera el cache hasta llamar a `save_keywords`.
     """
-    if not os.path.exists(KEYWORDS_FILE):
-        default_data = {
-            "search_keywords": DEFAULT_SEARCH_KEYWORDS,
-            "negative_keywords": DEFAULT_NEGATIVE_KEYWORDS,
-            "language_negative_keywords": DEFAULT_LANGUAGE_KEYWORDS,
-        }
-        save_keywords(default_data)
-        return default_data
-
-    try:
-        with open(KEYWORDS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as error:
-        print(f"⚠️ Error cargando keywords: {error}. Usando valores por defecto.")
-        return {
-            "search_keywords": DEFAULT_SEARCH_KEYWORDS,
-            "negative_keywords": DEFAULT_NEGATIVE_KEYWORDS,
-            "language_negative_keywords": DEFAULT_LANGUAGE_KEYWORDS,
-        }
+    return {key: list(value) if isinstance(value, list) else value
+            for key, value in keyword_store.data().items()}
 
 
 def save_keywords(keywords_data):
@@ -136,30 +258,85 @@ def save_keywords(keywords_data):
     Args:
         keywords_data (dict): Diccionario con las listas de palabras clave.
     """
-    with open(KEYWORDS_FILE, "w", encoding="utf-8") as f:
-        json.dump(keywords_data, f, indent=4, ensure_ascii=False)
+    keyword_store.save(keywords_data)
+
+
+def get_keywords_version():
+    """
+    Retorna la versión actual de las palabras clave.
+
+    Es un contador que solo crece: cambia cada vez que el contenido se recarga
+    desde disco o se modifica con alguna de las funciones add_*/remove_*.
+    """
+    return keyword_store.current_version()
 
 
 def get_positive_keywords():
     """Retorna la unión de las palabras por defecto y las configuradas por el usuario en el JSON."""
-    user_keywords = load_keywords().get("search_keywords", [])
-    # Unimos ambos, normalizamos a minúsculas y eliminamos duplicados
-    combined = list(set([k.lower() for k in DEFAULT_SEARCH_KEYWORDS] + [k.lower() for k in user_keywords]))
-    return combined
+    return list(keyword_store.merged("search_keywords", DEFAULT_SEARCH_KEYWORDS))
 
 
 def get_negative_keywords():
     """Retorna la unión de las negativas por defecto y las configuradas por el usuario."""
-    user_keywords = load_keywords().get("negative_keywords", [])
-    combined = list(set([k.lower() for k in DEFAULT_NEGATIVE_KEYWORDS] + [k.lower() for k in user_keywords]))
-    return combined
+    return list(keyword_store.merged("negative_keywords", DEFAULT_NEGATIVE_KEYWORDS))
 
 
 def get_language_keywords():
     """Retorna la unión de las frases de idioma por defecto y las configuradas por el usuario."""
-    user_keywords = load_keywords().get("language_negative_keywords", [])
-    combined = list(set([k.lower() for k in DEFAULT_LANGUAGE_KEYWORDS] + [k.lower() for k in user_keywords]))
-    return combined
+    return list(keyword_store.merged("language_negative_keywords", DEFAULT_LANGUAGE_KEYWORDS))
+
+
+def add_keywords(list_key, words):
+    """
+    Agrega varias palabras a una lista con una sola escritura de keywords.json.
+
+    Args:
+        list_key (str): 'search_keywords', 'negative_keywords' o
+                        'language_negative_keywords'.
+        words (iterable[str]): Palabras a agregar (se normalizan a minúsculas).
+
+    Returns:
+        tuple[list, list]: (agregadas, las que ya existían).
+    """
+    added, skipped = [], []
+
+    def edit(current_list):
+        for word in words:
+            normalized = word.lower().strip()
+            if not normalized:
+                continue
+            if normalized in current_list:
+                skipped.append(normalized)
+            else:
+                current_list.append(normalized)
+                added.append(normalized)
+
+    keyword_store.update_list(list_key, edit)
+    return added, skipped
+
+
+def remove_keywords(list_key, words):
+    """
+    Elimina varias palabras de una lista con una sola escritura de keywords.json.
+
+    Returns:
+        tuple[list, list]: (eliminadas, las que no existían).
+    """
+    removed, skipped = [], []
+
+    def edit(current_list):
+        for word in words:
+            normalized = word.lower().strip()
+            if not normalized:
+                continue
+            if normalized in current_list:
+                current_list.remove(normalized)
+                removed.append(normalized)
+            else:
+                skipped.append(normalized)
+
+    keyword_store.update_list(list_key, edit)
+    return removed, skipped
 
 
 def add_positive_keyword(new_word):
@@ -169,16 +346,7 @@ def add_positive_keyword(new_word):
     Returns:
         bool: True si se agregó, False si ya existía.
     """
-    keywords_data = load_keywords()
-    current_list = keywords_data.get("search_keywords", [])
-    normalized = new_word.lower().strip()
-
-    if normalized not in current_list:
-        current_list.append(normalized)
-        keywords_data["search_keywords"] = current_list
-        save_keywords(keywords_data)
-        return True
-    return False
+    return bool(add_keywords("search_keywords", [new_word])[0])
 
 
 def add_negative_keyword(new_word):
@@ -188,16 +356,7 @@ def add_negative_keyword(new_word):
     Returns:
         bool: True si se agregó, False si ya existía.
     """
-    keywords_data = load_keywords()
-    current_list = keywords_data.get("negative_keywords", [])
-    normalized = new_word.lower().strip()
-
-    if normalized not in current_list:
-        current_list.append(normalized)
-        keywords_data["negative_keywords"] = current_list
-        save_keywords(keywords_data)
-        return True
-    return False
+    return bool(add_keywords("negative_keywords", [new_word])[0])
 
 
 def remove_positive_keyword(word_to_remove):
@@ -207,16 +366,7 @@ def remove_positive_keyword(word_to_remove):
     Returns:
         bool: True si se eliminó, False si no existía.
     """
-    keywords_data = load_keywords()
-    current_list = keywords_data.get("search_keywords", [])
-    normalized = word_to_remove.lower().strip()
-
-    if normalized in current_list:
-        current_list.remove(normalized)
-        keywords_data["search_keywords"] = current_list
-        save_keywords(keywords_data)
-        return True
-    return False
+    return bool(remove_keywords("search_keywords", [word_to_remove])[0])
 
 
 def remove_negative_keyword(word_to_remove):
@@ -226,16 +376,7 @@ def remove_negative_keyword(word_to_remove):
     Returns:
         bool: True si se eliminó, False si no existía.
     """
-    keywords_data = load_keywords()
-    current_list = keywords_data.get("negative_keywords", [])
-    normalized = word_to_remove.lower().strip()
-
-    if normalized in current_list:
-        current_list.remove(normalized)
-        keywords_data["negative_keywords"] = current_list
-        save_keywords(keywords_data)
-        return True
-    return False
+    return bool(remove_keywords("negative_keywords", [word_to_remove])[0])
 
 
 def add_language_keyword(new_word):
@@ -245,16 +386,7 @@ def add_language_keyword(new_word):
     Returns:
         bool: True si se agregó, False si ya existía.
     """
-    keywords_data = load_keywords()
-    current_list = keywords_data.get("language_negative_keywords", [])
-    normalized = new_word.lower().strip()
-
-    if normalized not in current_list:
-        current_list.append(normalized)
-        keywords_data["language_negative_keywords"] = current_list
-        save_keywords(keywords_data)
-        return True
-    return False
+    return bool(add_keywords("language_negative_keywords", [new_word])[0])
 
 
 def remove_language_keyword(word_to_remove):
@@ -264,13 +396,4 @@ def remove_language_keyword(word_to_remove):
     Returns:
         bool: True si se eliminó, False si no existía.
     """
-    keywords_data = load_keywords()
-    current_list = keywords_data.get("language_negative_keywords", [])
-    normalized = word_to_remove.lower().strip()
-
-    if normalized in current_list:
-        current_list.remove(normalized)
-        keywords_data["language_negative_keywords"] = current_list
-        save_keywords(keywords_data)
-        return True
-    return False
+    return bool(remove_keywords("language_negative_keywords", [word_to_remove])[0])
@@ -0,0 +1,246 @@
+"""
+Filtro de idioma para descripciones de puestos.
+
+Las descripciones se comparan contra ~100 frases características de otros
+idiomas (ver DEFAULT_LANGUAGE_KEYWORD_GROUPS en keywords_manager). Buscar cada
+frase por separado (`frase in texto`) recorre el texto completo una vez por
+frase: O(n·k) para una descripción de n caracteres y k frases.
+
+Este módulo compila todas las frases en una única expresión regular con forma
+de árbol de prefijos (trie) y recorre el texto UNA sola vez, registrando todas
+las coincidencias. Como el costo depende de la longitud del texto y no de la
+cantidad de frases, agregar frases con /addidioma no encarece el filtro.
+
+El escáner se construye una vez por versión de las palabras clave y lo
+comparten todos los bots (filtro en pestaña nueva de BaseBot y panel lateral
+de LinkedIn).
+"""
+import hashlib
+import re
+
+
+# Grupo asignado a las frases agregadas por el usuario que no pertenecen
+# a ninguno de los grupos por defecto.
+CUSTOM_GROUP = "otro"
+
+
+def _build_trie_pattern(phrases):
+    """
+    Construye una regex equivalente a la alternancia de todas las frases,
+    pero factorizando los prefijos comunes en forma de árbol (trie).
+
+    Ej: ['you will be', 'you will have'] → 'you\\ will\\ (?:be|have)'
+
+    Con una alternancia plana el motor prueba cada frase completa en cada
+    posición del texto; con el trie descarta casi todas las posiciones
+    comparando un solo carácter. Los grupos opcionales son codiciosos, por lo
+    que ante frases anidadas se prefiere la más larga.
+    """
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = True  # Marca de fin de frase
+
+    def build(node):
+        is_end   = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char != ""]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not is_end:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if is_end else group
+
+    return build(trie)
+
+
+class PhraseScan:
+    """
+    Resultado de escanear un texto en busca de frases de otros idiomas.
+
+    Atributos:
+        first_hit (str | None): Primera frase encontrada (por posición en el texto).
+        first_group (str | None): Idioma de esa frase ('en', 'pt', 'it' u 'otro').
+        counts (dict): Cantidad de coincidencias por idioma.
+    """
+
+    def __init__(self, first_hit=None, first_group=None, counts=None):
+        self.first_hit   = first_hit
+        self.first_group = first_group
+        self.counts      = counts or {}
+
+    @property
+    def blocked(self):
+        """True si se encontró al menos una frase."""
+        return self.first_hit is not None
+
+    def __repr__(self):
+        return f"PhraseScan(first_hit={self.first_hit!r}, counts={self.counts!r})"
+
+
+class PhraseScanner:
+    """
+    Busca muchas frases en un texto con una sola pasada.
+
+    Cuando varias frases empiezan en la misma posición se registra la más
+    larga (ej: 'experience with' antes que una hipotética 'experience').
+    La búsqueda es por subcadena, igual que el `in` original.
+    """
+
+    def __init__(self, phrases, groups=None):
+        """
+        Args:
+            phrases (iterable[str]): Frases a detectar.
+            groups (dict): Mapa idioma → lista de frases, usado para clasificar
+                           cada coincidencia. Las frases sin grupo van a CUSTOM_GROUP.
+        """
+        self.phrases = sorted({p.lower() for p in phrases if p and p.strip()})
+
+        self._group_of = {}
+        for group, group_phrases in (groups or {}).items():
+            for phrase in group_phrases:
+                self._group_of.setdefault(phrase.lower(), group)
+
+        self._regex = re.compile(_build_trie_pattern(self.phrases)) if self.phrases else None
+
+    def group_of(self, phrase):
+        """Retorna el idioma al que pertenece una frase."""
+        return self._group_of.get(phrase, CUSTOM_GROUP)
+
+    def scan(self, text):
+        """
+        Recorre el texto una vez y acumula las coincidencias por idioma.
+
+        Args:
+            text (str): Texto de la descripción (se normaliza a minúsculas).
+
+        Returns:
+            PhraseScan: Primera frase encontrada y conteo por idioma.
+        """
+        if not text or self._regex is None:
+            return PhraseScan()
+
+        first_hit = None
+        counts    = {}
+
+        for found in self._regex.finditer(text.lower()):
+            phrase = found.group(0)
+            group  = self.group_of(phrase)
+            counts[group] = counts.get(group, 0) + 1
+            if first_hit is None:
+                first_hit = phrase
+
+        if first_hit is None:
+            return PhraseScan()
+        return PhraseScan(first_hit, self.group_of(first_hit), counts)
+
+
+_phrase_scanner = (None, None)  # (versión de keywords, PhraseScanner)
+
+
+def get_phrase_scanner():
+    """
+    Retorna el PhraseScanner de las frases de idioma configuradas.
+
+    Se reconstruye únicamente cuando cambia la versión del KeywordStore
+    (por ejemplo, tras un /addidioma desde Telegram).
+    """
+    global _phrase_scanner
+    from src.keywords_manager import (
+        DEFAULT_LANGUAGE_KEYWORD_GROUPS, get_keywords_version, get_language_keywords,
+    )
+
+    version = get_keywords_version()
+    cached_version, scanner = _phrase_scanner
+    if scanner is None or cached_version != version:
+        scanner = PhraseScanner(get_language_keywords(), DEFAULT_LANGUAGE_KEYWORD_GROUPS)
+        _phrase_scanner = (version, scanner)
+    return scanner
+
+
+def scan_description(text):
+    """
+    Escanea una descripción con las frases de idioma configuradas.
+
+    Args:
+        text (str): Texto completo de la descripción o del body de la página.
+
+    Returns:
+        PhraseScan: Resultado del escaneo (`blocked`, `first_hit`, `counts`).
+    """
+    return get_phrase_scanner().scan(text)
+
+
+def check_description_language(text):
+    """
+    Decide si una descripción debe descartarse por estar en otro idioma.
+
+    Aplica el método configurado en LANGUAGE_FILTER_MODE:
+    - "phrases": escaneo de frases (ver `scan_description`).
+    - "ngram": identificación estadística (ver src/language_id.py), descartando
+      cuando la proporción de texto en otro idioma supera LANGUAGE_ID_MIN_CONFIDENCE.
+
+    Args:
+        text (str): Texto de la descripción.
+
+    Returns:
+        tuple: (True, 'motivo') si la descripción está en otro idioma,
+               (False, None) si pasa el filtro.
+    """
+    from src.config import LANGUAGE_FILTER_MODE, LANGUAGE_ID_MIN_CONFIDENCE
+
+    if LANGUAGE_FILTER_MODE == "ngram":
+        from src.language_id import get_language_identifier
+
+        guess = get_language_identifier().identify(text)
+        print(f"      🌐 Idioma estimado: {guess}")
+        if guess.language and guess.foreign_share >= LANGUAGE_ID_MIN_CONFIDENCE:
+            return True, f"{guess.language} ({guess.foreign_share:.0%} del texto)"
+        return False, None
+
+    scan = scan_description(text)
+    if scan.blocked:
+        print(f"      🌐 Frases detectadas por idioma: {scan.counts}")
+        return True, scan.first_hit
+    return False, None
+
+
+def language_filter_enabled():
+    """Retorna False si el modo de frases no tiene ninguna frase configurada."""
+    from src.config import LANGUAGE_FILTER_MODE
+
+    return LANGUAGE_FILTER_MODE == "ngram" or bool(get_phrase_scanner().phrases)
+
+
+_filter_fingerprint = (None, None)  # (versión de keywords, huella)
+
+
+def language_filter_fingerprint():
+    """
+    Huella estable de la configuración del filtro de idioma.
+
+    Cambia cuando cambian el modo, las frases (modo "phrases") o el umbral
+    (modo "ngram"). A diferencia de `get_keywords_version`, que es un contador
+    en memoria, la huella es la misma entre ejecuciones: la usa el cache de
+    veredictos (src/verdict_cache.py) para saber si un veredicto guardado en
+    disco sigue siendo válido.
+
+    Returns:
+        str: Hash hexadecimal corto.
+    """
+    global _filter_fingerprint
+    from src.config import LANGUAGE_FILTER_MODE, LANGUAGE_ID_MIN_CONFIDENCE
+    from src.keywords_manager import get_keywords_version
+
+    version = get_keywords_version()
+    cached_version, fingerprint = _filter_fingerprint
+    if fingerprint is None or cached_version != version:
+        if LANGUAGE_FILTER_MODE == "ngram":
+            settings = f"ngram:{LANGUAGE_ID_MIN_CONFIDENCE}"
+        else:
+            settings = "phrases:" + "\n".join(sorted(get_phrase_scanner().phrases))
+        fingerprint = hashlib.sha1(settings.encode("utf-8")).hexdigest()[:16]
+        _filter_fingerprint = (version, fingerprint)
+    return fingerprint
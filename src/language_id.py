@@ -0,0 +1,258 @@
+"""
+Identificación estadística de idioma por n-gramas de caracteres (sin red).
+
+Alternativa al filtro por frases (src/language_filter.py): en lugar de buscar
+frases sueltas, compara la distribución de trigramas de caracteres del texto
+con perfiles de referencia de cada idioma. Así una oferta en español que cita
+un encabezado en inglés ("Requirements") no se descarta, y no hace falta
+agregar frases a mano con /addidioma.
+
+Los perfiles se calculan una única vez (la primera vez que se usan) a partir
+de los textos de muestra incluidos en este módulo, por lo que no dependen de
+archivos externos ni de conexión a internet.
+
+El texto se evalúa por renglones: los renglones cortos (menús, botones,
+encabezados sueltos) se ignoran y el resultado es la proporción de texto que
+pertenece a cada idioma. Esto evita que la interfaz del portal (en español)
+oculte una descripción en inglés, y viceversa.
+"""
+import math
+import re
+
+
+# Textos de muestra usados para construir el perfil de cada idioma.
+# Son avisos de empleo típicos: el vocabulario es el mismo que luego se evalúa.
+SAMPLE_TEXTS = {
+    "es": (
+        "Buscamos un desarrollador para sumarse a nuestro equipo de tecnología. "
+        "Serás responsable de desarrollar y mantener aplicaciones web, colaborar con "
+        "el equipo de producto y participar en la definición de nuevas funcionalidades. "
+        "Requisitos: experiencia de al menos dos años en desarrollo de software, "
+        "conocimientos de bases de datos, manejo de herramientas de control de versiones. "
+        "Se valorará experiencia en metodologías ágiles y trabajo en equipo. "
+        "Ofrecemos modalidad de trabajo híbrida, capacitaciones, obra social para el "
+        "grupo familiar, día de cumpleaños libre y excelente clima laboral. "
+        "Nos encontramos en la búsqueda de un analista administrativo para el área de "
+        "cobranzas. Sus principales tareas serán la gestión de pagos a proveedores, la "
+        "conciliación de cuentas y la atención de consultas de clientes. "
+        "Es requisito contar con estudios universitarios en curso o finalizados, "
+        "disponibilidad para trabajar de lunes a viernes y residir en la zona. "
+        "La empresa es líder en su rubro y brinda oportunidades de crecimiento. "
+        "Si te interesa formar parte de una compañía en expansión, postulate y "
+        "contanos por qué sos la persona indicada para el puesto. "
+        "Horario de nueve a dieciocho horas, con posibilidad de trabajo remoto "
+        "dos días por semana. Beneficios: prepaga, bono anual, descuentos y "
+        "acceso a plataformas de aprendizaje. Valoramos la proactividad, la "
+        "comunicación y las ganas de aprender."
+    ),
+    "en": (
+        "We are looking for a software developer to join our technology team. "
+        "You will be responsible for building and maintaining web applications, "
+        "working closely with the product team and helping shape new features. "
+        "Requirements: at least two years of experience in software development, "
+        "knowledge of databases and version control tools. Experience with agile "
+        "methodologies and teamwork is a plus. We offer a hybrid work model, "
+        "training, health insurance for your family, your birthday off and a great "
+        "working environment. We are seeking an administrative analyst for our "
+        "collections department. Your main tasks will be managing supplier payments, "
+        "reconciling accounts and answering customer inquiries. You should have a "
+        "university degree in progress or completed, be available to work Monday "
+        "through Friday and live nearby. The company is a leader in its industry and "
+        "provides growth opportunities. If you are interested in being part of a "
+        "growing company, apply and tell us why you are the right person for the "
+        "role. Working hours are from nine to six, with the possibility of working "
+        "remotely two days a week. Benefits include health coverage, an annual bonus, "
+        "discounts and access to learning platforms. We value proactivity, "
+        "communication and the desire to learn. Nice to have: strong knowledge of "
+        "cloud services and the ability to work with stakeholders."
+    ),
+    "pt": (
+        "Estamos à procura de um desenvolvedor para fazer parte da nossa equipe de "
+        "tecnologia. Você será responsável por desenvolver e manter aplicações web, "
+        "colaborar com o time de produto e participar da definição de novas "
+        "funcionalidades. Requisitos: experiência de pelo menos dois anos em "
+        "desenvolvimento de software, conhecimento em bancos de dados e ferramentas "
+        "de controle de versão. Será um diferencial experiência com metodologias "
+        "ágeis e trabalho em equipe. Oferecemos modelo de trabalho híbrido, "
+        "treinamentos, plano de saúde para a família, folga no aniversário e um "
+        "ótimo ambiente de trabalho. Buscamos um analista administrativo para a área "
+        "de cobrança. Suas principais atividades serão a gestão de pagamentos a "
+        "fornecedores, a conciliação de contas e o atendimento a clientes. É "
+        "necessário ter ensino superior em andamento ou completo, disponibilidade "
+        "para trabalhar de segunda a sexta-feira e morar na região. A empresa é "
+        "líder no seu segmento e oferece oportunidades de crescimento. Se você tem "
+        "interesse em fazer parte de uma empresa em expansão, candidate-se e conte "
+        "por que você é a pessoa certa para a vaga. Horário das nove às dezoito "
+        "horas, com possibilidade de trabalho remoto dois dias por semana. "
+        "Benefícios: vale-refeição, bônus anual, descontos e acesso a plataformas "
+        "de aprendizagem. Valorizamos a proatividade, a comunicação e a vontade de "
+        "aprender. Desejável conhecimento em serviços de nuvem."
+    ),
+    "it": (
+        "Stiamo cercando uno sviluppatore da inserire nel nostro team tecnologico. "
+        "La risorsa si occuperà di sviluppare e mantenere applicazioni web, "
+        "collaborare con il team di prodotto e partecipare alla definizione di nuove "
+        "funzionalità. Requisiti: esperienza di almeno due anni nello sviluppo "
+        "software, conoscenza di database e degli strumenti di controllo di versione. "
+        "Costituirà titolo preferenziale l'esperienza con metodologie agili e il "
+        "lavoro di squadra. Si offre modalità di lavoro ibrida, formazione, "
+        "assicurazione sanitaria per la famiglia, giorno libero per il compleanno e "
+        "un ottimo ambiente di lavoro. Cerchiamo un analista amministrativo per "
+        "l'ufficio incassi. Le principali attività saranno la gestione dei pagamenti "
+        "ai fornitori, la riconciliazione dei conti e l'assistenza ai clienti. È "
+        "richiesta una laurea in corso o conseguita, la disponibilità a lavorare dal "
+        "lunedì al venerdì e la residenza nelle vicinanze. L'azienda è leader nel "
+        "suo settore e offre opportunità di crescita. Se ti interessa far parte di "
+        "un'azienda in espansione, candidati e raccontaci perché sei la persona "
+        "giusta per il ruolo. Orario dalle nove alle diciotto, con possibilità di "
+        "lavoro da remoto due giorni alla settimana. Benefit: buoni pasto, bonus "
+        "annuale, sconti e accesso a piattaforme di formazione. Valorizziamo la "
+        "proattività, la comunicazione e la voglia di imparare. Ottima conoscenza "
+        "dei servizi cloud."
+    ),
+}
+
+# Idioma esperado de las ofertas. Todo lo demás se considera "otro idioma".
+EXPECTED_LANGUAGE = "es"
+
+NGRAM_SIZE = 3
+
+# Renglones más cortos que esto (menús, botones, títulos sueltos) no se evalúan.
+MIN_LINE_LENGTH = 40
+
+# Cantidad máxima de caracteres evaluados por descripción. Alcanza de sobra
+# para decidir el idioma y acota el costo en páginas muy largas.
+MAX_TEXT_LENGTH = 20000
+
+_NON_LETTERS = re.compile(r"[^\w']+|[\d_]+")
+
+
+def _ngrams(text):
+    """
+    Genera los trigramas de un texto normalizado.
+
+    Cada palabra se rodea de espacios para que los trigramas capturen también
+    comienzos y finales de palabra (ej: ' de', 'ón '), muy característicos
+    de cada idioma.
+    """
+    normalized = " " + _NON_LETTERS.sub(" ", text.lower()).strip() + " "
+    normalized = re.sub(" +", " ", normalized)
+    return [normalized[i:i + NGRAM_SIZE] for i in range(len(normalized) - NGRAM_SIZE + 1)]
+
+
+def _vector(grams):
+    """Cuenta los n-gramas y retorna (conteos, norma) para la similitud coseno."""
+    counts = {}
+    for gram in grams:
+        counts[gram] = counts.get(gram, 0) + 1
+    norm = math.sqrt(sum(c * c for c in counts.values()))
+    return counts, norm
+
+
+class LanguageIdentifier:
+    """
+    Clasificador de idioma por similitud coseno entre perfiles de trigramas.
+
+    Uso:
+        identifier = get_language_identifier()
+        result = identifier.identify(texto)
+        result.language, result.confidence, result.shares
+    """
+
+    def __init__(self, sample_texts=None):
+        self.profiles = {
+            language: _vector(_ngrams(text))
+            for language, text in (sample_texts or SAMPLE_TEXTS).items()
+        }
+
+    def score_line(self, line):
+        """
+        Calcula la similitud de un renglón con cada perfil.
+
+        Returns:
+            dict: idioma → similitud coseno (0 a 1).
+        """
+        counts, norm = _vector(_ngrams(line))
+        if not norm:
+            return {}
+
+        scores = {}
+        for language, (profile, profile_norm) in self.profiles.items():
+            dot = sum(count * profile.get(gram, 0) for gram, count in counts.items())
+            scores[language] = dot / (norm * profile_norm)
+        return scores
+
+    def identify(self, text):
+        """
+        Identifica el idioma predominante de un texto.
+
+        Cada renglón suficientemente largo se asigna al idioma con mayor
+        similitud y aporta su longitud a ese idioma. El resultado indica qué
+        proporción del texto corresponde a cada idioma.
+
+        Args:
+            text (str): Descripción o texto completo de la página.
+
+        Returns:
+            LanguageGuess: Idioma predominante, confianza y proporciones.
+        """
+        shares = {}
+        total  = 0
+
+        for line in (text or "")[:MAX_TEXT_LENGTH].splitlines():
+            line = line.strip()
+            if len(line) < MIN_LINE_LENGTH:
+                continue
+
+            scores = self.score_line(line)
+            if not scores:
+                continue
+
+            best = max(scores, key=scores.get)
+            shares[best] = shares.get(best, 0) + len(line)
+            total += len(line)
+
+        if not total:
+            return LanguageGuess(None, 0.0, {})
+
+        shares   = {language: chars / total for language, chars in shares.items()}
+        language = max(shares, key=shares.get)
+        return LanguageGuess(language, shares[language], shares)
+
+
+class LanguageGuess:
+    """
+    Resultado de `LanguageIdentifier.identify`.
+
+    Atributos:
+        language (str | None): Idioma predominante ('es', 'en', 'pt', 'it').
+        confidence (float): Proporción del texto evaluado en ese idioma (0 a 1).
+        shares (dict): Proporción de texto por idioma.
+    """
+
+    def __init__(self, language, confidence, shares):
+        self.language   = language
+        self.confidence = confidence
+        self.shares     = shares
+
+    @property
+    def foreign_share(self):
+        """Proporción del texto que NO está en el idioma esperado."""
+        if not self.shares:
+            return 0.0
+        return 1.0 - self.shares.get(EXPECTED_LANGUAGE, 0.0)
+
+    def __repr__(self):
+        shares = ", ".join(f"{k}={v:.2f}" for k, v in sorted(self.shares.items()))
+        return f"LanguageGuess({self.language}, confidence={self.confidence:.2f}, {shares})"
+
+
+_identifier = None
+
+
+def get_language_identifier():
+    """Retorna el identificador compartido, construyendo los perfiles la primera vez."""
+    global _identifier
+    if _identifier is None:
+        _identifier = LanguageIdentifier()
+    return _identifier
@@ -1,24 +1,56 @@
+"""
+Atención de los mensajes de Telegram (comandos y respuestas a notificaciones).
+
+Los updates se reciben en segundo plano según TELEGRAM_MODE:
+- "polling": un hilo (UpdateListener) hace long polling contra getUpdates; la
+  petición queda abierta hasta LONG_POLL_SECONDS y Telegram responde apenas
+  llega un mensaje, por lo que los comandos se reciben en menos de un segundo.
+- "webhook": Telegram envía cada update a un servidor HTTP local (ver
+  src/webhook.py).
+
+En los dos modos la recepción solo encola (`UpdateListener.submit`); los
+mensajes se procesan en el hilo principal (`process_pending` / `wait`), que es
+el que modifica las palabras clave y el historial.
+
+El offset (último update procesado) se mantiene en memoria y se guarda en
+UPDATES_FILE cada OFFSET_SAVE_INTERVAL_SECONDS y al cerrar.
+
+/stop no corta el proceso: activa `stop_requested` y el ciclo principal cierra
+los navegadores, las notificaciones y el historial antes de salir.
+"""
 import requests
 import re
 import os
-import sys
 import json
+import queue
+import threading
+import time
 from src.config import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID
 from src.history import history, normalize_url
 from src.keywords_manager import (
-    add_negative_keyword,
-    add_positive_keyword,
+    add_keywords,
+    get_language_keywords,
     get_negative_keywords,
     get_positive_keywords,
-    remove_negative_keyword,
-    remove_positive_keyword,
-    add_language_keyword,
-    remove_language_keyword,
-    get_language_keywords,
+    remove_keywords,
 )
 
 UPDATES_FILE = "last_update.json"
 
+# Segundos que Telegram mantiene abierta cada consulta de getUpdates.
+LONG_POLL_SECONDS = 50
+
+OFFSET_SAVE_INTERVAL_SECONDS = 30
+
+# Frases que el usuario puede enviar como reply a una oferta para archivarla
+ARCHIVE_REPLY_PHRASES = [
+    "ya lo vi", "ya la vi", "listo", "visto",
+    "olvidalo", "este no", "ya esta", "paso",
+]
+
+# Se activa con /stop (ver el ciclo principal en main.py).
+stop_requested = threading.Event()
+
 
 def get_last_update_id():
     """
@@ -64,9 +96,293 @@ def send_msg(chat_id, text_message):
         print(f"Error enviando mensaje a {chat_id}: {e}")
 
 
-def check_telegram_replies():
+def digest_entry_links(text, entities):
+    """
+    Links de las entradas numeradas de un resumen (ver digest_pages).
+
+    Cada entrada es una línea "N. título" cuyo título es el único link de la
+    línea, así que los números del texto y los text_link de las entidades se
+    corresponden en orden.
+
+    Returns:
+        dict: número de entrada → URL. Vacío si el mensaje no es un resumen.
+    """
+    numbers = [int(number) for number in re.findall(r"^(\d+)\. ", text, re.MULTILINE)]
+    links   = [entity["url"] for entity in entities if entity.get("type") == "text_link"]
+    if not numbers or len(numbers) != len(links):
+        return {}
+    return dict(zip(numbers, links))
+
+
+def archive_digest_entries(chat_id, digest_links, numbers):
+    """Archiva las ofertas `numbers` de un resumen y responde con el resultado."""
+    archived, already, unknown = [], [], []
+    for number in numbers:
+        url = digest_links.get(number)
+        if url is None:
+            unknown.append(number)
+            continue
+        url = normalize_url(url)
+        if history.is_archived(url):
+            already.append(number)
+        else:
+            history.add_job(url)
+            archived.append(number)
+            print(f"   📩 Usuario marcó oferta #{number} del resumen como vista: {url[:60]}...")
+
+    parts = []
+    if archived:
+        parts.append("✅ Archivadas: " + ", ".join(map(str, archived)))
+    if already:
+        parts.append("ℹ️ Ya estaban en el historial: " + ", ".join(map(str, already)))
+    if unknown:
+        parts.append("⚠️ No existen en este resumen: " + ", ".join(map(str, unknown)))
+    send_msg(chat_id, "\n".join(parts))
+
+
+class Command:
+    """
+    Comando de Telegram registrado con @command.
+
+    Attributes:
+        handler (callable): Función handler(chat_id, argumento).
+        aliases (tuple[str]): Nombres del comando; el primero se muestra en el uso.
+        group (str): Clave de COMMAND_GROUPS bajo la que aparece en /comandos.
+        help (str): Descripción breve para /comandos.
+        arg (str | None): Nombre del argumento (ej: 'palabra'), o None si no lleva.
+        many (bool): El argumento admite varios valores separados por comas.
+    """
+
+    __slots__ = ("handler", "aliases", "group", "help", "arg", "many")
+
+    def __init__(self, handler, aliases, group, help, arg=None, many=False):
+        self.handler = handler
+        self.aliases = aliases
+        self.group   = group
+        self.help    = help
+        self.arg     = arg
+        self.many    = many
+
+    def usage(self):
+        """Uso correcto, ej: '/menos <palabra>[, <palabra>...]'."""
+        if self.arg is None:
+            return self.aliases[0]
+        suffix = f", <{self.arg}>..." if self.many else ""
+        return f"{self.aliases[0]} <{self.arg}>{suffix}"
+
+    def parse(self, raw_argument):
+        """
+        Convierte el texto que sigue al comando en el argumento del handler.
+
+        Returns:
+            str | list[str] | None: El texto, la lista de valores (many) o None
+            si el comando requiere argumento y no se indicó.
+        """
+        raw_argument = (raw_argument or "").strip()
+        if self.arg is None:
+            return raw_argument
+        if self.many:
+            values = [value.strip() for value in raw_argument.split(",") if value.strip()]
+            return list(dict.fromkeys(values)) or None
+        return raw_argument or None
+
+
+# Secciones de /comandos, en orden de aparición.
+COMMAND_GROUPS = {
+    "negative": "🚫 **Negativas (Ignorar título):**",
+    "positive": "✅ **Positivas (Buscar en título):**",
+    "language": "🌐 **Filtro de Idioma (descripción del puesto):**",
+    "system":   "ℹ️ **Sistema:**",
+}
+
+# Alias → Command. Se completa con @command al importar el módulo.
+COMMANDS = {}
+
+
+def command(*aliases, group, help, arg=None, many=False):
+    """
+    Registra la función decorada como handler de los alias indicados.
+
+    Args:
+        aliases (str): Nombres del comando (con /). El primero es el principal.
+        group (str): Sección de /comandos (clave de COMMAND_GROUPS).
+        help (str): Descripción breve para /comandos.
+        arg (str): Nombre del argumento, si el comando lleva uno.
+        many (bool): Admite varios valores separados por comas.
+    """
+    def decorator(handler):
+        registered = Command(handler, aliases, group, help, arg, many)
+        for alias in aliases:
+            if alias in COMMANDS:
+                raise ValueError(f"Alias de comando duplicado: {alias}")
+            COMMANDS[alias] = registered
+        return handler
+    return decorator
+
+
+def dispatch_command(chat_id, message_text):
+    """
+    Ejecuta el comando de un mensaje que empieza con '/'.
+
+    Returns:
+        bool: True si el comando existe.
+    """
+    parts        = message_text.split(" ", 1)
+    command_name = parts[0].lower()
+    registered   = COMMANDS.get(command_name)
+    if registered is None:
+        return False
+
+    argument = registered.parse(parts[1] if len(parts) > 1 else "")
+    if argument is None:
+        send_msg(chat_id, f"⚠️ Uso correcto: {registered.usage()}")
+        return True
+    registered.handler(chat_id, argument)
+    return True
+
+
+def commands_help():
+    """Texto de /comandos generado a partir de COMMANDS."""
+    unique = list(dict.fromkeys(COMMANDS.values()))
+    lines  = ["🤖 **Comandos Disponibles:**"]
+    for group, title in COMMAND_GROUPS.items():
+        lines.append("")
+        lines.append(title)
+        for registered in unique:
+            if registered.group != group:
+                continue
+            aliases  = ", ".join(f"`{alias}`" for alias in registered.aliases)
+            argument = f" <{registered.arg}>" if registered.arg else ""
+            lines.append(f"• {registered.help}: {aliases}{argument}")
+
+    lines += [
+        "",
+        "Para varias palabras a la vez, separarlas con comas: `/mas react, vue, sql`.",
+        "",
+        "🗃️ **Archivar ofertas:**",
+        "Responder `ya lo vi`, `listo` o `paso` a una notificación del bot.",
+        "En un resumen, agregar el número: `ya lo vi 3` o `paso 1 4`.",
+    ]
+    return "\n".join(lines)
+
+
+def send_long_msg(chat_id, text_message, chunk_size=4000):
+    """Envía un texto largo en partes que respetan el límite de Telegram."""
+    for i in range(0, len(text_message), chunk_size):
+        send_msg(chat_id, text_message[i:i + chunk_size])
+
+
+# Listas de keywords.json editables por comando y cómo se nombran en los mensajes.
+KEYWORD_LISTS = {
+    "negative_keywords": {
+        "icon": "🚫", "label": "Palabra negativa", "item": "palabra", "log": "NEGATIVA",
+        "where": "en la lista negativa", "to": "a la lista negativa", "from": "de la lista negativa",
+    },
+    "search_keywords": {
+        "icon": "✅", "label": "Palabra positiva", "item": "palabra", "log": "POSITIVA",
+        "where": "en la lista positiva", "to": "a la lista positiva", "from": "de la lista positiva",
+    },
+    "language_negative_keywords": {
+        "icon": "🌐", "label": "Frase de idioma", "item": "frase", "log": "IDIOMA",
+        "where": "en el filtro de idioma", "to": "al filtro de idioma", "from": "del filtro de idioma",
+    },
+}
+
+
+def _keyword_changes(chat_id, list_key, words, remove=False):
+    """
+    Agrega o elimina una o varias palabras con una sola escritura de
+    keywords.json y responde con el resultado.
     """
-    Procesa las actualizaciones pendientes de Telegram (long polling).
+    names            = KEYWORD_LISTS[list_key]
+    changed, skipped = (remove_keywords if remove else add_keywords)(list_key, words)
+    icon             = "🗑️" if remove else names["icon"]
+
+    if changed:
+        print(f"   {icon} [CMD] Usuario {'eliminó' if remove else 'agregó'} {names['log']}: {', '.join(changed)}")
+
+    if len(words) == 1:
+        if changed:
+            send_msg(chat_id, f"{icon} {names['label']} {'eliminada' if remove else 'agregada'}: '{words[0]}'")
+        else:
+            state = "no estaba" if remove else "ya estaba"
+            send_msg(chat_id, f"⚠️ La {names['item']} '{words[0]}' {state} {names['where']}.")
+        return
+
+    lines = []
+    if changed:
+        done = f"Eliminadas {names['from']}" if remove else f"Agregadas {names['to']}"
+        lines.append(f"{icon} {done} ({len(changed)}): " + ", ".join(f"'{w}'" for w in changed))
+    if skipped:
+        state = "No estaban" if remove else "Ya estaban"
+        lines.append(f"⚠️ {state} {names['where']}: " + ", ".join(f"'{w}'" for w in skipped))
+    send_msg(chat_id, "\n".join(lines))
+
+
+@command("/addneg", "/negativa", "/an", "/menos", group="negative", help="Agregar", arg="palabra", many=True)
+def _add_negative(chat_id, words):
+    _keyword_changes(chat_id, "negative_keywords", words)
+
+
+@command("/delneg", "/rmneg", "/sacarmenos", "/dn", group="negative", help="Eliminar", arg="palabra", many=True)
+def _remove_negative(chat_id, words):
+    _keyword_changes(chat_id, "negative_keywords", words, remove=True)
+
+
+@command("/listneg", "/vernegativas", "/ln", "/vermenos", group="negative", help="Listar")
+def _list_negative(chat_id, _):
+    print("   ℹ️ [CMD] Usuario solicitó lista de NEGATIVAS.")
+    send_long_msg(chat_id, "🚫 **Palabras Negativas:**\n\n" + ", ".join(sorted(get_negative_keywords())))
+
+
+@command("/addpos", "/positiva", "/ap", "/mas", group="positive", help="Agregar", arg="palabra", many=True)
+def _add_positive(chat_id, words):
+    _keyword_changes(chat_id, "search_keywords", words)
+
+
+@command("/delpos", "/rmpos", "/sacarmas", "/dp", group="positive", help="Eliminar", arg="palabra", many=True)
+def _remove_positive(chat_id, words):
+    _keyword_changes(chat_id, "search_keywords", words, remove=True)
+
+
+@command("/listpos", "/verpositivas", "/lp", "/vermas", group="positive", help="Listar")
+def _list_positive(chat_id, _):
+    print("   ℹ️ [CMD] Usuario solicitó lista de POSITIVAS.")
+    send_long_msg(chat_id, "✅ **Palabras Positivas:**\n\n" + ", ".join(sorted(get_positive_keywords())))
+
+
+@command("/addidioma", "/ai", group="language", help="Agregar", arg="frase", many=True)
+def _add_language(chat_id, phrases):
+    _keyword_changes(chat_id, "language_negative_keywords", phrases)
+
+
+@command("/sacaridioma", "/si", group="language", help="Eliminar", arg="frase", many=True)
+def _remove_language(chat_id, phrases):
+    _keyword_changes(chat_id, "language_negative_keywords", phrases, remove=True)
+
+
+@command("/veridioma", "/listidioma", "/vi", group="language", help="Listar")
+def _list_language(chat_id, _):
+    print("   ℹ️ [CMD] Usuario solicitó lista de FILTROS DE IDIOMA.")
+    send_long_msg(chat_id, "🌐 **Filtro de Idioma:**\n\n" + ", ".join(sorted(get_language_keywords())))
+
+
+@command("/comandos", "/help", "/ayuda", group="system", help="Ayuda")
+def _help(chat_id, _):
+    send_msg(chat_id, commands_help())
+
+
+@command("/stop", "/shutdown", "/apagar", "/exit", "/salir", group="system", help="Apagar el bot")
+def _stop(chat_id, _):
+    print("   🛑 [CMD] Usuario ordenó APAGADO REMOTO.")
+    send_msg(chat_id, "👋 Entendido. Apagando sistemas... ¡Nos vemos!")
+    # El ciclo principal detiene los sitios y cierra todo ordenadamente.
+    stop_requested.set()
+
+
+def handle_update(update):
+    """
+    Procesa un update de Telegram.
 
     Maneja dos tipos de interacciones:
     - Comandos (mensajes que empiezan con /): gestión de palabras clave,
@@ -76,232 +392,255 @@ def check_telegram_replies():
 
     Solo procesa mensajes del TELEGRAM_CHAT_ID configurado, descartando
     cualquier interacción de otros usuarios.
+
+    Args:
+        update (dict): Update tal como lo entrega la API de Telegram.
     """
-    if not TELEGRAM_BOT_TOKEN:
+    message_data = update.get("message", {})
+    chat_id      = message_data.get("chat", {}).get("id")
+
+    # Solo procesamos mensajes del propietario del bot
+    if str(chat_id) != str(TELEGRAM_CHAT_ID):
+        print(f"   ⚠️ Acceso no autorizado detectado desde ID: {chat_id}")
         return
 
-    last_id = get_last_update_id()
-    url     = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/getUpdates?offset={last_id + 1}"
+    message_text       = message_data.get("text", "").strip()
+    message_text_lower = message_text.lower()
 
-    try:
-        response      = requests.get(url, timeout=5)
-        response_data = response.json()
+    # ----------------------------------------------------------------
+    # BLOQUE 1: COMANDOS (mensajes que empiezan con /, ver COMMANDS)
+    # ----------------------------------------------------------------
+    if message_text_lower.startswith("/"):
+        dispatch_command(chat_id, message_text)
+        return
+
+    # ----------------------------------------------------------------
+    # BLOQUE 2: ARCHIVAR OFERTAS (reply a una notificación del bot)
+    # ----------------------------------------------------------------
+    if any(cmd in message_text_lower for cmd in ARCHIVE_REPLY_PHRASES):
+        reply_to_message = message_data.get("reply_to_message", {})
 
-        if not response_data.get("ok"):
+        # El usuario debe responder (reply) al mensaje original del bot
+        if not reply_to_message:
             return
 
-        updates_result = response_data.get("result", [])
-        current_max_id = last_id
+        found_url    = None
+        entities     = reply_to_message.get("entities", [])
+        original_text = reply_to_message.get("text", "")
+
+        # Resumen (modo NOTIFY_DIGEST_MODE): varias ofertas numeradas en un
+        # mensaje. "ya lo vi 3" archiva la número 3.
+        digest_links = digest_entry_links(original_text, entities)
+        if len(digest_links) > 1:
+            numbers = [int(number) for number in re.findall(r"\d+", message_text_lower)]
+            if not numbers:
+                send_msg(chat_id, "⚠️ Es un resumen: indicá el número de la oferta (ej: 'ya lo vi 3').")
+                return
+            archive_digest_entries(chat_id, digest_links, numbers)
+            return
 
-        # Frases que el usuario puede enviar como reply a una oferta para archivarla
-        commands_to_ignore_job = [
-            "ya lo vi", "ya la vi", "listo", "visto",
-            "olvidalo", "este no", "ya esta", "paso",
-        ]
+        # Método A: Link embebido como text_link en las entidades del mensaje
+        for entity in entities:
+            if entity["type"] == "text_link":
+                found_url = entity["url"]
+                break
+
+        # Método B: URL plana en el texto, extraída con regex.
+        # Más robusto para mensajes con emojis, donde los offsets de Telegram
+        # (UTF-16) pueden desalinearse con los índices de Python (Unicode).
+        if not found_url:
+            urls_found = re.findall(r'https?://[^\s<>"]+', original_text)
+            if urls_found:
+                found_url = urls_found[0]
+
+        if found_url:
+            found_url = normalize_url(found_url)
+            print(f"   📩 Usuario marcó oferta como vista: {found_url[:60]}...")
+
+            if history.is_archived(found_url):
+                send_msg(chat_id, "ℹ️ La URL ya se encuentra en el historial.")
+            else:
+                history.add_job(found_url)
+                send_msg(chat_id, "✅ Oferta archivada correctamente.")
+        else:
+            print("   ⚠️ Comando recibido, pero no detecté ninguna URL en el mensaje original.")
+
+
+class UpdateListener:
+    """
+    Recepción de updates de Telegram (long polling o webhook) y cola de
+    updates recibidos.
 
-        for update in updates_result:
-            update_id = update["update_id"]
+    En modo polling un hilo consulta getUpdates con `timeout=LONG_POLL_SECONDS`;
+    en modo webhook los entrega WebhookServer. Los dos encolan con `submit` y
+    `process_pending` y `wait` los procesan en el hilo que las llama.
+    """
 
-            if update_id > current_max_id:
-                current_max_id = update_id
+    def __init__(self):
+        self.updates      = queue.Queue()
+        self.offset       = get_last_update_id()  # Último update_id recibido
+        self.handled      = self.offset           # Último update_id procesado
+        self.saved_offset = self.offset
+        self.saved_at     = time.monotonic()
+        self._lock        = threading.Lock()
+        self._stop        = threading.Event()
+        self._thread      = None
+        self._session     = None
+        self._webhook     = None  # WebhookServer en modo webhook
+
+    def start(self):
+        """
+        Inicia la recepción según TELEGRAM_MODE (no hace nada sin TELEGRAM_BOT_TOKEN).
+
+        En modo webhook, si falta la configuración o no se puede abrir el
+        puerto, se vuelve a long polling.
+        """
+        from src.config import TELEGRAM_MODE
+        from src.webhook import delete_webhook
+
+        if not TELEGRAM_BOT_TOKEN or self._thread is not None or self._webhook is not None:
+            return
+        self._stop.clear()
 
-            message_data = update.get("message", {})
-            chat_id      = message_data.get("chat", {}).get("id")
+        if TELEGRAM_MODE == "webhook" and self._start_webhook():
+            return
 
-            # Solo procesamos mensajes del propietario del bot
-            if str(chat_id) != str(TELEGRAM_CHAT_ID):
-                print(f"   ⚠️ Acceso no autorizado detectado desde ID: {chat_id}")
+        # getUpdates responde 409 mientras haya un webhook registrado.
+        delete_webhook()
+        self._session = requests.Session()
+        self._thread  = threading.Thread(target=self._poll, name="telegram-listener", daemon=True)
+        self._thread.start()
+
+    def _start_webhook(self):
+        from urllib.parse import urlparse
+        from src.config import TELEGRAM_WEBHOOK_SECRET, TELEGRAM_WEBHOOK_URL, WEBHOOK_HOST, WEBHOOK_PORT
+        from src.webhook import WebhookServer, set_webhook
+
+        if not TELEGRAM_WEBHOOK_URL or not TELEGRAM_WEBHOOK_SECRET:
+            print("⚠️ Modo webhook sin TELEGRAM_WEBHOOK_URL o TELEGRAM_WEBHOOK_SECRET. Se usa long polling.")
+            return False
+        try:
+            server = WebhookServer(
+                self.submit, TELEGRAM_WEBHOOK_SECRET,
+                host=WEBHOOK_HOST, port=WEBHOOK_PORT, path=urlparse(TELEGRAM_WEBHOOK_URL).path,
+            )
+        except OSError as e:
+            print(f"⚠️ No se pudo abrir el puerto del webhook: {e}. Se usa long polling.")
+            return False
+        if not set_webhook(TELEGRAM_WEBHOOK_URL, TELEGRAM_WEBHOOK_SECRET):
+            server.close()
+            return False
+        server.start()
+        self._webhook = server
+        return True
+
+    def submit(self, update):
+        """
+        Encola un update recibido (por polling o por webhook).
+
+        Los update_id ya recibidos se descartan: Telegram reenvía un update si
+        no recibió la confirmación a tiempo.
+        """
+        with self._lock:
+            if update["update_id"] <= self.offset:
+                return
+            self.offset = update["update_id"]
+        self.updates.put(update)
+
+    def _poll(self):
+        url   = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/getUpdates"
+        retry = 1
+        while not self._stop.is_set():
+            try:
+                response = self._session.get(
+                    url,
+                    params={"offset": self.offset + 1, "timeout": LONG_POLL_SECONDS, "allowed_updates": '["message"]'},
+                    timeout=LONG_POLL_SECONDS + 10,
+                )
+                response_data = response.json()
+                if not response_data.get("ok"):
+                    raise RuntimeError(response_data.get("description", f"HTTP {response.status_code}"))
+                retry = 1
+            except Exception as error:
+                if self._stop.is_set():
+                    return
+                print(f"   ⚠️ Error chequeando Telegram: {error}. Reintento en {retry}s.")
+                self._stop.wait(retry)
+                retry = min(retry * 2, 60)
                 continue
 
-            message_text       = message_data.get("text", "").strip()
-            message_text_lower = message_text.lower()
-
-            # ----------------------------------------------------------------
-            # BLOQUE 1: COMANDOS (mensajes que empiezan con /)
-            # ----------------------------------------------------------------
-            if message_text_lower.startswith("/"):
-                parts        = message_text.split(" ", 1)
-                command_name = parts[0].lower()
-                argument_word = parts[1].strip() if len(parts) > 1 else None
-
-                # Agregar palabra negativa
-                if command_name in ["/addneg", "/negativa", "/an", "/menos"]:
-                    if argument_word:
-                        if add_negative_keyword(argument_word):
-                            send_msg(chat_id, f"🚫 Palabra negativa agregada: '{argument_word}'")
-                            print(f"   🛑 [CMD] Usuario agregó NEGATIVA: {argument_word}")
-                        else:
-                            send_msg(chat_id, f"⚠️ La palabra '{argument_word}' ya estaba en la lista negativa.")
-                    else:
-                        send_msg(chat_id, "⚠️ Uso correcto: /menos <palabra>")
-
-                # Eliminar palabra negativa
-                elif command_name in ["/delneg", "/rmneg", "/sacarmenos", "/dn"]:
-                    if argument_word:
-                        if remove_negative_keyword(argument_word):
-                            send_msg(chat_id, f"🗑️ Palabra negativa eliminada: '{argument_word}'")
-                            print(f"   🗑️ [CMD] Usuario eliminó NEGATIVA: {argument_word}")
-                        else:
-                            send_msg(chat_id, f"⚠️ La palabra '{argument_word}' no estaba en la lista negativa.")
-                    else:
-                        send_msg(chat_id, "⚠️ Uso correcto: /sacarmenos <palabra>")
-
-                # Agregar palabra positiva
-                elif command_name in ["/addpos", "/positiva", "/ap", "/mas"]:
-                    if argument_word:
-                        if add_positive_keyword(argument_word):
-                            send_msg(chat_id, f"✅ Palabra positiva agregada: '{argument_word}'")
-                            print(f"   ✨ [CMD] Usuario agregó POSITIVA: {argument_word}")
-                        else:
-                            send_msg(chat_id, f"⚠️ La palabra '{argument_word}' ya estaba en la lista positiva.")
-                    else:
-                        send_msg(chat_id, "⚠️ Uso correcto: /mas <palabra>")
-
-                # Eliminar palabra positiva
-                elif command_name in ["/delpos", "/rmpos", "/sacarmas", "/dp"]:
-                    if argument_word:
-                        if remove_positive_keyword(argument_word):
-                            send_msg(chat_id, f"🗑️ Palabra positiva eliminada: '{argument_word}'")
-                            print(f"   🗑️ [CMD] Usuario eliminó POSITIVA: {argument_word}")
-                        else:
-                            send_msg(chat_id, f"⚠️ La palabra '{argument_word}' no estaba en la lista positiva.")
-                    else:
-                        send_msg(chat_id, "⚠️ Uso correcto: /sacarmas <palabra>")
-
-                # Listar palabras negativas
-                elif command_name in ["/listneg", "/vernegativas", "/ln", "/vermenos"]:
-                    negative_list = sorted(get_negative_keywords())
-                    print("   ℹ️ [CMD] Usuario solicitó lista de NEGATIVAS.")
-                    response_message = "🚫 **Palabras Negativas:**\n\n" + ", ".join(negative_list)
-                    if len(response_message) > 4000:
-                        for i in range(0, len(response_message), 4000):
-                            send_msg(chat_id, response_message[i:i+4000])
-                    else:
-                        send_msg(chat_id, response_message)
-
-                # Listar palabras positivas
-                elif command_name in ["/listpos", "/verpositivas", "/lp", "/vermas"]:
-                    positive_list = sorted(get_positive_keywords())
-                    print("   ℹ️ [CMD] Usuario solicitó lista de POSITIVAS.")
-                    response_message = "✅ **Palabras Positivas:**\n\n" + ", ".join(positive_list)
-                    if len(response_message) > 4000:
-                        for i in range(0, len(response_message), 4000):
-                            send_msg(chat_id, response_message[i:i+4000])
-                    else:
-                        send_msg(chat_id, response_message)
-
-                # Agregar filtro de idioma
-                elif command_name in ["/addidioma", "/ai"]:
-                    if argument_word:
-                        if add_language_keyword(argument_word):
-                            send_msg(chat_id, f"🌐 Filtro de idioma agregado: '{argument_word}'")
-                            print(f"   🌐 [CMD] Usuario agregó IDIOMA: {argument_word}")
-                        else:
-                            send_msg(chat_id, f"⚠️ La frase '{argument_word}' ya estaba en el filtro de idioma.")
-                    else:
-                        send_msg(chat_id, "⚠️ Uso correcto: /addidioma <frase>")
-
-                # Eliminar filtro de idioma
-                elif command_name in ["/sacaridioma", "/si"]:
-                    if argument_word:
-                        if remove_language_keyword(argument_word):
-                            send_msg(chat_id, f"🗑️ Filtro de idioma eliminado: '{argument_word}'")
-                            print(f"   🗑️ [CMD] Usuario eliminó IDIOMA: {argument_word}")
-                        else:
-                            send_msg(chat_id, f"⚠️ La frase '{argument_word}' no estaba en el filtro de idioma.")
-                    else:
-                        send_msg(chat_id, "⚠️ Uso correcto: /sacaridioma <frase>")
-
-                # Listar filtros de idioma
-                elif command_name in ["/veridioma", "/listidioma", "/vi"]:
-                    language_list    = sorted(get_language_keywords())
-                    response_message = "🌐 **Filtro de Idioma:**\n\n" + ", ".join(language_list)
-                    print("   ℹ️ [CMD] Usuario solicitó lista de FILTROS DE IDIOMA.")
-                    if len(response_message) > 4000:
-                        for i in range(0, len(response_message), 4000):
-                            send_msg(chat_id, response_message[i:i+4000])
-                    else:
-                        send_msg(chat_id, response_message)
-
-                # Ayuda / listado de comandos disponibles
-                elif command_name in ["/comandos", "/help", "/ayuda"]:
-                    help_text = (
-                        "🤖 **Comandos Disponibles:**\n\n"
-                        "🚫 **Negativas (Ignorar título):**\n"
-                        "• Agregar: `/addneg`, `/menos`, `/an` <palabra>\n"
-                        "• Eliminar: `/delneg`, `/sacarmenos` <palabra>\n"
-                        "• Listar: `/listneg`, `/vermenos`, `/ln`\n\n"
-                        "✅ **Positivas (Buscar en título):**\n"
-                        "• Agregar: `/addpos`, `/mas`, `/ap` <palabra>\n"
-                        "• Eliminar: `/delpos`, `/sacarmas` <palabra>\n"
-                        "• Listar: `/listpos`, `/vermas`, `/lp`\n\n"
-                        "🌐 **Filtro de Idioma (descripción del puesto):**\n"
-                        "• Agregar: `/addidioma`, `/ai` <frase>\n"
-                        "• Eliminar: `/sacaridioma`, `/si` <frase>\n"
-                        "• Listar: `/veridioma`, `/vi`\n\n"
-                        "ℹ️ **Ayuda:**\n"
-                        "• `/comandos`, `/help`, `/ayuda`\n\n"
-                        "🗃️ **Archivar ofertas:**\n"
-                        "Responder `ya lo vi`, `listo` o `paso` a una notificación del bot."
-                    )
-                    send_msg(chat_id, help_text)
-
-                # Apagado remoto del bot
-                elif command_name in ["/stop", "/shutdown", "/apagar", "/exit", "/salir"]:
-                    print("   🛑 [CMD] Usuario ordenó APAGADO REMOTO.")
-                    send_msg(chat_id, "👋 Entendido. Apagando sistemas... ¡Nos vemos!")
-                    try:
-                        import time
-                        time.sleep(1)
-                    except Exception:
-                        pass
-                    save_last_update_id(update_id)
-                    sys.exit(0)
-
-                continue  # Fin del bloque de comandos; pasamos al siguiente update
-
-            # ----------------------------------------------------------------
-            # BLOQUE 2: ARCHIVAR OFERTAS (reply a una notificación del bot)
-            # ----------------------------------------------------------------
-            if any(cmd in message_text_lower for cmd in commands_to_ignore_job):
-                reply_to_message = message_data.get("reply_to_message", {})
-
-                # El usuario debe responder (reply) al mensaje original del bot
-                if not reply_to_message:
-                    continue
-
-                found_url    = None
-                entities     = reply_to_message.get("entities", [])
-                original_text = reply_to_message.get("text", "")
-
-                # Método A: Link embebido como text_link en las entidades del mensaje
-                for entity in entities:
-                    if entity["type"] == "text_link":
-                        found_url = entity["url"]
-                        break
-
-                # Método B: URL plana en el texto, extraída con regex.
-                # Más robusto para mensajes con emojis, donde los offsets de Telegram
-                # (UTF-16) pueden desalinearse con los índices de Python (Unicode).
-                if not found_url:
-                    urls_found = re.findall(r'https?://[^\s<>"]+', original_text)
-                    if urls_found:
-                        found_url = urls_found[0]
-
-                if found_url:
-                    found_url = normalize_url(found_url)
-                    print(f"   📩 Usuario marcó oferta como vista: {found_url[:60]}...")
-
-                    if history.is_seen(found_url):
-                        send_msg(chat_id, "ℹ️ La URL ya se encuentra en el historial.")
-                    else:
-                        history.add_job(found_url)
-                        send_msg(chat_id, "✅ Oferta archivada correctamente.")
-                else:
-                    print("   ⚠️ Comando recibido, pero no detecté ninguna URL en el mensaje original.")
-
-        if current_max_id > last_id:
-            save_last_update_id(current_max_id)
-
-    except Exception as error:
-        print(f"   ⚠️ Error chequeando Telegram: {error}")
+            for update in response_data.get("result", []):
+                self.submit(update)
+
+    def _save_offset(self, force=False):
+        """
+        Guarda el último update procesado si cambió y pasó el intervalo (o si
+        `force`). Los recibidos pero no procesados se vuelven a pedir al reiniciar.
+        """
+        if self.handled == self.saved_offset:
+            return
+        if not force and time.monotonic() - self.saved_at < OFFSET_SAVE_INTERVAL_SECONDS:
+            return
+        try:
+            save_last_update_id(self.handled)
+            self.saved_offset = self.handled
+            self.saved_at     = time.monotonic()
+        except OSError as e:
+            print(f"   ⚠️ No se pudo guardar el offset de Telegram: {e}")
+
+    def process_pending(self, timeout=0):
+        """
+        Procesa los updates recibidos.
+
+        Args:
+            timeout (float): Segundos a esperar el primero si la cola está vacía.
+
+        Returns:
+            int: Cantidad de updates procesados.
+        """
+        processed = 0
+        while True:
+            try:
+                update = self.updates.get(timeout=timeout) if timeout and not processed else self.updates.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                handle_update(update)
+            except Exception as error:
+                print(f"   ⚠️ Error procesando mensaje de Telegram: {error}")
+            self.handled = max(self.handled, update["update_id"])
+            processed += 1
+        self._save_offset()
+        return processed
+
+    def wait(self, seconds):
+        """
+        Espera `seconds` atendiendo los mensajes a medida que llegan.
+
+        Returns:
+            bool: True si se interrumpió por /stop.
+        """
+        deadline = time.monotonic() + seconds
+        while not stop_requested.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self.process_pending(timeout=min(remaining, 1.0))
+        return True
+
+    def close(self):
+        """
+        Detiene la recepción y guarda el offset. El webhook queda registrado:
+        Telegram conserva los updates hasta el próximo arranque.
+        """
+        self._stop.set()
+        if self._session is not None:
+            self._session.close()
+        if self._webhook is not None:
+            self._webhook.close()
+            self._webhook = None
+        self._save_offset(force=True)
+
+
+# Instancia global: se inicia desde main.py
+listener = UpdateListener()
@@ -0,0 +1,146 @@
+"""
+Motor de coincidencia de palabras clave para títulos de empleo.
+
+En lugar de construir y ejecutar una expresión regular por cada palabra
+(positiva o negativa) y por cada título, se compila UNA sola alternancia por
+lista de palabras. El motor de regex recorre el título una única vez y prueba
+todas las alternativas en cada posición, en C, lo que reduce drásticamente el
+costo por tarjeta cuando hay cientos de ofertas por ciclo.
+
+Se conserva la misma semántica de límites de palabra que el filtro original:
+- Palabras alfanuméricas: \\b (ej: 'sr' no matchea dentro de 'ssr').
+- Palabras con símbolos (C#, .Net, C++, 'desarrollo web'): lookbehind/lookahead
+  negativos, ya que \\b no funciona junto a caracteres no alfanuméricos.
+"""
+import re
+from functools import lru_cache
+
+
+def _term_pattern(term):
+    """
+    Construye el patrón de un término individual con sus límites de palabra.
+
+    Args:
+        term (str): Palabra o frase ya normalizada a minúsculas.
+
+    Returns:
+        str: Fragmento de regex listo para incluir en una alternancia.
+    """
+    escaped = re.escape(term)
+    if not term.isalnum():
+        return r'(?<!\w)' + escaped + r'(?!\w)'
+    return r'\b' + escaped + r'\b'
+
+
+def _compile_alternation(terms):
+    """
+    Compila una lista de términos en una única expresión regular.
+
+    Los términos se ordenan de mayor a menor longitud para que, cuando varios
+    coinciden en la misma posición, gane el más específico
+    (ej: 'desarrollador web' antes que 'desarrollador').
+
+    Returns:
+        re.Pattern | None: Patrón compilado, o None si la lista está vacía.
+    """
+    unique_terms = sorted(set(terms), key=lambda t: (-len(t), t))
+    if not unique_terms:
+        return None
+    return re.compile("|".join(_term_pattern(t) for t in unique_terms))
+
+
+class KeywordMatcher:
+    """
+    Filtro de títulos compilado a partir de las listas de palabras clave.
+
+    Se construye una sola vez por combinación de listas y luego se reutiliza
+    para todos los títulos del ciclo. Ver `get_keyword_matcher` para obtener
+    una instancia cacheada.
+
+    Uso:
+        matcher = KeywordMatcher(["python", "react"], ["senior", "c#"])
+        matcher.match("Desarrollador Python Jr")  # -> 'python'
+        matcher.match_many(["Python Sr", "React Dev"])  # -> [None, 'react']
+    """
+
+    def __init__(self, search_keywords, negative_keywords):
+        positives = [k.lower().strip() for k in search_keywords if k and k.strip()]
+        negatives = [k.lower().strip() for k in negative_keywords if k and k.strip()]
+
+        self.search_keywords   = tuple(positives)
+        self.negative_keywords = tuple(negatives)
+
+        self._positive_regex = _compile_alternation(positives)
+        self._negative_regex = _compile_alternation(negatives)
+
+        # Solo se usan cuando el título ya coincidió: deciden qué keyword se informa.
+        self._positive_terms = [(term, re.compile(_term_pattern(term))) for term in dict.fromkeys(positives)]
+
+    def is_blocked(self, job_title):
+        """Retorna True si el título contiene alguna palabra negativa."""
+        if self._negative_regex is None:
+            return False
+        return self._negative_regex.search(job_title.lower()) is not None
+
+    def match(self, job_title):
+        """
+        Evalúa un título: primero el filtro negativo, luego el positivo.
+
+        Args:
+            job_title (str): Título del aviso de empleo.
+
+        Returns:
+            str | None: La keyword que produjo el match, o None si se descarta.
+        """
+        if not job_title or self._positive_regex is None:
+            return None
+
+        normalized_title = job_title.lower()
+
+        if self._negative_regex is not None and self._negative_regex.search(normalized_title):
+            return None
+
+        if not self._positive_regex.search(normalized_title):
+            return None
+
+        # Con varias keywords en el título se informa la primera de la lista,
+        # como el filtro original (no la que aparece antes en el título).
+        for term, pattern in self._positive_terms:
+            if pattern.search(normalized_title):
+                return term
+        return None
+
+    def match_many(self, titles):
+        """
+        Evalúa una página completa de títulos de una sola vez.
+
+        Args:
+            titles (iterable[str]): Títulos a evaluar.
+
+        Returns:
+            list[str | None]: Resultado de `match` para cada título, en el mismo orden.
+        """
+        return [self.match(title) for title in titles]
+
+
+@lru_cache(maxsize=8)
+def _cached_matcher(search_keywords, negative_keywords):
+    return KeywordMatcher(search_keywords, negative_keywords)
+
+
+def get_keyword_matcher(search_keywords, negative_keywords):
+    """
+    Retorna un KeywordMatcher cacheado para las listas indicadas.
+
+    El matcher solo se recompila cuando cambia el contenido de alguna de las
+    listas (por ejemplo, tras un /addneg desde Telegram).
+
+    Args:
+        search_keywords (iterable[str]): Palabras positivas.
+        negative_keywords (iterable[str]): Palabras negativas.
+
+    Returns:
+        KeywordMatcher: Instancia lista para usar.
+    """
+    return _cached_matcher(tuple(search_keywords), tuple(negative_keywords))
+
@@ -1,13 +1,113 @@
+"""
+Envío de mensajes a Telegram.
+
+Los bots no envían los mensajes en el momento: `queue_telegram_message` los
+deja en una cola acotada y un hilo (NotificationDispatcher) los entrega en
+segundo plano, de modo que el scraping nunca espera a la red de Telegram.
+
+El hilo:
+- reutiliza una única sesión HTTP (keep-alive) hacia api.telegram.org,
+- respeta el límite por chat de Telegram (~1 mensaje/s) con un token bucket
+  (NOTIFY_RATE_PER_SECOND, ráfagas de hasta NOTIFY_BURST),
+- ante un 429 espera el `retry_after` que indica Telegram y reintenta,
+- ante errores de red reintenta con espera creciente (NOTIFY_MAX_RETRIES).
+
+Los mensajes que no se pudieron entregar (reintentos agotados, cola llena o
+pendientes al detener el bot) se guardan en PENDING_FILE y se reenvían en el
+próximo arranque. `flush_notifications` vacía la cola antes de salir.
+
+Modo resumen (NOTIFY_DIGEST_MODE): en lugar de un mensaje por oferta, las
+coincidencias de cada sitio se acumulan en `digest` y se envían juntas al
+terminar el sitio (o al cumplirse NOTIFY_DIGEST_WINDOW_SECONDS), en mensajes
+numerados de hasta TELEGRAM_MAX_MESSAGE_LENGTH caracteres. Cada entrada
+conserva su link: respondiendo "ya lo vi 3" se archiva la oferta número 3.
+"""
+import html
+import json
+import os
+import queue
+import threading
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
+
 from src.config import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID
 
+PENDING_FILE = "pending_notifications.json"
+
+# Límite de Telegram para el texto de un mensaje.
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+
+_session      = None
+_session_lock = threading.Lock()
+
+# Serializa los envíos sincrónicos con los del dispatcher: un único escritor
+# hacia Telegram mantiene el orden de los mensajes.
+_send_lock = threading.Lock()
+
+
+def get_telegram_session():
+    """Sesión HTTP compartida hacia la API de Telegram (conexión keep-alive)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+        return _session
+
+
+class DeliveryResult:
+    """Resultado de un intento de envío."""
+
+    SENT  = "sent"
+    RETRY = "retry"   # Error transitorio (red, 429, 5xx): se puede reintentar
+    DROP  = "drop"    # Error definitivo (ej: HTML inválido): reintentar no sirve
+
+    def __init__(self, status, retry_after=0.0, error=None):
+        self.status      = status
+        self.retry_after = retry_after
+        self.error       = error
+
+
+def _post_message(message):
+    """Un intento de envío a Telegram, clasificado como DeliveryResult."""
+    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+
+    payload = {
+        "chat_id":    TELEGRAM_CHAT_ID,
+        "text":       message,
+        "parse_mode": "HTML",
+    }
+
+    try:
+        with _send_lock:
+            response = get_telegram_session().post(url, json=payload, timeout=10)
+    except Exception as e:
+        return DeliveryResult(DeliveryResult.RETRY, error=str(e))
+
+    if response.status_code == 200:
+        return DeliveryResult(DeliveryResult.SENT)
+
+    if response.status_code == 429:
+        try:
+            retry_after = float(response.json()["parameters"]["retry_after"])
+        except Exception:
+            retry_after = 5.0
+        return DeliveryResult(DeliveryResult.RETRY, retry_after=retry_after, error="429 Too Many Requests")
+
+    if response.status_code >= 500:
+        return DeliveryResult(DeliveryResult.RETRY, error=f"HTTP {response.status_code}")
+    return DeliveryResult(DeliveryResult.DROP, error=response.text)
+
 
 def send_telegram_message(message):
     """
-    Envía un mensaje HTML al chat de Telegram configurado.
+    Envía un mensaje HTML al chat de Telegram configurado, en el momento.
 
     Usa parse_mode=HTML para permitir formato enriquecido en los mensajes
-    (negritas con <b>, enlaces con <a href>).
+    (negritas con <b>, enlaces con <a href>). Bloquea hasta recibir la
+    respuesta: los bots usan `queue_telegram_message`.
 
     Args:
         message (str): Contenido del mensaje. Puede contener HTML básico.
@@ -19,23 +119,335 @@ def send_telegram_message(message):
         print("   ⚠️ Telegram no configurado (Falta TOKEN o CHAT_ID). Mensaje omitido.")
         return False
 
-    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+    result = _post_message(message)
+    if result.status == DeliveryResult.SENT:
+        return True
+    print(f"   ❌ Error Telegram: {result.error}")
+    return False
 
-    payload = {
-        "chat_id":    TELEGRAM_CHAT_ID,
-        "text":       message,
-        "parse_mode": "HTML",
-    }
 
-    try:
-        response = requests.post(url, json=payload, timeout=10)
+class TokenBucket:
+    """
+    Limitador de ritmo: `rate` envíos por segundo con ráfagas de hasta `burst`.
+
+    `acquire()` bloquea lo justo para no superar el ritmo.
+    """
 
-        if response.status_code == 200:
-            return True
-        else:
-            print(f"   ❌ Error Telegram: {response.text}")
-            return False
+    def __init__(self, rate, burst=1):
+        self.rate    = float(rate)
+        self.burst   = max(1.0, float(burst))
+        self.tokens  = self.burst
+        self.updated = time.monotonic()
 
-    except Exception as e:
-        print(f"   ❌ Excepción al enviar a Telegram: {e}")
+    def acquire(self):
+        while True:
+            now          = time.monotonic()
+            self.tokens  = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            time.sleep((1 - self.tokens) / self.rate)
+
+
+class NotificationDispatcher:
+    """
+    Cola de mensajes hacia Telegram entregada por un hilo en segundo plano.
+
+    El hilo se inicia con el primer mensaje encolado; al iniciarse, vuelve a
+    encolar los mensajes que quedaron pendientes en disco.
+
+    Args:
+        sender (callable): Función que hace un intento de envío y retorna un
+                           DeliveryResult (por defecto, la API de Telegram).
+        pending_file (str): Archivo de mensajes pendientes entre ejecuciones.
+    """
+
+    def __init__(self, sender=_post_message, pending_file=PENDING_FILE):
+        from src.config import (
+            NOTIFY_BURST, NOTIFY_MAX_RETRIES, NOTIFY_QUEUE_SIZE, NOTIFY_RATE_PER_SECOND,
+        )
+
+        self.sender       = sender
+        self.pending_file = pending_file
+        self.max_retries  = NOTIFY_MAX_RETRIES
+        self.queue        = queue.Queue(maxsize=NOTIFY_QUEUE_SIZE)
+        self.bucket       = TokenBucket(NOTIFY_RATE_PER_SECOND, NOTIFY_BURST)
+        self.failed       = []      # Mensajes sin entregar, a persistir
+        self.in_flight    = None    # Mensaje que el hilo está enviando
+        self._lock        = threading.Lock()
+        self._stop        = threading.Event()
+        self._thread      = None
+        self._closed      = False   # Tras flush (al apagar) no se reinicia el hilo
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="telegram-dispatcher", daemon=True)
+            self._thread.start()
+
+            # Sin bloquear con el lock tomado: lo que no entra en la cola
+            # vuelve directo a disco para el próximo arranque.
+            pending  = self._load_pending()
+            overflow = []
+            for message in pending:
+                try:
+                    self.queue.put_nowait(message)
+                except queue.Full:
+                    overflow.append(message)
+            self.failed.extend(overflow)
+
+        if pending:
+            print(f"📨 {len(pending)} notificaciones pendientes de la ejecución anterior.")
+        if overflow:
+            print(f"   ⚠️ Cola de notificaciones llena: {len(overflow)} pendientes quedan para el próximo envío.")
+            self._save_pending()
+
+    def _put(self, message):
+        from src.config import NOTIFY_ENQUEUE_TIMEOUT_SECONDS
+
+        try:
+            self.queue.put(message, timeout=NOTIFY_ENQUEUE_TIMEOUT_SECONDS)
+        except queue.Full:
+            print("   ⚠️ Cola de notificaciones llena. El mensaje se guardó para el próximo envío.")
+            with self._lock:
+                self.failed.append(message)
+            self._save_pending()
+
+    def enqueue(self, message):
+        """
+        Encola un mensaje para enviarlo en segundo plano. No bloquea salvo con la cola llena.
+
+        Después de `flush` el mensaje se guarda en disco para el próximo arranque.
+        """
+        if self._closed:
+            with self._lock:
+                self.failed.append(message)
+            self._save_pending()
+            return
+        self._ensure_started()
+        self._put(message)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                message = self.queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            self.in_flight = message
+            try:
+                self._deliver(message)
+            finally:
+                self.in_flight = None
+                self.queue.task_done()
+
+    def _deliver(self, message):
+        """Envía un mensaje respetando el ritmo, el retry_after y los reintentos."""
+        backoff = 1.0
+        for attempt in range(1, self.max_retries + 1):
+            self.bucket.acquire()
+            result = self.sender(message)
+
+            if result.status == DeliveryResult.SENT:
+                return
+            if result.status == DeliveryResult.DROP:
+                print(f"   ❌ Telegram rechazó el mensaje: {result.error}")
+                return
+            if attempt == self.max_retries:
+                print(f"   ⚠️ Telegram: {result.error}. Se guarda el mensaje para el próximo envío.")
+                break
+
+            wait = result.retry_after or backoff
+            backoff = min(backoff * 2, 60)
+            print(f"   ⏳ Telegram: {result.error}. Reintento {attempt}/{self.max_retries} en {wait:.0f}s.")
+            if self._stop.wait(wait):
+                break
+
+        with self._lock:
+            self.failed.append(message)
+        self._save_pending()
+
+    def flush(self, timeout=None):
+        """
+        Espera a que se entreguen los mensajes encolados (hasta `timeout`
+        segundos), detiene el hilo y guarda en disco lo que quedó sin enviar.
+        Lo que se encole después también se guarda en disco.
+        """
+        from src.config import NOTIFY_FLUSH_TIMEOUT_SECONDS
+
+        self._closed = True
+        if self._thread is None:
+            return
+        deadline = time.monotonic() + (NOTIFY_FLUSH_TIMEOUT_SECONDS if timeout is None else timeout)
+        while self.queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.1)
+
+        self._stop.set()
+        self._thread.join(timeout=15)
+
+        remaining = []
+        if self._thread.is_alive() and self.in_flight is not None:
+            remaining.append(self.in_flight)
+        while True:
+            try:
+                remaining.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        with self._lock:
+            self.failed.extend(remaining)
+        self._save_pending()
+
+    def _load_pending(self):
+        if not os.path.exists(self.pending_file):
+            return []
+        try:
+            with open(self.pending_file, "r", encoding="utf-8") as f:
+                messages = json.load(f)
+            os.remove(self.pending_file)
+            return [message for message in messages if isinstance(message, str)]
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"⚠️ No se pudieron leer las notificaciones pendientes: {e}")
+            return []
+
+    def _save_pending(self):
+        """Persiste los mensajes sin entregar (escritura atómica)."""
+        with self._lock:
+            messages = list(self.failed)
+        if not messages:
+            return
+        tmp_path = f"{self.pending_file}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(messages, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.pending_file)
+        except OSError as e:
+            print(f"⚠️ No se pudieron guardar las notificaciones pendientes: {e}")
+
+
+# Instancia global compartida por todos los bots
+dispatcher = NotificationDispatcher()
+
+
+def queue_telegram_message(message):
+    """
+    Encola un mensaje HTML para el chat configurado (ver NotificationDispatcher).
+
+    Returns:
+        bool: False si Telegram no está configurado y el mensaje se descartó.
+    """
+    if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
+        print("   ⚠️ Telegram no configurado (Falta TOKEN o CHAT_ID). Mensaje omitido.")
         return False
+    dispatcher.enqueue(message)
+    return True
+
+
+def digest_pages(site, entries, limit=TELEGRAM_MAX_MESSAGE_LENGTH):
+    """
+    Arma los mensajes de un resumen: entradas numeradas desde 1, repartidas en
+    páginas de hasta `limit` caracteres (HTML incluido).
+
+    Cada entrada es una línea "N. <a href=...>título</a>" con un único link,
+    que es lo que usa el listener para resolver "ya lo vi N".
+
+    Args:
+        site (str): Nombre del sitio para el encabezado.
+        entries (list[tuple]): Tuplas (título, url, keyword | None) en orden.
+        limit (int): Largo máximo de cada mensaje.
+
+    Returns:
+        list[str]: Mensajes HTML listos para enviar.
+    """
+    lines = []
+    for number, (title, url, keyword) in enumerate(entries, start=1):
+        title = title if len(title) <= 300 else title[:299] + "…"  # Títulos anómalos
+        line  = f"{number}. <a href='{html.escape(url, quote=True)}'>{html.escape(title)}</a>"
+        if keyword:
+            line += f" · 🔑 {html.escape(keyword)}"
+        lines.append(line)
+
+    # Reservamos lugar para el encabezado más largo posible ("(12/12)").
+    header_room = len(f"📰 <b>{html.escape(site)}</b>: {len(entries)} ofertas nuevas (99/99)\n\n")
+    room        = max(200, limit - header_room)
+
+    chunks, current, size = [], [], 0
+    for line in lines:
+        if current and size + len(line) + 1 > room:
+            chunks.append(current)
+            current, size = [], 0
+        current.append(line)
+        size += len(line) + 1
+    if current:
+        chunks.append(current)
+
+    total = len(chunks)
+    pages = []
+    for index, chunk in enumerate(chunks, start=1):
+        page_label = f" ({index}/{total})" if total > 1 else ""
+        header     = f"📰 <b>{html.escape(site)}</b>: {len(entries)} ofertas nuevas{page_label}\n\n"
+        pages.append(header + "\n".join(chunk))
+    return pages
+
+
+class DigestBuffer:
+    """
+    Coincidencias acumuladas por sitio para el modo resumen.
+
+    `add` agrega una oferta; `flush(site)` encola el resumen del sitio. Con
+    NOTIFY_DIGEST_WINDOW_SECONDS > 0, un sitio que sigue encontrando ofertas
+    envía su resumen parcial cada vez que se cumple la ventana (se comprueba
+    al agregar). Es seguro usarlo desde varios hilos.
+    """
+
+    def __init__(self, send=None):
+        self.send    = send or queue_telegram_message
+        self.entries = {}  # sitio → [(título, url, keyword)]
+        self.started = {}  # sitio → momento de la primera entrada pendiente
+        self._lock   = threading.Lock()
+
+    def add(self, site, title, url, keyword=None):
+        from src.config import NOTIFY_DIGEST_WINDOW_SECONDS
+
+        with self._lock:
+            self.entries.setdefault(site, []).append((title, url, keyword))
+            self.started.setdefault(site, time.monotonic())
+            expired = (
+                NOTIFY_DIGEST_WINDOW_SECONDS > 0
+                and time.monotonic() - self.started[site] >= NOTIFY_DIGEST_WINDOW_SECONDS
+            )
+        if expired:
+            self.flush(site)
+
+    def flush(self, site=None):
+        """
+        Encola los resúmenes pendientes de un sitio (o de todos).
+
+        Returns:
+            int: Cantidad de ofertas incluidas.
+        """
+        with self._lock:
+            sites   = [site] if site is not None else list(self.entries)
+            pending = [(name, self.entries.pop(name, [])) for name in sites]
+            for name in sites:
+                self.started.pop(name, None)
+
+        sent = 0
+        for name, entries in pending:
+            if not entries:
+                continue
+            for page in digest_pages(name, entries):
+                self.send(page)
+            sent += len(entries)
+        return sent
+
+
+# Resumen compartido por todos los bots (modo NOTIFY_DIGEST_MODE)
+digest = DigestBuffer()
+
+
+def flush_notifications(timeout=None):
+    """Envía los resúmenes pendientes, entrega lo encolado y persiste lo que quede (al detener el bot)."""
+    digest.flush()
+    dispatcher.flush(timeout)
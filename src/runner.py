@@ -0,0 +1,241 @@
+"""
+Ejecución de los sitios de un ciclo, en serie o en paralelo.
+
+Con PARALLEL_WORKERS = 1 los sitios se recorren uno tras otro, compartiendo
+un único Chrome (comportamiento clásico, pensado para Termux). Con más
+workers, cada uno usa su propio Chrome y su propia carpeta de perfil, y toma
+sitios de una cola común hasta agotarla: el ciclo dura aproximadamente lo que
+el sitio más lento.
+
+En los dos casos los sitios corren en hilos de trabajo y el hilo principal
+queda libre para atender Telegram (on_idle) mientras tanto. Si se activa
+stop_event (/stop), no se inician más sitios y `run` espera a los que están
+en curso hasta RUNNER_STOP_TIMEOUT_SECONDS antes de cerrar los navegadores,
+para que el apagado no los cierre (ni el historial o la cola de Telegram)
+mientras un worker todavía los usa.
+
+Los resultados se unifican a través del historial (`history.claim` es
+atómico) y del envío a Telegram (serializado en src/notifications.py), de modo
+que dos workers nunca notifican la misma oferta.
+
+Un error en un sitio no interrumpe a los demás: se registra en el resumen del
+ciclo y el worker sigue con el siguiente.
+
+Cada worker conserva su BrowserSession (src/driver.py) entre ciclos, de modo
+que Chrome no se vuelve a iniciar en cada vuelta salvo que haya que reciclarlo.
+"""
+import queue
+import threading
+import time
+
+from src.driver import BrowserSession
+
+
+class SiteResult:
+    """Resultado de procesar un sitio dentro de un ciclo."""
+
+    __slots__ = ("site_name", "ok", "error", "seconds", "worker")
+
+    def __init__(self, site_name, ok, error=None, seconds=0.0, worker=0):
+        self.site_name = site_name
+        self.ok        = ok
+        self.error     = error
+        self.seconds   = seconds
+        self.worker    = worker
+
+
+class _Worker:
+    """Worker que procesa sitios sobre su propia sesión de navegador."""
+
+    def __init__(self, session, tagged=False):
+        self.session = session
+        self.prefix  = f"[W{session.worker_index}] " if tagged else ""
+
+    def run_site(self, site_name, bot_class):
+        prefix = self.prefix
+        print(f"\n🚀 {prefix}PROCESANDO: {site_name}")
+        started = time.perf_counter()
+        worker  = self.session.worker_index
+        bot     = None
+        try:
+            # El bot recibe el proveedor: Chrome se inicia (o se verifica) solo si lo usa.
+            bot = bot_class(self.session.driver)
+            bot.search()
+            traffic = bot.traffic_summary()
+            if traffic:
+                print(f"   📶 {prefix}Tráfico de {site_name}: {traffic}")
+            if bot.wait_stats.waits:
+                print(f"   ⏱️ {prefix}Esperas de {site_name}: {bot.wait_stats.describe()}")
+            if bot.verdict_stats.lookups:
+                print(f"   💾 {prefix}Cache de idioma de {site_name}: {bot.verdict_stats.describe()}")
+            return SiteResult(site_name, True, seconds=time.perf_counter() - started, worker=worker)
+        except Exception as e:
+            print(f"\n❌ {prefix}Error en {site_name}: {e}")
+            return SiteResult(site_name, False, error=str(e), seconds=time.perf_counter() - started, worker=worker)
+        finally:
+            if bot is not None:
+                bot.close()
+
+
+class SiteRunner:
+    """
+    Reparte los sitios de un ciclo entre uno o más workers.
+
+    Args:
+        site_bots (list): Pares (nombre, clase de bot) en el orden configurado.
+        workers (int): Cantidad de workers. 1 mantiene la ejecución en serie.
+        on_idle (callable): Función que se invoca en el hilo principal
+                            periódicamente mientras los workers trabajan. Se
+                            usa para atender los mensajes de Telegram.
+        idle_interval (float): Segundos entre llamadas a on_idle.
+        stop_event (threading.Event): Si se activa, el ciclo se interrumpe.
+    """
+
+    def __init__(self, site_bots, workers=1, on_idle=None, idle_interval=0.5, stop_event=None):
+        from src.config import KEEP_BROWSER_WARM, RUNNER_STOP_TIMEOUT_SECONDS
+
+        self.site_bots     = list(site_bots)
+        self.workers       = max(1, int(workers))
+        self.on_idle       = on_idle
+        self.idle_interval = idle_interval
+        self.stop_event    = stop_event
+        self.stop_timeout  = RUNNER_STOP_TIMEOUT_SECONDS
+        self.keep_warm     = KEEP_BROWSER_WARM
+        self._sessions     = {}
+        self._threads      = []
+
+    def _session(self, index):
+        if index not in self._sessions:
+            self._sessions[index] = BrowserSession(index)
+        return self._sessions[index]
+
+    def ordered_sites(self):
+        """
+        Orden de ejecución de los sitios.
+
+        En serie, los sitios sin navegador (HTTP/API) van primero para que
+        Chrome no ocupe memoria mientras corren. En paralelo se invierte: los
+        sitios con navegador son los más lentos y conviene arrancarlos antes.
+        """
+        parallel = self.workers > 1
+        return sorted(self.site_bots, key=lambda site: site[1].needs_browser() != parallel)
+
+    def run(self):
+        """
+        Ejecuta un ciclo completo.
+
+        Returns:
+            list[SiteResult]: Un resultado por sitio, en orden de finalización.
+        """
+        sites = self.ordered_sites()
+        try:
+            if self.workers == 1 or len(sites) <= 1:
+                results = self._run_serial(sites)
+            else:
+                results = self._run_parallel(sites)
+        finally:
+            self._end_cycle()
+        self._print_summary(results)
+        return results
+
+    def _end_cycle(self):
+        """Cierra los navegadores o los deja listos para el próximo ciclo."""
+        for session in self._sessions.values():
+            if self.keep_warm:
+                session.end_cycle()
+            elif session.is_open:
+                print(f"🔒 Cerrando navegador del worker {session.worker_index} para liberar memoria.")
+                session.close()
+
+    def close(self):
+        """
+        Cierra todos los navegadores (al detener el bot).
+
+        Si el ciclo se cortó sin pasar por stop_event (Ctrl+C), primero espera
+        a los workers que sigan activos, igual que tras /stop.
+        """
+        self._join_stopped(self._threads)
+        for session in self._sessions.values():
+            session.close()
+
+    def _idle(self):
+        if self.on_idle is None:
+            return
+        try:
+            self.on_idle()
+        except Exception as e:
+            print(f"⚠️ Error chequeando Telegram: {e}")
+
+    def _run_serial(self, sites):
+        return self._run_workers(sites, 1, tagged=False)
+
+    def _run_parallel(self, sites):
+        worker_count = min(self.workers, len(sites))
+        print(f"⚡ Ejecutando {len(sites)} sitios con {worker_count} workers en paralelo.")
+        return self._run_workers(sites, worker_count, tagged=True)
+
+    def _stopping(self):
+        return self.stop_event is not None and self.stop_event.is_set()
+
+    def _run_workers(self, sites, worker_count, tagged):
+        pending = queue.Queue()
+        for site in sites:
+            pending.put(site)
+
+        results      = []
+        results_lock = threading.Lock()
+
+        def work(worker):
+            while not self._stopping():
+                try:
+                    site_name, bot_class = pending.get_nowait()
+                except queue.Empty:
+                    return
+                result = worker.run_site(site_name, bot_class)
+                with results_lock:
+                    results.append(result)
+
+        threads = [
+            threading.Thread(
+                target=work, args=(_Worker(self._session(index), tagged=tagged),),
+                name=f"site-worker-{index}", daemon=True,
+            )
+            for index in range(worker_count)
+        ]
+        self._threads = threads
+        for thread in threads:
+            thread.start()
+
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(timeout=self.idle_interval / len(threads))
+            self._idle()
+            if self._stopping():
+                print("🛑 Ciclo interrumpido: no se inician más sitios.")
+                self._join_stopped(threads)
+                break
+
+        with results_lock:
+            return list(results)
+
+    def _join_stopped(self, threads):
+        """Espera a los sitios en curso tras /stop, como máximo `stop_timeout` segundos."""
+        running = [thread for thread in threads if thread.is_alive()]
+        if not running:
+            return
+        print(f"   ⏳ Esperando a {len(running)} sitio(s) en curso (hasta {self.stop_timeout}s)...")
+        deadline = time.monotonic() + self.stop_timeout
+        for thread in running:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+        still_running = sum(thread.is_alive() for thread in running)
+        if still_running:
+            print(f"   ⚠️ {still_running} sitio(s) no terminaron a tiempo: se cierran igual.")
+
+    def _print_summary(self, results):
+        failed = [result for result in results if not result.ok]
+        print("\n📊 Resumen del ciclo:")
+        for result in results:
+            icon = "✅" if result.ok else "❌"
+            print(f"   {icon} {result.site_name}: {result.seconds:.1f}s")
+        if failed:
+            print(f"   ⚠️ {len(failed)} sitio(s) con errores.")
@@ -1,17 +1,45 @@
 from src.sites.base import BaseBot
 from src.history import normalize_url
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
+from urllib.parse import urlparse
+import time
 
 
 class AndreaniBot(BaseBot):
     """
     Bot de búsqueda para el portal de empleos de Andreani (Oracle Cloud HCM).
 
-    Escanea la primera vista del listado de ofertas disponibles y notifica
-    las que coincidan con las palabras clave configuradas.
+    El sitio Candidate Experience es una SPA que se alimenta del recurso REST
+    `recruitingCEJobRequisitions` (finder `findReqs`), paginado por offset.
+    El bot consulta ese recurso directamente y obtiene TODAS las búsquedas
+    abiertas en pocos requests, en lugar de solo las que muestra el primer
+    render. El navegador queda como respaldo si la API falla.
     """
 
+    USE_API = True
+
+    # Configurables para apuntar el cliente a un servidor local de prueba.
+    API_BASE_URL = "https://ibmzjb.fa.ocs.oraclecloud.com"
+    SITE_NUMBER  = "CX_1001"
+
+    # El detalle de cada búsqueda es .../job/<id de requisición>.
+    URL_RULES = {
+        "name":       "andreani",
+        "hosts":      (urlparse(API_BASE_URL).hostname,),
+        "id_pattern": r"/job/(\d+)",
+    }
+
+    PAGE_SIZE   = 25
+    MAX_RESULTS = 500
+
+    # Tarjetas del listado (respaldo con navegador).
+    LISTING_SPEC = {
+        "card": ".job-list-item",
+        "fields": {
+            "title": (".job-tile__title", "text"),
+            "url":   (".job-list-item__link", "href"),
+        },
+    }
+
     def login(self):
         pass  # No requiere autenticación
 
@@ -24,34 +52,31 @@ class AndreaniBot(BaseBot):
         print(f"🔍 Escaneando Andreani...")
         self.notify("🤖 Buscando chamba por Andreani!")
 
-        target_url = "https://ibmzjb.fa.ocs.oraclecloud.com/hcmUI/CandidateExperience/es/sites/CX_1001/jobs"
-
-        self.driver.get(target_url)
-        self.random_sleep(3, 5)
+        job_cards = None
 
-        try:
-            print("   ⏳ Esperando carga de ofertas...")
-            self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "job-list-item")))
-            self.random_sleep(2, 3)
-        except Exception:
-            print("   ⚠️ No se detectaron ofertas o tardó mucho en cargar.")
-            return
+        if self.uses_api():
+            started = time.perf_counter()
+            try:
+                job_cards = self.fetch_api_requisitions()
+                print(f"   ⏱️ API Oracle HCM: {len(job_cards)} ofertas en {time.perf_counter() - started:.1f}s")
+            except Exception as e:
+                print(f"   ⚠️ Falló la API de Oracle HCM ({e}). Usando el navegador.")
 
-        job_cards = self.driver.find_elements(By.CLASS_NAME, "job-list-item")
+        if job_cards is None:
+            started   = time.perf_counter()
+            job_cards = self.fetch_browser_requisitions()
+            print(f"   ⏱️ Navegador: {len(job_cards)} ofertas en {time.perf_counter() - started:.1f}s")
 
         if not job_cards:
             print("   ⚠️ No se encontraron tarjetas de empleo.")
             return
 
-        print(f"   -> Analizando {len(job_cards)} ofertas visibles...")
+        print(f"   -> Analizando {len(job_cards)} ofertas...")
 
         for card in job_cards:
             try:
-                title_element = card.find_element(By.CLASS_NAME, "job-tile__title")
-                title_text    = title_element.text.lower()
-
-                link_element = card.find_element(By.CLASS_NAME, "job-list-item__link")
-                url_oferta   = normalize_url(link_element.get_attribute("href"))
+                title_text = (card["title"] or "").lower()
+                url_oferta = normalize_url(card["url"])
 
                 if not title_text or len(title_text) < 3:
                     continue
@@ -65,14 +90,100 @@ class AndreaniBot(BaseBot):
                     print(f"         ✨ ¡MATCH! Coincide con '{match_keyword}'")
                     print(f"            🔗 URL: {url_oferta}")
 
-                    self.notify(
+                    self.notify_match(
                         f"✨ <b>¡NUEVA OFERTA EN ANDREANI!</b>\n\n"
                         f"📌 <b>Cargo:</b> {title_text.title()}\n"
                         f"🔑 <b>Match:</b> {match_keyword}\n"
-                        f"🔗 <a href='{url_oferta}'>Ver Oferta</a>"
+                        f"🔗 <a href='{url_oferta}'>Ver Oferta</a>",
+                        url=url_oferta, title=title_text.title(), keyword=match_keyword,
                     )
 
             except Exception:
                 continue
 
         print("   ✅ Escaneo de Andreani finalizado.")
+
+    def job_url(self, requisition_id):
+        """URL pública del detalle de una búsqueda en Candidate Experience."""
+        return f"{self.API_BASE_URL}/hcmUI/CandidateExperience/es/sites/{self.SITE_NUMBER}/job/{requisition_id}"
+
+    def fetch_api_requisitions(self):
+        """
+        Recorre el finder `findReqs` de recruitingCEJobRequisitions por offset.
+
+        El recorrido termina en la primera página vacía (o que falle) y se
+        conservan las búsquedas ya obtenidas: solo una primera página inválida
+        se considera una falla de la API.
+
+        Returns:
+            list[dict]: Búsquedas con las claves 'title', 'url', 'location' y 'posted'.
+
+        Raises:
+            requests.RequestException | ValueError: Si la primera página no
+            responde o su formato no es el esperado (el llamador recurre al navegador).
+        """
+        import requests
+        from src.http_backend import get_session, REQUEST_TIMEOUT
+
+        session      = get_session()
+        requisitions = []
+        offset       = 0
+
+        while offset < self.MAX_RESULTS:
+            # El finder usa ';' y ',' como separadores propios, por eso se arma a mano.
+            api_url = (
+                f"{self.API_BASE_URL}/hcmRestApi/resources/latest/recruitingCEJobRequisitions"
+                f"?onlyData=true&expand=requisitionList"
+                f"&finder=findReqs;siteNumber={self.SITE_NUMBER},"
+                f"limit={self.PAGE_SIZE},offset={offset},sortBy=POSTING_DATES_DESC"
+            )
+            try:
+                response = session.get(api_url, timeout=REQUEST_TIMEOUT, headers={"Accept": "application/json"})
+                response.raise_for_status()
+
+                items = response.json().get("items")
+                if not items:
+                    raise ValueError("Respuesta de Oracle HCM sin 'items'")
+            except (requests.RequestException, ValueError) as e:
+                if offset == 0:
+                    raise
+                print(f"   ⚠️ Oracle HCM: se corta en el offset {offset} ({e}); se conservan {len(requisitions)} ofertas.")
+                break
+
+            search_result = items[0]
+            page  = search_result.get("requisitionList") or []
+            total = search_result.get("TotalJobsCount", 0)
+
+            if not page:
+                break
+
+            for requisition in page:
+                if not requisition.get("Id"):
+                    continue
+                requisitions.append({
+                    "title":    requisition.get("Title", ""),
+                    "url":      self.job_url(requisition["Id"]),
+                    "location": requisition.get("PrimaryLocation", ""),
+                    "posted":   requisition.get("PostedDate", ""),
+                })
+
+            offset += self.PAGE_SIZE
+            if offset >= total:
+                break
+
+        return requisitions
+
+    def fetch_browser_requisitions(self):
+        """
+        Respaldo: escanea la primera vista del listado con el navegador.
+
+        Returns:
+            list[dict]: Búsquedas con las claves 'title' y 'url'.
+        """
+        target_url = f"{self.API_BASE_URL}/hcmUI/CandidateExperience/es/sites/{self.SITE_NUMBER}/jobs"
+
+        print("   ⏳ Esperando carga de ofertas...")
+        requisitions = self.fetch_listing(target_url)
+        if not requisitions:
+            print("   ⚠️ No se detectaron ofertas o tardó mucho en cargar.")
+        return [card for card in requisitions if card["title"] and card["url"]]
@@ -4,8 +4,123 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 import random
-from src.notifications import send_telegram_message
+from src.notifications import digest, queue_telegram_message
 from src.history import history, normalize_url
+from src.canonical import register_site_rules
+from src.matcher import get_keyword_matcher
+from src.driver import TRACKER_HOSTS
+from src.verdict_cache import CacheStats, verdict_cache
+
+
+# Scripts de las esperas adaptativas (se ejecutan en la página).
+_CSS_COUNT_SCRIPT   = "return document.querySelectorAll(arguments[0]).length;"
+_XPATH_COUNT_SCRIPT = (
+    "return document.evaluate(arguments[0], document, null,"
+    " XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;"
+)
+_TEXT_LENGTH_SCRIPT = (
+    "const node = document.querySelector(arguments[0]);"
+    " return node ? node.innerText.length : 0;"
+)
+
+# Extractor de listados: aplica un LISTING_SPEC sobre el DOM en una sola
+# llamada y retorna un registro plano por tarjeta (ver BaseBot.extract_listing).
+_EXTRACT_SCRIPT = """
+const spec = arguments[0];
+let cards;
+if (spec.card.startsWith("/") || spec.card.startsWith("(")) {
+    const found = document.evaluate(spec.card, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    cards = [];
+    for (let i = 0; i < found.snapshotLength; i++) cards.push(found.snapshotItem(i));
+} else {
+    cards = Array.from(document.querySelectorAll(spec.card));
+}
+return cards.map(card => {
+    const record = {};
+    for (const [name, [selector, attribute]] of Object.entries(spec.fields)) {
+        if (attribute === "exists") {
+            record[name] = selector ? card.querySelector(selector) !== null : true;
+            continue;
+        }
+        const node = selector ? card.querySelector(selector) : card;
+        if (!node) {
+            record[name] = null;
+        } else if (attribute === "text") {
+            record[name] = (node.innerText || node.textContent || "").trim();
+        } else if ((attribute === "href" || attribute === "src") && node[attribute]) {
+            record[name] = node[attribute];  // URL absoluta, igual que get_attribute
+        } else {
+            record[name] = node.getAttribute(attribute);
+        }
+    }
+    return record;
+});
+"""
+
+
+# Descarga en lote de detalles desde la página (ver check_languages_in_descriptions).
+# Corre hasta `concurrency` fetch() a la vez con la sesión del navegador y
+# retorna [{status, html} | {status: 0, error}] en el mismo orden que las URLs.
+_FETCH_SCRIPT = """
+const [urls, concurrency, timeoutMs, maxLength, done] = arguments;
+const results = new Array(urls.length);
+let next = 0;
+async function worker() {
+    while (next < urls.length) {
+        const index = next++;
+        const controller = new AbortController();
+        const timer = setTimeout(() => controller.abort(), timeoutMs);
+        try {
+            const response = await fetch(urls[index], {credentials: "include", signal: controller.signal});
+            const html = response.ok ? (await response.text()).slice(0, maxLength) : null;
+            results[index] = {status: response.status, html: html};
+        } catch (error) {
+            results[index] = {status: 0, error: String(error)};
+        } finally {
+            clearTimeout(timer);
+        }
+    }
+}
+Promise.all(Array.from({length: Math.min(concurrency, urls.length)}, worker)).then(() => done(results));
+"""
+
+# HTML máximo por detalle descargado desde la página, y texto mínimo para
+# considerar que el detalle no depende de JavaScript.
+MAX_FETCHED_HTML_LENGTH = 1_500_000
+MIN_FETCHED_TEXT_LENGTH = 200
+
+
+class WaitStats:
+    """Estadísticas de espera de un sitio: tiempo esperando señales, pausas y ahorro estimado."""
+
+    __slots__ = ("waits", "waited", "replaced", "timeouts", "pauses", "paused")
+
+    def __init__(self):
+        self.waits    = 0
+        self.waited   = 0.0
+        self.replaced = 0.0  # Suma de las pausas fijas que reemplazaron las esperas
+        self.timeouts = 0
+        self.pauses   = 0
+        self.paused   = 0.0
+
+    def record(self, seconds, replaces, satisfied):
+        self.waits    += 1
+        self.waited   += seconds
+        self.replaced += replaces
+        if not satisfied:
+            self.timeouts += 1
+
+    def record_pause(self, seconds):
+        self.pauses += 1
+        self.paused += seconds
+
+    def describe(self):
+        saved = self.replaced - self.waited - self.paused
+        return (
+            f"{self.waits} esperas ({self.waited:.1f}s, {self.timeouts} sin señal), "
+            f"{self.pauses} pausas humanas ({self.paused:.1f}s), "
+            f"ahorro estimado frente a pausas fijas: {saved:.1f}s"
+        )
 
 
 class BaseBot(ABC):
@@ -18,23 +133,391 @@ class BaseBot(ABC):
 
     Herencia: Todas las clases de sitios (BumeranBot, ComputrabajoBot, etc.)
     extienden esta clase y están obligadas a implementar el método `search`.
+
+    Backend HTTP: los sitios con listados renderizados en el servidor pueden
+    declarar USE_HTTP_BACKEND = True y un LISTING_SPEC (ver src/http_backend.py).
+    En ese caso `fetch_listing` descarga las páginas con requests y el
+    navegador no se inicia para ese sitio.
     """
 
-    def __init__(self, driver):
-        self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+    # Opt-in por sitio al backend HTTP (requiere LISTING_SPEC).
+    USE_HTTP_BACKEND = False
+
+    # Especificación declarativa de las tarjetas del listado, válida para el
+    # backend HTTP y para el navegador (ver extract_listing):
+    # {"card": selector, "fields": {nombre: (selector, atributo)}}
+    LISTING_SPEC = None
+
+    # Opt-in por sitio a una API JSON propia del portal. El navegador queda
+    # solo como respaldo si la API falla.
+    USE_API = False
+
+    # Recursos que Chrome no descarga para este sitio (ver src/driver.py):
+    # tipos de RESOURCE_TYPE_PATTERNS y hosts de terceros. Ningún bot lee
+    # imágenes, fuentes ni videos; un sitio puede ampliar o vaciar la lista.
+    BLOCKED_RESOURCE_TYPES = ("image", "font", "media")
+    BLOCKED_HOSTS          = tuple(TRACKER_HOSTS)
+
+    # Reglas de canonicalización de las URLs del sitio (ver src/canonical.py):
+    # {"name", "hosts", "tracking_params", "path_rewrites", "id_pattern"}.
+    # Se registran al definir la clase.
+    URL_RULES = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get("URL_RULES"):
+            register_site_rules(**cls.URL_RULES)
+
+    def __init__(self, driver=None):
+        """
+        Args:
+            driver: Instancia de WebDriver, o una función sin argumentos que la
+                    retorna. Con una función, Chrome solo se inicia si el bot
+                    realmente necesita el navegador.
+        """
+        self._driver          = None
+        self._driver_provider = None
+        self._wait            = None
+        self.traffic          = None  # NetworkStats acumuladas por load_page
+        self.wait_stats       = WaitStats()
+        self.verdict_stats    = CacheStats()  # Aciertos del cache de veredictos de idioma
+        self._network         = None
+        self._bridge          = None  # CookieBridge, creado al descargar detalles
+        self._detail_pool     = None
+
+        if callable(driver):
+            self._driver_provider = driver
+        else:
+            self._driver = driver
+
+    @property
+    def driver(self):
+        """WebDriver del bot. Se obtiene del proveedor la primera vez que se usa."""
+        if self._driver is None and self._driver_provider is not None:
+            self._driver = self._driver_provider()
+        return self._driver
+
+    @property
+    def wait(self):
+        """WebDriverWait de 10 segundos sobre el driver del bot."""
+        if self._wait is None:
+            self._wait = WebDriverWait(self.driver, 10)
+        return self._wait
+
+    @classmethod
+    def uses_http_backend(cls):
+        """True si el sitio se procesa por HTTP, sin navegador."""
+        from src.config import HTTP_BACKEND_ENABLED
+        return bool(HTTP_BACKEND_ENABLED and cls.USE_HTTP_BACKEND and cls.LISTING_SPEC)
+
+    @classmethod
+    def uses_api(cls):
+        """True si el sitio se consulta primero mediante su API JSON."""
+        from src.config import HTTP_BACKEND_ENABLED
+        return bool(HTTP_BACKEND_ENABLED and cls.USE_API)
+
+    @classmethod
+    def needs_browser(cls):
+        """
+        True si el sitio requiere Chrome para ejecutarse.
+
+        Los sitios con API lo usan solo como respaldo: el navegador se inicia
+        recién si la API falla (ver el proveedor de driver en __init__).
+        """
+        return not (cls.uses_http_backend() or cls.uses_api())
 
     @abstractmethod
     def search(self, keyword=None):
         """Implementa la lógica de búsqueda y notificación para el sitio correspondiente."""
         pass
 
-    def random_sleep(self, min_seconds=2, max_seconds=5):
+    # ------------------------------------------------------------------
+    # ESPERAS ADAPTATIVAS
+    # ------------------------------------------------------------------
+    #
+    # En lugar de dormir un tiempo fijo, cada espera consulta una señal real
+    # (readyState, cantidad de elementos estable, red inactiva, cambio de URL)
+    # y retorna en cuanto se cumple. El parámetro `replaces` indica la pausa
+    # fija que reemplaza y solo se usa para estimar el tiempo ahorrado.
+
+    def human_pause(self):
+        """Pausa deliberada y breve entre acciones (HUMAN_DELAY_* en la configuración)."""
+        from src.config import HUMAN_DELAY_MIN_SECONDS, HUMAN_DELAY_MAX_SECONDS
+
+        seconds = random.uniform(HUMAN_DELAY_MIN_SECONDS, HUMAN_DELAY_MAX_SECONDS)
+        if seconds > 0:
+            time.sleep(seconds)
+        self.wait_stats.record_pause(seconds)
+
+    def wait_until(self, condition, timeout=None, replaces=0.0, interval=0.1):
+        """
+        Espera hasta que `condition()` retorne un valor verdadero.
+
+        Las excepciones de la condición (elemento inexistente, pestaña
+        cerrándose) se consideran "todavía no".
+
+        Returns:
+            El último valor de la condición (falso si se agotó el tiempo).
+        """
+        from src.config import WAIT_TIMEOUT_SECONDS
+
+        timeout  = WAIT_TIMEOUT_SECONDS if timeout is None else timeout
+        started  = time.monotonic()
+        deadline = started + timeout
+        result   = None
+
+        while True:
+            try:
+                result = condition()
+            except Exception:
+                result = None
+            if result or time.monotonic() >= deadline:
+                break
+            time.sleep(interval)
+
+        self.wait_stats.record(time.monotonic() - started, replaces, bool(result))
+        return result
+
+    def wait_ready(self, timeout=None, replaces=0.0):
+        """Espera a que el documento actual deje de estar en 'loading'."""
+        return self.wait_until(
+            lambda: self.driver.execute_script(
+                "return location.href !== 'about:blank' && document.readyState !== 'loading';"
+            ),
+            timeout, replaces,
+        )
+
+    def wait_url_change(self, previous_url, timeout=None, replaces=0.0):
+        """Espera a que la URL de la pestaña sea distinta de `previous_url` (navegación o pushState)."""
+        return self.wait_until(lambda: self.driver.current_url != previous_url, timeout, replaces)
+
+    def wait_for_stable(self, selector, by=By.CSS_SELECTOR, stable_ms=None, timeout=None, replaces=0.0):
+        """
+        Espera a que la cantidad de elementos que coinciden con el selector sea
+        mayor a cero y no cambie durante `stable_ms` milisegundos.
+
+        Sirve para listados que se completan de a poco (SPA, lazy loading).
+
+        Returns:
+            int: Cantidad de elementos encontrados (0 si no apareció ninguno).
         """
-        Pausa la ejecución por un intervalo aleatorio.
-        Simula tiempos de lectura humanos para reducir la detección automatizada.
+        script = _XPATH_COUNT_SCRIPT if by == By.XPATH else _CSS_COUNT_SCRIPT
+        return self._wait_stable_value(script, selector, stable_ms, timeout, replaces)
+
+    def wait_for_text_stable(self, selector="body", stable_ms=None, timeout=None, replaces=0.0):
         """
-        time.sleep(random.uniform(min_seconds, max_seconds))
+        Espera a que el texto del primer elemento del selector deje de cambiar.
+
+        Returns:
+            int: Largo del texto estable (0 si el elemento no apareció).
+        """
+        return self._wait_stable_value(_TEXT_LENGTH_SCRIPT, selector, stable_ms, timeout, replaces)
+
+    def _wait_stable_value(self, script, argument, stable_ms, timeout, replaces):
+        from src.config import DOM_STABLE_MS, WAIT_TIMEOUT_SECONDS
+
+        stable_seconds = (DOM_STABLE_MS if stable_ms is None else stable_ms) / 1000
+        timeout        = WAIT_TIMEOUT_SECONDS if timeout is None else timeout
+        started        = time.monotonic()
+        deadline       = started + timeout
+        last_value     = None
+        stable_since   = started
+
+        while True:
+            try:
+                value = self.driver.execute_script(script, argument) or 0
+            except Exception:
+                value = 0
+            now = time.monotonic()
+            if value != last_value:
+                last_value, stable_since = value, now
+            elif value and now - stable_since >= stable_seconds:
+                break
+            if now >= deadline:
+                break
+            time.sleep(0.1)
+
+        self.wait_stats.record(time.monotonic() - started, replaces, bool(last_value))
+        return last_value or 0
+
+    def wait_network_idle(self, idle_ms=None, timeout=None, max_inflight=0, replaces=0.0):
+        """
+        Espera a que la pestaña no tenga requests en curso durante `idle_ms`.
+
+        Usa los eventos de red de DevTools (log de rendimiento). Si el log no
+        está disponible, se limita a esperar el readyState del documento.
+        """
+        from src.config import NETWORK_IDLE_MS
+
+        monitor = self.network_monitor()
+        if monitor is None:
+            return self.wait_ready(timeout, replaces)
+
+        idle_seconds = (NETWORK_IDLE_MS if idle_ms is None else idle_ms) / 1000
+
+        def is_idle():
+            self._collect_traffic(monitor.poll())
+            return len(monitor.inflight) <= max_inflight and time.monotonic() - monitor.last_activity >= idle_seconds
+
+        return self.wait_until(is_idle, timeout, replaces, interval=0.1)
+
+    def network_monitor(self):
+        """NetworkMonitor del driver del bot, o None si el log de red no está disponible."""
+        from src.driver import NetworkMonitor
+
+        if self._network is None:
+            self._network = NetworkMonitor(self.driver)
+        return self._network if self._network.available else None
+
+    def _collect_traffic(self, stats):
+        from src.driver import NetworkStats
+
+        if stats is None:
+            return
+        if self.traffic is None:
+            self.traffic = NetworkStats()
+        self.traffic.add(stats)
+
+    # ------------------------------------------------------------------
+    # NAVEGACIÓN
+    # ------------------------------------------------------------------
+
+    def load_page(self, url):
+        """
+        Navega a una URL aplicando la política de recursos del sitio.
+
+        Con pageLoadStrategy 'eager' retorna apenas el DOM está listo; el
+        llamador espera luego la señal que necesite (ver `wait_*`).
+
+        Informa el tráfico de la página (requests, KB descargados y recursos
+        bloqueados) y lo acumula en `self.traffic` para el resumen del sitio.
+        """
+        from src.driver import apply_resource_policy
+
+        apply_resource_policy(self.driver, self.BLOCKED_RESOURCE_TYPES, self.BLOCKED_HOSTS)
+
+        # Lo que quedó en el log (pedidos tardíos de la página anterior) se
+        # suma al total del sitio, pero no a la página nueva.
+        monitor = self.network_monitor()
+        if monitor is not None:
+            self._collect_traffic(monitor.poll())
+            monitor.reset()
+
+        self.driver.get(url)
+
+        if self._bridge is not None:
+            try:
+                self._bridge.sync()
+            except Exception as e:
+                print(f"   ⚠️ No se pudieron sincronizar las cookies: {e}")
+
+        if monitor is None:
+            return
+        stats = monitor.poll()
+        if stats is not None:
+            self._collect_traffic(stats)
+            print(f"   📶 {stats.describe()}")
+
+    def open_tab(self, url, replaces=0.0):
+        """
+        Abre una URL en una pestaña nueva, cambia a ella y espera el documento.
+
+        Returns:
+            str | None: Handle de la pestaña original (para `close_tab`), o
+                        None si la pestaña no llegó a abrirse.
+        """
+        original_window = self.driver.current_window_handle
+        known_handles   = set(self.driver.window_handles)
+
+        self.driver.execute_script("window.open(arguments[0], '_blank');", url)
+        new_handles = self.wait_until(
+            lambda: [h for h in self.driver.window_handles if h not in known_handles],
+            timeout=10,
+        )
+        if not new_handles:
+            return None
+
+        self.driver.switch_to.window(new_handles[-1])
+        self.wait_ready(replaces=replaces)
+        return original_window
+
+    def close_tab(self, original_window):
+        """Cierra la pestaña actual y vuelve a `original_window`."""
+        try:
+            if self.driver.current_window_handle != original_window:
+                self.driver.close()
+        finally:
+            self.driver.switch_to.window(original_window)
+
+    def traffic_summary(self):
+        """Resumen del tráfico de red del sitio, o None si no usó el navegador."""
+        if self.traffic is None:
+            return None
+        return self.traffic.describe()
+
+    def fetch_listing(self, url):
+        """
+        Carga una página de listado y retorna sus tarjetas según LISTING_SPEC.
+
+        Con el backend HTTP la página se descarga y parsea sin navegador.
+        Con Selenium se navega, se espera a que la cantidad de tarjetas se
+        estabilice y se leen todas con `extract_listing`.
+
+        Args:
+            url (str): URL de la página de resultados.
+
+        Returns:
+            list[dict]: Una entrada por tarjeta con los campos de LISTING_SPEC.
+        """
+        spec = self.LISTING_SPEC
+
+        if self.uses_http_backend():
+            from src.http_backend import fetch_records
+            try:
+                return fetch_records(url, spec)
+            except Exception as e:
+                print(f"   ⚠️ Error descargando {url}: {e}")
+                return []
+
+        self.load_page(url)
+        by = By.XPATH if spec["card"].startswith(("/", "(")) else By.CSS_SELECTOR
+        if not self.wait_for_stable(spec["card"], by=by, replaces=3.5):
+            return []
+        self.human_pause()
+
+        return self.extract_listing(spec)
+
+    def extract_listing(self, spec=None):
+        """
+        Lee todas las tarjetas de la página actual con una sola llamada al navegador.
+
+        Un script inyectado aplica la especificación (por defecto LISTING_SPEC)
+        sobre el DOM y retorna diccionarios planos, en lugar de consultar cada
+        campo de cada WebElement por separado. Un selector de tarjeta que empieza
+        con '/' o '(' se interpreta como XPath.
+
+        Returns:
+            list[dict]: Una entrada por tarjeta, en orden de documento.
+        """
+        spec = spec or self.LISTING_SPEC
+        try:
+            return self.driver.execute_script(_EXTRACT_SCRIPT, spec) or []
+        except Exception as e:
+            print(f"   ⚠️ No se pudo leer el listado: {e}")
+            return []
+
+    def card_element(self, spec, index):
+        """
+        WebElement de la tarjeta `index` de un listado extraído con `extract_listing`.
+
+        Solo hace falta para interactuar con la tarjeta (por ejemplo, hacer clic).
+
+        Returns:
+            WebElement | None: La tarjeta, o None si el listado cambió.
+        """
+        by    = By.XPATH if spec["card"].startswith(("/", "(")) else By.CSS_SELECTOR
+        cards = self.driver.find_elements(by, spec["card"])
+        return cards[index] if index < len(cards) else None
 
     def safe_click(self, by, value):
         """
@@ -87,6 +570,9 @@ class BaseBot(ABC):
         - Palabras alfanuméricas: usa \\b (ej: 'sr' no matchea dentro de 'ssr').
         - Palabras con símbolos (C#, .Net): usa lookahead/lookbehind negativos.
 
+        Las listas se compilan en un KeywordMatcher (ver src/matcher.py) que se
+        reutiliza mientras no cambien, en lugar de armar una regex por palabra.
+
         Args:
             job_title (str): Título del aviso de empleo.
             search_keywords (list): Términos que deben estar presentes (al menos uno).
@@ -95,42 +581,53 @@ class BaseBot(ABC):
         Returns:
             str | None: La keyword que produjo el match, o None si la oferta se descarta.
         """
-        import re
+        return get_keyword_matcher(search_keywords, negative_keywords).match(job_title)
 
-        normalized_title = job_title.lower()
-
-        def contains_exact_word(term, content):
-            escaped = re.escape(term)
-            if not term.isalnum():
-                # Palabras con símbolos especiales (C#, .Net, C++): lookbehind/lookahead
-                pattern = r'(?<!\w)' + escaped + r'(?!\w)'
-            else:
-                # Palabras alfanuméricas estándar: word boundary
-                pattern = r'\b' + escaped + r'\b'
-            try:
-                return re.search(pattern, content) is not None
-            except Exception:
-                return term in content
-
-        for negative_word in negative_keywords:
-            if contains_exact_word(negative_word, normalized_title):
-                return None
-
-        for keyword in search_keywords:
-            if contains_exact_word(keyword, normalized_title):
-                return keyword
+    def validate_job_titles(self, job_titles, search_keywords, negative_keywords):
+        """
+        Versión por lotes de `validate_job_title` para evaluar una página completa.
 
-        return None
+        Returns:
+            list[str | None]: Keyword coincidente (o None) para cada título, en orden.
+        """
+        return get_keyword_matcher(search_keywords, negative_keywords).match_many(job_titles)
 
     def notify(self, message):
-        """Envía un mensaje al usuario via Telegram."""
-        print("   📢 Notificación: Mensaje enviado")
+        """Encola un mensaje al usuario via Telegram (se envía en segundo plano)."""
+        print("   📢 Notificación: Mensaje encolado")
         try:
-            send_telegram_message(message)
+            queue_telegram_message(message)
         except Exception as e:
             print(f"   ⚠️ Error enviando Telegram: {e}")
 
-    def check_and_track(self, url):
+    @property
+    def site_label(self):
+        """Nombre del sitio para los resúmenes (ej: BumeranBot → 'Bumeran')."""
+        return type(self).__name__.removesuffix("Bot")
+
+    def notify_match(self, message, url, title, keyword=None):
+        """
+        Notifica una oferta que pasó todos los filtros.
+
+        Con NOTIFY_DIGEST_MODE la oferta se acumula en el resumen del sitio
+        (ver src/notifications.py) y `message` no se usa; si no, se envía
+        `message` como mensaje individual.
+
+        Args:
+            message (str): Mensaje individual ya formateado por el bot.
+            url (str): URL de la oferta.
+            title (str): Título de la oferta.
+            keyword (str): Palabra clave que coincidió, si el sitio la informa.
+        """
+        from src.config import NOTIFY_DIGEST_MODE
+
+        if not NOTIFY_DIGEST_MODE:
+            self.notify(message)
+            return
+        print("   📢 Notificación: Oferta agregada al resumen")
+        digest.add(self.site_label, title, normalize_url(url), keyword)
+
+    def check_and_track(self, url, link=None):
         """
         Verifica si una oferta ya fue vista (historial permanente o sesión actual).
 
@@ -140,30 +637,36 @@ class BaseBot(ABC):
         el usuario lo confirma via Telegram.
 
         Args:
-            url (str): URL de la oferta a verificar.
+            url (str): URL (o clave) de la oferta a verificar.
+            link (str, optional): Enlace que se notifica, cuando la clave de
+                sesión es otra (ej: el id de una API). Como Telegram archiva el
+                enlace del mensaje, también se busca en el historial permanente.
 
         Returns:
             bool: True si la oferta es nueva y debe notificarse, False si ya fue vista.
         """
         if not url:
             return True
-        clean_url = normalize_url(url)
-        if clean_url in history.seen_jobs:
-            print(f"         ⏭️  Ya archivada (historial): {clean_url[:70]}")
+        if link and history.is_archived(link):
+            print(f"         ⏭️  Ya archivada (historial): {normalize_url(link)[:70]}")
             return False
-        if clean_url in history.session_seen:
-            print(f"         🔁  Ya notificada en este ciclo: {clean_url[:70]}")
+        status = history.claim(url)
+        if status == history.ARCHIVED:
+            print(f"         ⏭️  Ya archivada (historial): {normalize_url(url)[:70]}")
+            return False
+        if status == history.IN_SESSION:
+            print(f"         🔁  Ya notificada en este ciclo: {normalize_url(url)[:70]}")
             return False
-        history.mark_notified(url)
         return True
 
     def check_language_in_description(self, url):
         """
-        Abre la URL de la oferta en una pestaña nueva y verifica si la descripción
-        está en un idioma distinto al español, comparando contra las frases configuradas.
+        Verifica si la descripción de una oferta está en un idioma distinto al
+        español, según el método configurado en LANGUAGE_FILTER_MODE (frases o
+        identificación estadística).
 
-        Si ocurre algún error durante la navegación, retorna False para no bloquear
-        incorrectamente ofertas válidas.
+        Para varias ofertas, preferir `check_languages_in_descriptions`, que las
+        descarga en paralelo.
 
         Args:
             url (str): URL del detalle de la oferta.
@@ -172,45 +675,248 @@ class BaseBot(ABC):
             tuple: (True, 'frase detectada') si la descripción está en otro idioma,
                    (False, None) si pasa el filtro o si ocurre algún error.
         """
-        from src.keywords_manager import get_language_keywords
+        return self.check_languages_in_descriptions([url]).get(url, (False, None))
 
-        language_filters = get_language_keywords()
-        if not language_filters:
-            return False, None
+    def check_languages_in_descriptions(self, urls):
+        """
+        Aplica el filtro de idioma a todas las ofertas de una página de una vez.
 
-        original_window = self.driver.current_window_handle
+        Las descripciones se descargan en paralelo con `submit_detail` (HTTP con
+        keep-alive; en sitios con navegador, usando sus cookies). Si alguna
+        descarga HTTP falla, se reintenta con fetch() dentro de la página ya
+        abierta, en un único execute_async_script (`_fetch_texts_in_page`).
+        El texto visible se extrae en Python.
+
+        Si el HTML descargado casi no tiene texto (detalle renderizado con
+        JavaScript), esa oferta se revisa abriendo una pestaña, como antes.
+
+        Antes de descargar nada se consulta el cache de veredictos
+        (src/verdict_cache.py): las ofertas ya analizadas con la misma
+        configuración del filtro dentro de VERDICT_TTL_DAYS no se vuelven a
+        abrir. Los aciertos se acumulan en `verdict_stats`.
+
+        Los errores nunca bloquean: una oferta sin descripción legible pasa el
+        filtro (y no se guarda en el cache, para reintentarla en el próximo ciclo).
+
+        Args:
+            urls (list[str]): URLs de detalle de las ofertas.
+
+        Returns:
+            dict: {url: (bloqueada, motivo)} para cada URL recibida.
+        """
+        from src.language_filter import (
+            check_description_language, language_filter_enabled, language_filter_fingerprint,
+        )
+
+        urls = list(dict.fromkeys(url for url in urls if url))
+        if not urls or not language_filter_enabled():
+            return {url: (False, None) for url in urls}
+
+        fingerprint = language_filter_fingerprint()
+        verdicts    = {}
+        for url in urls:
+            cached = verdict_cache.get(url, fingerprint)
+            if cached is not None:
+                verdicts[url] = cached
+                self.verdict_stats.hits += 1
+
+        pending = [url for url in urls if url not in verdicts]
+        if verdicts:
+            print(f"   💾 {len(verdicts)}/{len(urls)} veredictos de idioma tomados del cache")
+        if not pending:
+            return verdicts
+
+        futures = {url: self.submit_detail(url) for url in pending}
+        texts   = {}
+        failed  = []
+        for url, future in futures.items():
+            try:
+                texts[url] = future.result()
+            except Exception as e:
+                print(f"      ⚠️ Error descargando descripción: {e}")
+                failed.append(url)
+
+        if failed and not self.uses_http_backend():
+            texts.update(self._fetch_texts_in_page(failed))
+
+        for url in pending:
+            text = texts.get(url)
+            if not self.uses_http_backend() and not (text and len(text) >= MIN_FETCHED_TEXT_LENGTH):
+                text = self._read_text_in_tab(url)
+
+            if not text:
+                verdicts[url] = (False, None)
+                self.verdict_stats.misses += 1
+                continue
+
+            cached = verdict_cache.get_unchanged(url, fingerprint, text)
+            if cached is not None:
+                verdicts[url] = cached
+                self.verdict_stats.refreshed += 1
+                continue
+
+            verdicts[url] = check_description_language(text)
+            verdict_cache.put(url, fingerprint, verdicts[url], text)
+            self.verdict_stats.misses += 1
+
+        verdict_cache.save()
+        return verdicts
+
+    # ------------------------------------------------------------------
+    # DETALLES POR HTTP
+    # ------------------------------------------------------------------
+
+    def cookie_bridge(self):
+        """
+        CookieBridge del bot (ver src/http_backend.py), creado la primera vez.
+
+        A partir de entonces `load_page` lo sincroniza después de cada navegación.
+        """
+        from src.http_backend import CookieBridge
 
+        if self._bridge is None:
+            self._bridge = CookieBridge(self.driver)
+            self._bridge.sync()
+        return self._bridge
+
+    def submit_detail(self, url):
+        """
+        Inicia la descarga HTTP del detalle de una oferta en segundo plano.
+
+        Corre en un pool de LANGUAGE_FETCH_CONCURRENCY hilos, de modo que el
+        navegador puede seguir recorriendo listados mientras tanto.
+
+        Returns:
+            concurrent.futures.Future: Resuelve al texto visible de la página.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from src.config import LANGUAGE_FETCH_CONCURRENCY
+        from src.http_backend import fetch_html, parse_html
+
+        if self.uses_http_backend():
+            download = fetch_html
+        else:
+            # La sincronización usa el driver, por eso ocurre en este hilo.
+            download = self.cookie_bridge().fetch_html
+
+        if self._detail_pool is None:
+            self._detail_pool = ThreadPoolExecutor(
+                max_workers=LANGUAGE_FETCH_CONCURRENCY, thread_name_prefix="detail",
+            )
+        return self._detail_pool.submit(lambda: parse_html(download(url)).visible_text())
+
+    def fetch_detail(self, url):
+        """
+        Retorna el texto visible del detalle de una oferta.
+
+        Usa HTTP (con las cookies del navegador si el sitio lo usa) y recurre a
+        una pestaña del navegador si la descarga falla o la página necesita
+        JavaScript para mostrar su contenido.
+
+        Returns:
+            str: Texto visible ('' si no se pudo obtener).
+        """
         try:
-            self.driver.execute_script(f"window.open('{url}', '_blank');")
-            time.sleep(3)
+            text = self.submit_detail(url).result()
+        except Exception as e:
+            print(f"      ⚠️ Error descargando {url[:70]}: {e}")
+            text = None
+
+        if self.uses_http_backend():
+            return text or ""
+        if text and len(text) >= MIN_FETCHED_TEXT_LENGTH:
+            return text
+        return self._read_text_in_tab(url)
+
+    def close(self):
+        """
+        Libera los recursos propios del bot (pool de descargas) y envía su
+        resumen pendiente. No cierra el navegador.
+        """
+        try:
+            digest.flush(self.site_label)
+        except Exception as e:
+            print(f"   ⚠️ Error enviando el resumen: {e}")
+        if self._detail_pool is not None:
+            self._detail_pool.shutdown(wait=False, cancel_futures=True)
+            self._detail_pool = None
 
-            new_handles = [h for h in self.driver.window_handles if h != original_window]
-            if not new_handles:
-                return False, None
+    def _fetch_texts_in_page(self, urls):
+        """
+        Descarga los detalles con fetch() desde la página actual del navegador.
 
-            self.driver.switch_to.window(new_handles[-1])
-            time.sleep(2)
+        Fue la vía principal del filtro por lotes hasta que las descargas pasaron
+        a `submit_detail`: el script ocupa el driver hasta que termina el lote,
+        mientras que la sesión HTTP con sus cookies corre en hilos aparte y el
+        navegador sigue recorriendo listados. Queda como respaldo para lo que
+        esa sesión no logra descargar (ej: un desafío anti-bot que solo pasa
+        el navegador).
 
+        Returns:
+            dict: {url: texto visible | None}.
+        """
+        from src.config import LANGUAGE_FETCH_CONCURRENCY, LANGUAGE_FETCH_TIMEOUT_SECONDS
+        from src.http_backend import parse_html
+
+        rounds  = -(-len(urls) // LANGUAGE_FETCH_CONCURRENCY)
+        started = time.monotonic()
+        try:
+            self.driver.set_script_timeout(LANGUAGE_FETCH_TIMEOUT_SECONDS * rounds + 5)
+            results = self.driver.execute_async_script(
+                _FETCH_SCRIPT, urls, LANGUAGE_FETCH_CONCURRENCY,
+                LANGUAGE_FETCH_TIMEOUT_SECONDS * 1000, MAX_FETCHED_HTML_LENGTH,
+            ) or []
+        except Exception as e:
+            print(f"      ⚠️ No se pudieron descargar las descripciones desde la página: {e}")
+            results = []
+        finally:
             try:
-                body_text = self.driver.find_element(By.TAG_NAME, "body").text.lower()
+                self.driver.set_script_timeout(30)
             except Exception:
-                body_text = ""
+                pass
 
-            self.driver.close()
-            self.driver.switch_to.window(original_window)
+        # La descarga en lote reemplaza una pestaña (~5s) por oferta.
+        self.wait_stats.record(time.monotonic() - started, 5 * len(urls), bool(results))
+
+        texts = {}
+        for url, result in zip(urls, results):
+            if result and result.get("html"):
+                texts[url] = parse_html(result["html"]).visible_text()
+            else:
+                reason = (result or {}).get("error") or f"HTTP {(result or {}).get('status')}"
+                print(f"      ⚠️ No se pudo descargar {url[:70]} ({reason})")
+        print(f"   🌐 {len(texts)}/{len(urls)} descripciones descargadas en {time.monotonic() - started:.1f}s")
+        return texts
+
+    def _read_text_in_tab(self, url):
+        """
+        Abre el detalle en una pestaña nueva y retorna el texto renderizado
+        (respaldo para páginas que necesitan JavaScript).
 
-            for lang_word in language_filters:
-                if lang_word.lower() in body_text:
-                    return True, lang_word
+        Returns:
+            str: Texto visible ('' si ocurre algún error).
+        """
+        original_window = self.driver.current_window_handle
+
+        try:
+            if self.open_tab(url, replaces=3) is None:
+                return ""
+
+            self.wait_for_text_stable(replaces=2)
+
+            try:
+                body_text = self.driver.find_element(By.TAG_NAME, "body").text
+            except Exception:
+                body_text = ""
 
-            return False, None
+            self.close_tab(original_window)
+            return body_text
 
         except Exception as e:
-            print(f"      ⚠️ Error en check_language_in_description: {e}")
+            print(f"      ⚠️ Error leyendo el detalle en una pestaña: {e}")
             try:
                 if len(self.driver.window_handles) > 1:
-                    self.driver.close()
-                    self.driver.switch_to.window(original_window)
+                    self.close_tab(original_window)
             except Exception:
                 pass
-            return False, None
+            return ""
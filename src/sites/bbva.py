@@ -1,17 +1,51 @@
 from src.sites.base import BaseBot
 from src.history import normalize_url
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
+from urllib.parse import urlparse
 
 
 class BBVABot(BaseBot):
     """
     Bot de búsqueda para el portal de empleos de BBVA (Workday).
 
-    Workday es una SPA. El bot escanea la primera vista del listado,
-    que con los filtros configurados trae los resultados más relevantes.
+    Workday es una SPA, pero se alimenta de una API JSON paginada
+    (/wday/cxs/<tenant>/<site>/jobs) que devuelve títulos, ubicaciones y
+    rutas de cada oferta. El bot consulta esa API directamente, recorriendo
+    todos los resultados con limit/offset, y solo abre el navegador si la API
+    falla. En ese caso escanea la primera vista del listado.
     """
 
+    USE_API = True
+
+    # Configurables para apuntar el cliente a un servidor local de prueba.
+    API_BASE_URL   = "https://bbva.wd3.myworkdayjobs.com"
+    WORKDAY_TENANT = "bbva"
+    WORKDAY_SITE   = "BBVA"
+
+    # Workday termina el path del detalle con '_<id de requisición>'.
+    URL_RULES = {
+        "name":       "bbva",
+        "hosts":      (urlparse(API_BASE_URL).hostname,),
+        "id_pattern": r"/job/.+_([A-Za-z0-9-]+)$",
+    }
+
+    # Mismos filtros que la URL del listado (área de tecnología, Argentina).
+    APPLIED_FACETS = {
+        "AreaBBVA":        ["4e7e381f49d210181652f3c780380002"],
+        "locationCountry": ["e42ad5eac46d4cc9b367ceaef42577c5"],
+    }
+
+    PAGE_SIZE   = 20   # Máximo aceptado por Workday
+    MAX_RESULTS = 200
+
+    # Títulos del listado (respaldo con navegador): cada título es el enlace a la oferta.
+    LISTING_SPEC = {
+        "card": "[data-automation-id='jobTitle']",
+        "fields": {
+            "title": ("", "text"),
+            "url":   ("", "href"),
+        },
+    }
+
     def login(self):
         pass  # No requiere autenticación
 
@@ -24,39 +58,26 @@ class BBVABot(BaseBot):
         print("🔍 Iniciando escaneo en BBVA (Workday)...")
         self.notify("🤖 Buscando chamba por BBVA!")
 
-        target_url = (
-            "https://bbva.wd3.myworkdayjobs.com/es/BBVA"
-            "?AreaBBVA=4e7e381f49d210181652f3c780380002"
-            "&locationCountry=e42ad5eac46d4cc9b367ceaef42577c5"
-        )
-
-        self.driver.get(target_url)
-        self.random_sleep(4, 6)
+        postings = None
 
-        try:
-            print("   ⏳ Esperando carga de lista de ofertas...")
-            self.wait.until(EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "[data-automation-id='jobTitle']")
-            ))
-            self.random_sleep(2, 4)
-        except Exception:
-            print("   ⚠️ No se detectaron ofertas en BBVA (o tardó mucho).")
-            return
+        if self.uses_api():
+            try:
+                postings = self.fetch_api_postings()
+                print(f"   -> API Workday: {len(postings)} ofertas.")
+            except Exception as e:
+                print(f"   ⚠️ Falló la API de Workday ({e}). Usando el navegador.")
 
-        job_titles_elements = self.driver.find_elements(
-            By.CSS_SELECTOR, "[data-automation-id='jobTitle']"
-        )
+        if postings is None:
+            postings = self.fetch_browser_postings()
 
-        if not job_titles_elements:
+        if not postings:
             print("   ⚠️ Lista vacía en BBVA.")
             return
 
-        print(f"   -> Analizando {len(job_titles_elements)} ofertas visibles en PÁGINA 1...")
-
-        for title_node in job_titles_elements:
+        for posting in postings:
             try:
-                title_text = title_node.text.strip()
-                url_oferta = normalize_url(title_node.get_attribute("href"))
+                title_text = (posting["title"] or "").strip()
+                url_oferta = normalize_url(posting["url"])
 
                 if not title_text or len(title_text) < 3:
                     continue
@@ -70,14 +91,98 @@ class BBVABot(BaseBot):
                     print(f"         ✨ ¡MATCH! Coincide con '{match_keyword}'")
                     print(f"            🔗 URL: {url_oferta}")
 
-                    self.notify(
+                    self.notify_match(
                         f"✨ <b>¡NUEVA OFERTA EN BBVA!</b>\n\n"
                         f"📌 <b>Cargo:</b> {title_text}\n"
                         f"🔑 <b>Match:</b> {match_keyword}\n"
-                        f"🔗 <a href='{url_oferta}'>Ver Oferta</a>"
+                        f"🔗 <a href='{url_oferta}'>Ver Oferta</a>",
+                        url=url_oferta, title=title_text, keyword=match_keyword,
                     )
 
             except Exception:
                 continue
 
         print("   ✅ Escaneo de BBVA finalizado.")
+
+    def fetch_api_postings(self):
+        """
+        Recorre la API de búsqueda de Workday con limit/offset.
+
+        Workday informa el total de resultados solo en la primera página, por
+        lo que se conserva ese valor para saber cuándo terminar.
+
+        Returns:
+            list[dict]: Ofertas con las claves 'title', 'url', 'location' y 'posted'.
+
+        Raises:
+            requests.RequestException | ValueError: Si la API no responde o el
+            formato no es el esperado (el llamador recurre al navegador).
+        """
+        from src.http_backend import get_session, REQUEST_TIMEOUT
+
+        api_url  = f"{self.API_BASE_URL}/wday/cxs/{self.WORKDAY_TENANT}/{self.WORKDAY_SITE}/jobs"
+        site_url = f"{self.API_BASE_URL}/es/{self.WORKDAY_SITE}"
+        session  = get_session()
+
+        postings = []
+        total    = None
+        offset   = 0
+
+        while offset < self.MAX_RESULTS:
+            payload = {
+                "appliedFacets": self.APPLIED_FACETS,
+                "limit":         self.PAGE_SIZE,
+                "offset":        offset,
+                "searchText":    "",
+            }
+            response = session.post(
+                api_url, json=payload, timeout=REQUEST_TIMEOUT,
+                headers={"Accept": "application/json"},
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            if "jobPostings" not in data:
+                raise ValueError("Respuesta de Workday sin 'jobPostings'")
+
+            if total is None:
+                total = data.get("total", 0)
+
+            page = data["jobPostings"]
+            for job in page:
+                if not job.get("externalPath"):
+                    continue
+                postings.append({
+                    "title":    job.get("title", ""),
+                    "url":      site_url + job["externalPath"],
+                    "location": job.get("locationsText", ""),
+                    "posted":   job.get("postedOn", ""),
+                })
+
+            offset += self.PAGE_SIZE
+            if not page or offset >= total:
+                break
+
+        return postings
+
+    def fetch_browser_postings(self):
+        """
+        Respaldo: escanea la primera vista del listado con el navegador.
+
+        Returns:
+            list[dict]: Ofertas con las claves 'title' y 'url'.
+        """
+        target_url = (
+            f"{self.API_BASE_URL}/es/{self.WORKDAY_SITE}"
+            "?AreaBBVA=4e7e381f49d210181652f3c780380002"
+            "&locationCountry=e42ad5eac46d4cc9b367ceaef42577c5"
+        )
+
+        print("   ⏳ Esperando carga de lista de ofertas...")
+        postings = self.fetch_listing(target_url)
+        if not postings:
+            print("   ⚠️ No se detectaron ofertas en BBVA (o tardó mucho).")
+            return []
+
+        print(f"   -> Analizando {len(postings)} ofertas visibles en PÁGINA 1...")
+        return postings
@@ -1,8 +1,7 @@
 from src.sites.base import BaseBot
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support import expected_conditions as EC
-import time
+from datetime import datetime, timedelta
+import re
+import unicodedata
 
 
 class BumeranBot(BaseBot):
@@ -12,8 +11,60 @@ class BumeranBot(BaseBot):
     Recorre el listado de empleos del área de Tecnología filtrado por publicaciones
     recientes, paginando hasta MAX_PAGES. Filtra por título, historial e idioma
     antes de notificar cada oferta.
+
+    El frontend de Bumeran se alimenta de una API JSON de búsqueda que devuelve
+    los avisos estructurados (id, título, empresa, fecha y descripción). El bot
+    la consulta directamente y el filtro de idioma usa la descripción que ya
+    viene en la respuesta, sin abrir pestañas. Si la API falla, se recorre el
+    listado con el navegador como antes.
+
+    Claves del historial:
+    - La API trae el id del aviso: en la sesión cada aviso se registra como
+      'bumeran:<id>', aunque aparezca en varias áreas.
+    - Las URLs del navegador y las archivadas desde Telegram se guardan por su
+      slug sin el número final (ver URL_RULES), como antes de la API. La API
+      respeta esos archivados consultando el enlace que ella misma notifica.
     """
 
+    USE_API = True
+
+    # Configurable para apuntar el cliente a un servidor local de prueba.
+    API_BASE_URL = "https://www.bumeran.com.ar"
+    SITE_ID      = "BMAR"
+
+    # Áreas a recorrer (mismo orden que los listados del navegador).
+    API_AREAS = [
+        "tecnologia-sistemas-y-telecomunicaciones",
+        "administracion-contabilidad-y-finanzas",
+    ]
+
+    # La misma oferta aparece con números distintos al final del slug según la
+    # página de resultados (ej: -aliantec-1118190158.html vs -aliantec-2177247.html):
+    # se descarta ese número, y también el hash de sesión 's'. Solo se quitan
+    # números de 6 o más dígitos: así un slug ya normalizado que termina en un
+    # año ("pasante-2026.html") no pierde otro segmento al recalcular las claves.
+    URL_RULES = {
+        "name":            "bumeran",
+        "hosts":           ("bumeran.com.ar",),
+        "tracking_params": ("s",),
+        "path_rewrites":   ((r"^(/empleos/.+)-\d{6,}(\.html)$", r"\1\2"),),
+    }
+
+    DAYS_WINDOW = 5
+    PAGE_SIZE   = 20
+    MAX_PAGES   = 10
+
+    # Enlaces a avisos del listado (respaldo con navegador). El título está en
+    # un <h2> dentro del enlace; si falta, se usa la primera línea del texto.
+    LISTING_SPEC = {
+        "card": "a[href*='/empleos/'][href*='.html']",
+        "fields": {
+            "url":     ("", "href"),
+            "heading": ("h2", "text"),
+            "text":    ("", "text"),
+        },
+    }
+
     def search(self, _=None):
         from src.config import SEARCH_KEYWORDS as RAW_SEARCH, NEGATIVE_KEYWORDS as RAW_NEG
 
@@ -23,11 +74,168 @@ class BumeranBot(BaseBot):
         print(f"🔍 Iniciando búsqueda con {len(SEARCH_KEYWORDS)} palabras activas.")
         self.notify("🤖 Buscando chamba por Bumeran!")
 
+        if self.uses_api():
+            try:
+                self.search_api(SEARCH_KEYWORDS, NEGATIVE_KEYWORDS)
+                return
+            except Exception as e:
+                # Si la API ya procesó páginas, no repetimos con el navegador:
+                # las claves de sesión difieren y se duplicarían avisos.
+                if self.api_pages_done:
+                    print(f"   ⚠️ La API de Bumeran falló a mitad de la búsqueda: {e}")
+                    return
+                print(f"   ⚠️ Falló la API de Bumeran ({e}). Usando el navegador.")
+
+        self.search_browser(SEARCH_KEYWORDS, NEGATIVE_KEYWORDS)
+
+    # ------------------------------------------------------------------
+    # API JSON
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def slugify(text):
+        """Convierte un texto en el formato de slug de las URLs de Bumeran."""
+        normalized = unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode()
+        return re.sub(r"[^a-z0-9]+", "-", normalized.lower()).strip("-")
+
+    @staticmethod
+    def parse_posting_date(posting):
+        """Lee la fecha de publicación del aviso ('dd-mm-aaaa'). Retorna None si no la trae."""
+        raw_date = posting.get("fechaPublicacion") or posting.get("fechaHoraPublicacion") or ""
+        try:
+            return datetime.strptime(raw_date[:10], "%d-%m-%Y")
+        except ValueError:
+            return None
+
+    def posting_url(self, posting):
+        """
+        URL pública del aviso: /empleos/<titulo>-<empresa>-<id>.html
+
+        Es el enlace que se notifica: al archivarlo desde Telegram queda en el
+        historial por su slug normalizado.
+        """
+        slug = self.slugify(f"{posting.get('titulo', '')} {posting.get('empresa', '')}")
+        return f"{self.API_BASE_URL}/empleos/{slug}-{posting['id']}.html"
+
+    def fetch_api_page(self, area, page):
+        """
+        Consulta una página de la API de búsqueda, ordenada por más recientes.
+
+        Returns:
+            list[dict]: Avisos de la página (lista vacía al final de los resultados).
+        """
+        from src.http_backend import get_session, REQUEST_TIMEOUT
+
+        response = get_session().post(
+            f"{self.API_BASE_URL}/api/avisos/searchNormalizado",
+            params={"pageSize": self.PAGE_SIZE, "page": page, "sort": "RECIENTES"},
+            json={
+                "filtros": [
+                    {"id": "area", "value": area},
+                    {"id": "dias_fecha_publicacion", "value": f"menor-a-{self.DAYS_WINDOW}-dias"},
+                ],
+                "busquedaExtendida": False,
+                "tipoDetalle": "full",
+                "withHome": False,
+                "internacional": False,
+            },
+            headers={"x-site-id": self.SITE_ID, "Accept": "application/json"},
+            timeout=REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        if "content" not in data:
+            raise ValueError("Respuesta de Bumeran sin 'content'")
+        return data["content"]
+
+    def search_api(self, SEARCH_KEYWORDS, NEGATIVE_KEYWORDS):
+        """
+        Recorre las áreas configuradas mediante la API de búsqueda.
+
+        La paginación se detiene al llegar a un aviso publicado fuera de la
+        ventana de DAYS_WINDOW días (los resultados vienen ordenados por fecha).
+        """
+        from src.http_backend import parse_html
+        from src.language_filter import check_description_language, language_filter_enabled
+
+        self.api_pages_done = 0
+        limit_date = datetime.now() - timedelta(days=self.DAYS_WINDOW + 1)
+
+        for area in self.API_AREAS:
+            print(f"\n🚀 --- ESCANEANDO ÁREA (API): {area.replace('-', ' ').title()} ---")
+
+            for page_num in range(self.MAX_PAGES):
+                postings = self.fetch_api_page(area, page_num)
+                self.api_pages_done += 1
+                print(f"\n   📄 PÁGINA {page_num + 1}: {len(postings)} avisos")
+
+                if not postings:
+                    break
+
+                out_of_window = False
+
+                for posting in postings:
+                    posted = self.parse_posting_date(posting)
+                    if posted and posted < limit_date:
+                        out_of_window = True
+                        break
+
+                    if not posting.get("id"):
+                        continue
+
+                    title_text = (posting.get("titulo") or "").lower()
+                    if len(title_text) < 3:
+                        continue
+
+                    match_keyword = self.validate_job_title(title_text, SEARCH_KEYWORDS, NEGATIVE_KEYWORDS)
+                    if not match_keyword:
+                        continue
+
+                    url_oferta = self.posting_url(posting)
+                    if not self.check_and_track(f"bumeran:{posting['id']}", link=url_oferta):
+                        continue
+
+                    print(f"         ✨ ¡MATCH! Coincide con '{match_keyword}'")
+                    print(f"            🔗 URL: {url_oferta}")
+
+                    if language_filter_enabled() and posting.get("detalle"):
+                        description = parse_html(posting["detalle"]).visible_text()
+                        lang_blocked, lang_word = check_description_language(description)
+                        if lang_blocked:
+                            print(f"         🌐 ──────────────────────────────")
+                            print(f"         🌐 IDIOMA FILTRADO (Bumeran)")
+                            print(f"            📌 Título  : {title_text.title()}")
+                            print(f"            🔍 Palabra : '{lang_word}'")
+                            print(f"            🔗 Link    : {url_oferta[:80]}...")
+                            print(f"         🌐 ──────────────────────────────")
+                            continue
+
+                    company = posting.get("empresa") or ""
+                    self.notify_match(
+                        f"✨ <b>¡NUEVA OFERTA ENCONTRADA!</b>\n\n"
+                        f"📌 <b>Cargo:</b> {title_text.title()}\n"
+                        + (f"🏢 <b>Empresa:</b> {company}\n" if company else "")
+                        + f"🔑 <b>Match:</b> {match_keyword}\n"
+                        f"🔗 <a href='{url_oferta}'>Ver Oferta</a>",
+                        url=url_oferta, title=title_text.title(), keyword=match_keyword,
+                    )
+
+                if out_of_window:
+                    print(f"   ⏹️ Avisos fuera de la ventana de {self.DAYS_WINDOW} días. Fin del área.")
+                    break
+
+    # ------------------------------------------------------------------
+    # NAVEGADOR (respaldo)
+    # ------------------------------------------------------------------
+
+    def search_browser(self, SEARCH_KEYWORDS, NEGATIVE_KEYWORDS):
+        """Recorre los listados por área con el navegador."""
         target_urls = [
             "https://www.bumeran.com.ar/empleos-area-tecnologia-sistemas-y-telecomunicaciones-publicacion-menor-a-5-dias.html",
             "https://www.bumeran.com.ar/empleos-area-administracion-contabilidad-y-finanzas-publicacion-menor-a-5-dias.html"
         ]
-        MAX_PAGES = 10
+        MAX_PAGES = self.MAX_PAGES
 
         for base_url in target_urls:
             print(f"\n🚀 --- ESCANEANDO ÁREA: {base_url.split('/')[-1].replace('.html', '').replace('-', ' ').title()} ---")
@@ -36,20 +244,7 @@ class BumeranBot(BaseBot):
                 current_url = base_url if page_num == 1 else f"{base_url}?page={page_num}"
                 print(f"\n   📄 Buscando por PÁGINA {page_num}")
 
-                if current_url not in self.driver.current_url:
-                    self.driver.get(current_url)
-                    self.random_sleep(2, 4)
-
-                try:
-                    self.wait.until(EC.presence_of_all_elements_located(
-                        (By.XPATH, "//a[contains(@href, '/empleos/') and contains(@href, '.html')]")
-                    ))
-                except Exception:
-                    pass
-
-                job_links = self.driver.find_elements(
-                    By.XPATH, "//a[contains(@href, '/empleos/') and contains(@href, '.html')]"
-                )
+                job_links = self.fetch_listing(current_url)
 
                 if not job_links:
                     print(f"   ⚠️ No encontré ofertas en pág {page_num}. Terminando área.")
@@ -59,31 +254,33 @@ class BumeranBot(BaseBot):
 
                 original_window = self.driver.current_window_handle
 
-                for link_element in job_links:
-                    try:
-                        url_oferta = link_element.get_attribute("href")
+                # Se juntan los matches de la página y el filtro de idioma los
+                # revisa en lote con fetch() desde la misma página.
+                matches = []
+                for link in job_links:
+                    url_oferta = link["url"]
+                    title_text = (link["heading"] or (link["text"] or "").split("\n")[0]).lower()
 
-                        title_text = ""
-                        try:
-                            title_text = link_element.find_element(By.TAG_NAME, "h2").text.lower()
-                        except Exception:
-                            title_text = link_element.text.split("\n")[0].lower()
+                    if not url_oferta or len(title_text) < 3:
+                        continue
 
-                        if len(title_text) < 3:
-                            continue
+                    match_keyword = self.validate_job_title(title_text, SEARCH_KEYWORDS, NEGATIVE_KEYWORDS)
 
-                        match_keyword = self.validate_job_title(title_text, SEARCH_KEYWORDS, NEGATIVE_KEYWORDS)
+                    if not match_keyword:
+                        continue
 
-                        if not match_keyword:
-                            continue
+                    if not self.check_and_track(url_oferta):
+                        continue
 
-                        if not self.check_and_track(url_oferta):
-                            continue
+                    print(f"         ✨ ¡MATCH! Coincide con '{match_keyword}'")
+                    print(f"            🔗 URL: {url_oferta}")
+                    matches.append((title_text, url_oferta, match_keyword))
 
-                        print(f"         ✨ ¡MATCH! Coincide con '{match_keyword}'")
-                        print(f"            🔗 URL: {url_oferta}")
+                verdicts = self.check_languages_in_descriptions([url for _, url, _ in matches])
 
-                        lang_blocked, lang_word = self.check_language_in_description(url_oferta)
+                for title_text, url_oferta, match_keyword in matches:
+                    try:
+                        lang_blocked, lang_word = verdicts[url_oferta]
                         if lang_blocked:
                             print(f"         🌐 ──────────────────────────────")
                             print(f"         🌐 IDIOMA FILTRADO (Bumeran)")
@@ -93,18 +290,16 @@ class BumeranBot(BaseBot):
                             print(f"         🌐 ──────────────────────────────")
                             continue
 
-                        self.notify(
+                        self.notify_match(
                             f"✨ <b>¡NUEVA OFERTA ENCONTRADA!</b>\n\n"
                             f"📌 <b>Cargo:</b> {title_text.title()}\n"
                             f"🔑 <b>Match:</b> {match_keyword}\n"
-                            f"🔗 <a href='{url_oferta}'>Ver Oferta</a>"
+                            f"🔗 <a href='{url_oferta}'>Ver Oferta</a>",
+                            url=url_oferta, title=title_text.title(), keyword=match_keyword,
                         )
 
-                        self.driver.execute_script(f"window.open('{url_oferta}', '_blank');")
-                        self.random_sleep(2, 3)
-                        self.driver.switch_to.window(self.driver.window_handles[-1])
-                        self.driver.close()
-                        self.driver.switch_to.window(original_window)
+                        if self.open_tab(url_oferta, replaces=2.5) is not None:
+                            self.close_tab(original_window)
 
                     except Exception as e:
                         print(f"      ❌ Error al procesar link: {e}")
@@ -1,9 +1,5 @@
 from src.sites.base import BaseBot
 from src.history import normalize_url
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support import expected_conditions as EC
-import time
 
 
 class ComputrabajoBot(BaseBot):
@@ -13,8 +9,34 @@ class ComputrabajoBot(BaseBot):
     Recorre las zonas configuradas (Capital Federal y GBA) paginando
     los resultados por fecha de publicación. Filtra por título, historial
     de vistos e idioma antes de notificar cada oferta.
+
+    Los listados se renderizan en el servidor, pero el sitio se recorre con
+    Chrome: la marca de "ya me postulé" (span.tag.postulated) solo aparece con
+    la sesión del perfil. Por HTTP, sin esas cookies, el filtro nunca
+    coincidiría y se volverían a notificar ofertas ya postuladas.
     """
 
+    # No usar el backend HTTP hasta poder enviar las cookies del perfil.
+    USE_HTTP_BACKEND = False
+
+    # Las ofertas terminan en un id hexadecimal de 32 caracteres; 'lc' es la
+    # posición en el listado de resultados.
+    URL_RULES = {
+        "name":            "computrabajo",
+        "hosts":           ("computrabajo.com",),
+        "tracking_params": ("lc",),
+        "id_pattern":      r"-([0-9A-F]{32})$",
+    }
+
+    LISTING_SPEC = {
+        "card": "article",
+        "fields": {
+            "title":   ("h2 a", "text"),
+            "url":     ("h2 a", "href"),
+            "applied": ("span.tag.postulated:not(.hide)", "exists"),
+        },
+    }
+
     def search(self, _=None):
         from src.config import SEARCH_KEYWORDS as RAW_SEARCH, NEGATIVE_KEYWORDS as RAW_NEG
 
@@ -40,10 +62,7 @@ class ComputrabajoBot(BaseBot):
                 current_url = base_url if page == 1 else f"{base_url}&p={page}"
                 print(f"   📄 Buscando por PÁGINA {page}")
 
-                self.driver.get(current_url)
-                self.random_sleep(3, 5)
-
-                articles = self.driver.find_elements(By.TAG_NAME, "article")
+                articles = self.fetch_listing(current_url)
 
                 if not articles:
                     print(f"   ⚠️ Fin de resultados en página {page}. Pasando a siguiente zona.")
@@ -51,50 +70,55 @@ class ComputrabajoBot(BaseBot):
 
                 print(f"   -> Encontré {len(articles)} posibles ofertas.")
 
-                original_window = self.driver.current_window_handle
+                original_window = None if self.uses_http_backend() else self.driver.current_window_handle
 
+                # Primero se juntan los matches de la página; el filtro de
+                # idioma los revisa a todos juntos con una sola descarga en lote.
+                matches = []
                 for art in articles:
-                    try:
-                        # Saltear ofertas en las que el usuario ya se postuló
-                        try:
-                            applied_tag = art.find_elements(By.CSS_SELECTOR, "span.tag.postulated:not(.hide)")
-                            if applied_tag:
-                                continue
-                        except Exception:
-                            pass
-
-                        try:
-                            title_elem = art.find_element(By.TAG_NAME, "h2").find_element(By.TAG_NAME, "a")
-                            title_text = title_elem.text
-                            link_url   = normalize_url(title_elem.get_attribute("href"))
-                        except Exception:
+                    # Saltear ofertas en las que el usuario ya se postuló
+                    if art["applied"]:
+                        continue
+
+                    if not art["title"] or not art["url"]:
+                        continue
+
+                    title_text = art["title"]
+                    link_url   = normalize_url(art["url"])
+
+                    match = self.validate_job_title(title_text, SEARCH_KEYWORDS, NEGATIVE_KEYWORDS)
+
+                    if match:
+                        if not self.check_and_track(link_url):
                             continue
 
-                        match = self.validate_job_title(title_text, SEARCH_KEYWORDS, NEGATIVE_KEYWORDS)
+                        print(f"      ✨ MATCH: {title_text} ({match})")
+                        matches.append((title_text, link_url))
 
-                        if match:
-                            if not self.check_and_track(link_url):
-                                continue
+                verdicts = self.check_languages_in_descriptions([link_url for _, link_url in matches])
 
-                            print(f"      ✨ MATCH: {title_text} ({match})")
+                for title_text, link_url in matches:
+                    try:
+                        lang_blocked, lang_word = verdicts[link_url]
+                        if lang_blocked:
+                            print(f"      🌐 ──────────────────────────────")
+                            print(f"      🌐 IDIOMA FILTRADO (Computrabajo)")
+                            print(f"         📌 Título  : {title_text.title()}")
+                            print(f"         🔍 Palabra : '{lang_word}'")
+                            print(f"         🔗 Link    : {link_url[:80]}...")
+                            print(f"      🌐 ──────────────────────────────")
+                            continue
 
-                            lang_blocked, lang_word = self.check_language_in_description(link_url)
-                            if lang_blocked:
-                                print(f"      🌐 ──────────────────────────────")
-                                print(f"      🌐 IDIOMA FILTRADO (Computrabajo)")
-                                print(f"         📌 Título  : {title_text.title()}")
-                                print(f"         🔍 Palabra : '{lang_word}'")
-                                print(f"         🔗 Link    : {link_url[:80]}...")
-                                print(f"      🌐 ──────────────────────────────")
-                                continue
+                        self.notify_match(
+                            f"✨ <b>COMPUTRABAJO MATCH!</b>\n\n📌 {title_text}\n🔗 {link_url}",
+                            url=link_url, title=title_text,
+                        )
 
-                            self.notify(f"✨ <b>COMPUTRABAJO MATCH!</b>\n\n📌 {title_text}\n🔗 {link_url}")
+                        if original_window is None:
+                            continue
 
-                            self.driver.execute_script(f"window.open('{link_url}', '_blank');")
-                            self.random_sleep(2, 4)
-                            self.driver.switch_to.window(self.driver.window_handles[-1])
-                            self.driver.close()
-                            self.driver.switch_to.window(original_window)
+                        if self.open_tab(link_url, replaces=3) is not None:
+                            self.close_tab(original_window)
 
                     except Exception as e:
                         print(f"      ❌ Error analizando tarjeta: {e}")
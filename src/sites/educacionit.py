@@ -1,7 +1,5 @@
 from src.sites.base import BaseBot
 from src.history import normalize_url
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
 
 
 class EducacionITBot(BaseBot):
@@ -9,9 +7,20 @@ class EducacionITBot(BaseBot):
     Bot de búsqueda para el portal de empleos de EducaciónIT.
 
     Recorre hasta 5 páginas de resultados paginadas por query param (?p=X).
-    No requiere autenticación.
+    No requiere autenticación. El listado se renderiza en el servidor: se
+    procesa con el backend HTTP.
     """
 
+    USE_HTTP_BACKEND = True
+
+    LISTING_SPEC = {
+        "card": ".itemEmpleo",
+        "fields": {
+            "title": ("h3 a", "text"),
+            "url":   ("h3 a", "href"),
+        },
+    }
+
     def login(self):
         pass  # No requiere autenticación
 
@@ -32,28 +41,20 @@ class EducacionITBot(BaseBot):
             print(f"\n   📄 Buscando por PÁGINA {page}")
 
             try:
-                self.driver.get(url)
-                self.random_sleep(2, 4)
-
-                try:
-                    self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "itemEmpleo")))
-                except Exception:
-                    print(f"   ⚠️ No se detectaron ofertas en página {page}.")
-                    continue
-
-                job_cards = self.driver.find_elements(By.CLASS_NAME, "itemEmpleo")
+                job_cards = self.fetch_listing(url)
 
                 if not job_cards:
-                    print(f"   ⚠️ Lista vacía en página {page}.")
+                    print(f"   ⚠️ No se detectaron ofertas en página {page}.")
                     continue
 
                 print(f"   -> Analizando {len(job_cards)} ofertas...")
 
                 for card in job_cards:
                     try:
-                        title_node = card.find_element(By.CSS_SELECTOR, "h3 a")
-                        title_text = title_node.text.strip()
-                        url_oferta = normalize_url(title_node.get_attribute("href"))
+                        title_text = (card["title"] or "").strip()
+                        if not card["url"]:
+                            continue
+                        url_oferta = normalize_url(card["url"])
 
                         if not title_text or len(title_text) < 3:
                             continue
@@ -67,11 +68,12 @@ class EducacionITBot(BaseBot):
                             print(f"         ✨ ¡MATCH! Coincide con '{match_keyword}'")
                             print(f"            🔗 URL: {url_oferta}")
 
-                            self.notify(
+                            self.notify_match(
                                 f"✨ <b>¡NUEVA OFERTA EN EDUCACIÓN IT!</b>\n\n"
                                 f"📌 <b>Cargo:</b> {title_text}\n"
                                 f"🔑 <b>Match:</b> {match_keyword}\n"
-                                f"🔗 <a href='{url_oferta}'>Ver Oferta</a>"
+                                f"🔗 <a href='{url_oferta}'>Ver Oferta</a>",
+                                url=url_oferta, title=title_text, keyword=match_keyword,
                             )
 
                     except Exception:
@@ -1,8 +1,5 @@
 from src.sites.base import BaseBot
 from src.history import normalize_url
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-import time
 
 
 class EmpleosITBot(BaseBot):
@@ -12,8 +9,30 @@ class EmpleosITBot(BaseBot):
     Carga hasta 100 ofertas por página usando el parámetro listings_per_page.
     Las URLs se normalizan para eliminar el parámetro searchId, que varía
     entre sesiones pero no identifica el recurso.
+
+    El listado se renderiza en el servidor: se procesa con el backend HTTP.
     """
 
+    USE_HTTP_BACKEND = True
+
+    # searchId y page dependen de la búsqueda; el detalle es /display-job/<id>/...
+    URL_RULES = {
+        "name":            "empleosit",
+        "hosts":           ("empleosit.com.ar",),
+        "tracking_params": ("searchid", "page"),
+        "id_pattern":      r"^/display-job/(\d+)",
+    }
+
+    # Cada título puede tener varios anchors (ícono + texto); se toma cada
+    # anchor como tarjeta y luego se descartan los que no tienen texto visible.
+    LISTING_SPEC = {
+        "card": ".listing-title a",
+        "fields": {
+            "title": ("", "text"),
+            "url":   ("", "href"),
+        },
+    }
+
     def login(self):
         pass  # No requiere autenticación
 
@@ -34,71 +53,55 @@ class EmpleosITBot(BaseBot):
             print(f"\n   📄 Buscando por PÁGINA {page}")
 
             try:
-                self.driver.get(current_url)
-                self.random_sleep(3, 5)
+                job_links = self.fetch_listing(current_url)
 
-                try:
-                    self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "listing-title")))
-                except Exception:
+                if not job_links:
                     print(f"   ⚠️ No se detectaron ofertas o fin de resultados en pág {page}.")
                     break
 
-                job_titles_divs = self.driver.find_elements(By.CLASS_NAME, "listing-title")
-
-                if not job_titles_divs:
-                    print(f"   ⚠️ Lista vacía en página {page}.")
-                    break
+                print(f"   -> Encontré {len(job_links)} ofertas visibles...")
 
-                print(f"   -> Encontré {len(job_titles_divs)} ofertas visibles...")
+                # Se juntan los matches de la página y el filtro de idioma los
+                # revisa en lote (descargas en paralelo).
+                matches = []
+                for job_link in job_links:
+                    title_text = (job_link["title"] or "").strip()
+                    if not job_link["url"] or len(title_text) <= 3:
+                        continue
 
-                for title_div in job_titles_divs:
-                    try:
-                        # Cada div puede tener varios anchors; tomamos el que tiene texto visible.
-                        links = title_div.find_elements(By.TAG_NAME, "a")
-                        target_link = None
+                    url_oferta = normalize_url(job_link["url"])
 
-                        for link in links:
-                            href = link.get_attribute("href")
-                            text = link.text.strip()
-                            if href and len(text) > 3:
-                                target_link = link
-                                break
+                    match_keyword = self.validate_job_title(title_text, SEARCH_KEYWORDS, NEGATIVE_KEYWORDS)
 
-                        if not target_link:
+                    if match_keyword:
+                        if not self.check_and_track(url_oferta):
                             continue
 
-                        title_text = target_link.text.strip()
-                        url_oferta = normalize_url(target_link.get_attribute("href"))
-
-                        match_keyword = self.validate_job_title(title_text, SEARCH_KEYWORDS, NEGATIVE_KEYWORDS)
-
-                        if match_keyword:
-                            if not self.check_and_track(url_oferta):
-                                continue
-
-                            print(f"         ✨ ¡MATCH! Coincide con '{match_keyword}'")
-                            print(f"            🔗 URL: {url_oferta}")
-
-                            lang_blocked, lang_word = self.check_language_in_description(url_oferta)
-                            if lang_blocked:
-                                print(f"         🌐 ──────────────────────────────")
-                                print(f"         🌐 IDIOMA FILTRADO (EmpleosIT)")
-                                print(f"            📌 Título  : {title_text.title()}")
-                                print(f"            🔍 Palabra : '{lang_word}'")
-                                print(f"            🔗 Link    : {url_oferta[:80]}...")
-                                print(f"         🌐 ──────────────────────────────")
-                                continue
-
-                            self.notify(
-                                f"✨ <b>¡NUEVA OFERTA EN EMPLEOSIT!</b>\n\n"
-                                f"📌 <b>Cargo:</b> {title_text}\n"
-                                f"🔑 <b>Match:</b> {match_keyword}\n"
-                                f"🔗 <a href='{url_oferta}'>Ver Oferta</a>"
-                            )
-
-                    except Exception:
+                        print(f"         ✨ ¡MATCH! Coincide con '{match_keyword}'")
+                        print(f"            🔗 URL: {url_oferta}")
+                        matches.append((title_text, url_oferta, match_keyword))
+
+                verdicts = self.check_languages_in_descriptions([url for _, url, _ in matches])
+
+                for title_text, url_oferta, match_keyword in matches:
+                    lang_blocked, lang_word = verdicts[url_oferta]
+                    if lang_blocked:
+                        print(f"         🌐 ──────────────────────────────")
+                        print(f"         🌐 IDIOMA FILTRADO (EmpleosIT)")
+                        print(f"            📌 Título  : {title_text.title()}")
+                        print(f"            🔍 Palabra : '{lang_word}'")
+                        print(f"            🔗 Link    : {url_oferta[:80]}...")
+                        print(f"         🌐 ──────────────────────────────")
                         continue
 
+                    self.notify_match(
+                        f"✨ <b>¡NUEVA OFERTA EN EMPLEOSIT!</b>\n\n"
+                        f"📌 <b>Cargo:</b> {title_text}\n"
+                        f"🔑 <b>Match:</b> {match_keyword}\n"
+                        f"🔗 <a href='{url_oferta}'>Ver Oferta</a>",
+                        url=url_oferta, title=title_text, keyword=match_keyword,
+                    )
+
             except Exception as e:
                 print(f"❌ Error en página {page} de EmpleosIT: {e}")
                 continue
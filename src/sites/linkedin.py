@@ -2,13 +2,25 @@ from src.sites.base import BaseBot
 import os
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-import time
 from src.config import JOB_SEARCH_URLS, SEARCH_KEYWORDS, NEGATIVE_KEYWORDS
-from src.listener import check_telegram_replies
-from src.keywords_manager import get_language_keywords
+from src.language_filter import check_description_language, language_filter_enabled
 from src.history import history, normalize_url
 
 
+JOB_CARD_SELECTOR    = "div.job-card-container"
+NEXT_BUTTON_SELECTOR = "button.jobs-search-pagination__button--next"
+DESCRIPTION_SELECTOR = ".jobs-description__content, .jobs-description, .job-view-layout"
+
+# Tarjetas de resultados: se leen todas con una sola llamada (ver BaseBot.extract_listing).
+JOB_CARD_SPEC = {
+    "card": JOB_CARD_SELECTOR,
+    "fields": {
+        "title": ("a.job-card-container__link, a.job-card-list__title--link", "text"),
+        "url":   ("a.job-card-container__link, a.job-card-list__title--link", "href"),
+    },
+}
+
+
 class LinkedInBot(BaseBot):
     """
     Bot de búsqueda para LinkedIn.
@@ -28,6 +40,15 @@ class LinkedInBot(BaseBot):
     abrir una nueva pestaña, lo que es más eficiente en LinkedIn.
     """
 
+    # El detalle es /jobs/view/<id>/ (a veces con el slug del título antes del
+    # id); el resto de los parámetros son de tracking.
+    URL_RULES = {
+        "name":            "linkedin",
+        "hosts":           ("linkedin.com",),
+        "tracking_params": ("refid", "trackingid", "trk", "ebp"),
+        "id_pattern":      r"^/jobs/view/(?:[^/]*-)?(\d+)",
+    }
+
     def login(self):
         """Sesión gestionada via perfil persistente. No se requiere acción."""
         print("   ℹ️  Usando sesión de LinkedIn del perfil persistente.")
@@ -43,10 +64,8 @@ class LinkedInBot(BaseBot):
             print(f"   🔗 URL: {base_url}")
 
             try:
-                check_telegram_replies()
-
-                self.driver.get(base_url)
-                time.sleep(5)
+                self.load_page(base_url)
+                self.wait_for_stable(JOB_CARD_SELECTOR, replaces=5)
 
                 page_num    = 1
                 max_pages   = 18
@@ -63,43 +82,44 @@ class LinkedInBot(BaseBot):
                             print(f"      {maniobra_msg}: Pág 1 → 2 → 1...")
 
                             self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.END)
-                            time.sleep(2)
+                            self.wait_for_stable(NEXT_BUTTON_SELECTOR, replaces=2)
 
-                            next_btn = self.driver.find_element(
-                                By.CSS_SELECTOR, "button.jobs-search-pagination__button--next"
-                            )
+                            next_btn = self.driver.find_element(By.CSS_SELECTOR, NEXT_BUTTON_SELECTOR)
 
+                            previous_url = self.driver.current_url
                             if is_android:
                                 self.driver.execute_script("arguments[0].click();", next_btn)
                             else:
                                 next_btn.click()
 
-                            time.sleep(8 if is_android else 4)
+                            self.wait_url_change(previous_url)
+                            self.wait_for_stable(JOB_CARD_SELECTOR, replaces=8 if is_android else 4)
 
                             body = self.driver.find_element(By.TAG_NAME, "body")
                             for _ in range(5):
                                 body.send_keys(Keys.PAGE_DOWN)
-                                time.sleep(0.5)
-                            time.sleep(1)
+                                self.wait_network_idle(timeout=2, replaces=0.5)
+                            self.human_pause()
 
                             prev_btn = self.driver.find_element(
                                 By.CSS_SELECTOR, "button.jobs-search-pagination__button--previous"
                             )
 
+                            previous_url = self.driver.current_url
                             if is_android:
                                 self.driver.execute_script("arguments[0].click();", prev_btn)
                             else:
                                 prev_btn.click()
 
                             print("      🔙 Volviendo a Pág 1...")
-                            time.sleep(8 if is_android else 4)
+                            self.wait_url_change(previous_url)
+                            self.wait_for_stable(JOB_CARD_SELECTOR, replaces=8 if is_android else 4)
 
                         except Exception as e:
                             print(f"      ⚠️ No se pudo completar la maniobra 1→2→1: {e}")
                         finally:
                             fix_applied = True
 
-                    check_telegram_replies()
                     print(f"\n   📄 [LinkedIn #{url_index + 1}] Procesando PÁGINA {page_num}...")
 
                     # Scroll progresivo para activar la carga de tarjetas restantes.
@@ -116,30 +136,30 @@ class LinkedInBot(BaseBot):
                         final_wait  = 5 if is_android else 2
                         body        = self.driver.find_element(By.TAG_NAME, "body")
 
+                        # Tras cada scroll se espera a que terminen las descargas que
+                        # dispara el lazy loading, en lugar de una pausa fija.
                         for _ in range(8):
                             body.send_keys(Keys.PAGE_DOWN)
-                            time.sleep(scroll_wait)
+                            self.wait_network_idle(timeout=scroll_wait * 3, replaces=scroll_wait)
 
-                        time.sleep(final_wait)
+                        self.wait_for_stable(JOB_CARD_SELECTOR, replaces=final_wait)
 
                     except Exception as e:
                         print(f"   ⚠️ Error en scroll: {e}")
 
-                    job_cards = self.driver.find_elements(By.CSS_SELECTOR, "div.job-card-container")
+                    job_cards = self.extract_listing(JOB_CARD_SPEC)
                     print(f"   🔎 Analizando {len(job_cards)} tarjetas en esta página...")
 
                     found_on_page = 0
 
-                    for card in job_cards:
+                    for index, record in enumerate(job_cards):
                         try:
-                            title_element = card.find_element(
-                                By.CSS_SELECTOR,
-                                "a.job-card-container__link, a.job-card-list__title--link",
-                            )
+                            if not record["title"] or not record["url"]:
+                                continue
 
-                            title_text = title_element.text.strip().lower()
+                            title_text = record["title"].strip().lower()
                             title_text = title_text.replace("\n", " ").replace("solicitud sencilla", "")
-                            link       = normalize_url(title_element.get_attribute("href"))
+                            link       = normalize_url(record["url"])
 
                             if len(title_text) < 3:
                                 continue
@@ -157,28 +177,29 @@ class LinkedInBot(BaseBot):
 
                             # Filtro de idioma: se lee el panel lateral de descripción
                             # sin abrir nueva pestaña (LinkedIn lo renderiza en el mismo DOM).
-                            current_language_filters = get_language_keywords()
                             language_blocked = False
                             blocking_word    = None
 
-                            if current_language_filters:
+                            if language_filter_enabled():
                                 try:
+                                    # Al elegir una tarjeta LinkedIn cambia el currentJobId de la
+                                    # URL y reemplaza el panel de descripción.
+                                    card = self.card_element(JOB_CARD_SPEC, index)
+                                    if card is None:
+                                        raise RuntimeError("la tarjeta ya no está en la página")
+                                    previous_url = self.driver.current_url
                                     card.click()
-                                    time.sleep(3)
+                                    self.wait_url_change(previous_url, timeout=5)
+                                    self.wait_for_text_stable(DESCRIPTION_SELECTOR, replaces=3)
                                     try:
                                         desc_element     = self.driver.find_element(
-                                            By.CSS_SELECTOR,
-                                            ".jobs-description__content, .jobs-description, .job-view-layout",
+                                            By.CSS_SELECTOR, DESCRIPTION_SELECTOR,
                                         )
-                                        description_text = desc_element.text.lower()
+                                        description_text = desc_element.text
                                     except Exception:
                                         description_text = ""
 
-                                    for lang_word in current_language_filters:
-                                        if lang_word.lower() in description_text:
-                                            language_blocked = True
-                                            blocking_word    = lang_word
-                                            break
+                                    language_blocked, blocking_word = check_description_language(description_text)
                                 except Exception as e:
                                     print(f"      ⚠️ Error leyendo descripción: {e}")
 
@@ -193,10 +214,11 @@ class LinkedInBot(BaseBot):
                                 continue
 
                             history.add_job(link)
-                            self.notify(
+                            self.notify_match(
                                 f"✨ <b>MATCH DETECTADO (LinkedIn)</b>\n"
                                 f"📌 <b>{title_text.title()}</b>\n"
-                                f"🔗 <a href='{link}'>Ver Oferta</a>"
+                                f"🔗 <a href='{link}'>Ver Oferta</a>",
+                                url=link, title=title_text.title(),
                             )
 
                         except Exception:
@@ -206,13 +228,13 @@ class LinkedInBot(BaseBot):
 
                     # Paginación: avanzar a la siguiente página si el botón está activo
                     try:
-                        next_btn = self.driver.find_element(
-                            By.CSS_SELECTOR, "button.jobs-search-pagination__button--next"
-                        )
+                        next_btn = self.driver.find_element(By.CSS_SELECTOR, NEXT_BUTTON_SELECTOR)
                         if next_btn.is_enabled():
                             print("   ➡️ Avanzando a siguiente página...")
+                            previous_url = self.driver.current_url
                             next_btn.click()
-                            time.sleep(5)
+                            self.wait_url_change(previous_url)
+                            self.wait_for_stable(JOB_CARD_SELECTOR, replaces=5)
                             page_num += 1
                         else:
                             print("   ⏹️ Fin de resultados para esta búsqueda.")
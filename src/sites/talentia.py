@@ -2,7 +2,6 @@ from src.sites.base import BaseBot
 from src.history import normalize_url
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-import time
 
 
 class TalentiaBot(BaseBot):
@@ -17,6 +16,26 @@ class TalentiaBot(BaseBot):
     y notificación.
     """
 
+    # Tarjetas de ofertas. El título tiene clase propia; si falta, se usa la
+    # primera línea del texto de la tarjeta.
+    LISTING_SPEC = {
+        "card": ".clickable-element.bubble-element.Group.cmnsr",
+        "fields": {
+            "title": (".bubble-element.Text.cmnsy", "text"),
+            "text":  ("", "text"),
+        },
+    }
+
+    # Selector alternativo (XPath) para variaciones de la SPA.
+    FALLBACK_LISTING_SPEC = {
+        "card": (
+            "//div[contains(@class, 'bubble-element') and contains(@class, 'Group')]"
+            "[.//div[contains(text(), 'híbrido') or contains(text(), 'remoto') "
+            "or contains(text(), 'presencial')]]"
+        ),
+        "fields": LISTING_SPEC["fields"],
+    }
+
     def login(self):
         pass  # No requiere autenticación
 
@@ -32,43 +51,30 @@ class TalentiaBot(BaseBot):
         url       = "https://utnba.talentia.com/portal/offers"
         MAX_PAGES = 5
 
-        self.driver.get(url)
-        self.random_sleep(5, 8)  # Espera extendida para que la SPA termine de renderizar
+        self.load_page(url)
 
         for page in range(1, MAX_PAGES + 1):
             print(f"\n   📄 Buscando por PÁGINA {page}")
 
-            try:
-                self.wait.until(EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, ".bubble-element.Group.cmnsr")
-                ))
-                self.random_sleep(2, 3)
-            except Exception:
+            # La SPA renderiza las tarjetas de a poco: se espera a que su
+            # cantidad deje de cambiar (antes, 5-8s fijos en la primera página).
+            if not self.wait_for_stable(".bubble-element.Group.cmnsr", replaces=9 if page == 1 else 2.5):
                 print("   ⚠️ No se detectaron tarjetas (o fin de carga).")
                 break
 
-            cards = self.driver.find_elements(
-                By.CSS_SELECTOR, ".clickable-element.bubble-element.Group.cmnsr"
-            )
+            spec  = self.LISTING_SPEC
+            cards = self.extract_listing(spec)
 
             if not cards:
-                # Selector alternativo para variaciones de la SPA
-                cards = self.driver.find_elements(
-                    By.XPATH,
-                    "//div[contains(@class, 'bubble-element') and contains(@class, 'Group')]"
-                    "[.//div[contains(text(), 'híbrido') or contains(text(), 'remoto') "
-                    "or contains(text(), 'presencial')]]"
-                )
+                spec  = self.FALLBACK_LISTING_SPEC
+                cards = self.extract_listing(spec)
 
             print(f"   -> Encontré {len(cards)} posibles ofertas...")
 
-            for card in cards:
+            matches = []
+            for index, record in enumerate(cards):
                 try:
-                    try:
-                        title_node = card.find_element(By.CSS_SELECTOR, ".bubble-element.Text.cmnsy")
-                        title_text = title_node.text.strip()
-                    except Exception:
-                        title_text = card.text.split("\n")[0].strip()
+                    title_text = (record["title"] or (record["text"] or "").split("\n")[0]).strip()
 
                     if not title_text or len(title_text) < 3:
                         continue
@@ -81,12 +87,15 @@ class TalentiaBot(BaseBot):
 
                         try:
                             print(f"         🔍 Extrayendo URL específica para '{title_text}'...")
+                            # Solo las tarjetas con match se buscan como WebElement, para el clic.
+                            card = self.card_element(spec, index)
+                            if card is None:
+                                raise RuntimeError("el listado cambió antes del clic")
                             self.driver.execute_script(
                                 "arguments[0].scrollIntoView({block: 'center'});", card
                             )
-                            self.random_sleep(1, 2)
+                            self.human_pause()
                             card.click()
-                            self.random_sleep(2, 3)
 
                             btn_full = self.wait.until(EC.element_to_be_clickable(
                                 (By.XPATH, "//div[contains(text(), 'Ver pantalla completa')]")
@@ -94,14 +103,15 @@ class TalentiaBot(BaseBot):
 
                             curr_handles = self.driver.window_handles
                             btn_full.click()
-                            self.random_sleep(2, 3)
 
-                            new_handles = self.driver.window_handles
+                            new_handles = self.wait_until(
+                                lambda: [h for h in self.driver.window_handles if h not in curr_handles],
+                                timeout=10, replaces=2.5,
+                            )
 
-                            if len(new_handles) > len(curr_handles):
-                                new_tab = [h for h in new_handles if h not in curr_handles][0]
-                                self.driver.switch_to.window(new_tab)
-                                self.random_sleep(1, 2)
+                            if new_handles:
+                                self.driver.switch_to.window(new_handles[0])
+                                self.wait_ready(replaces=1.5)
                                 url_oferta = normalize_url(self.driver.current_url)
                                 self.driver.close()
                                 self.driver.switch_to.window(curr_handles[0])
@@ -126,26 +136,32 @@ class TalentiaBot(BaseBot):
 
                         print(f"         ✨ ¡MATCH! Coincide con '{match_keyword}'")
                         print(f"            🔗 Portal: {url_oferta}")
-
-                        lang_blocked, lang_word = self.check_language_in_description(url_oferta)
-                        if lang_blocked:
-                            print(f"         🌐 ──────────────────────────────")
-                            print(f"         🌐 IDIOMA FILTRADO (Talentia)")
-                            print(f"            📌 Título  : {title_text.title()}")
-                            print(f"            🔍 Palabra : '{lang_word}'")
-                            print(f"         🌐 ──────────────────────────────")
-                            continue
-
-                        self.notify(
-                            f"✨ <b>¡NUEVA OFERTA EN UTN TALENTIA!</b>\n\n"
-                            f"📌 <b>Cargo:</b> {title_text}\n"
-                            f"🔑 <b>Match:</b> {match_keyword}\n"
-                            f"🔗 <a href='{url_oferta}'>Ir al Portal</a>"
-                        )
+                        matches.append((title_text, url_oferta, match_keyword))
 
                 except Exception:
                     continue
 
+            # Filtro de idioma en lote para los matches de la página.
+            verdicts = self.check_languages_in_descriptions([url for _, url, _ in matches])
+
+            for title_text, url_oferta, match_keyword in matches:
+                lang_blocked, lang_word = verdicts[url_oferta]
+                if lang_blocked:
+                    print(f"         🌐 ──────────────────────────────")
+                    print(f"         🌐 IDIOMA FILTRADO (Talentia)")
+                    print(f"            📌 Título  : {title_text.title()}")
+                    print(f"            🔍 Palabra : '{lang_word}'")
+                    print(f"         🌐 ──────────────────────────────")
+                    continue
+
+                self.notify_match(
+                    f"✨ <b>¡NUEVA OFERTA EN UTN TALENTIA!</b>\n\n"
+                    f"📌 <b>Cargo:</b> {title_text}\n"
+                    f"🔑 <b>Match:</b> {match_keyword}\n"
+                    f"🔗 <a href='{url_oferta}'>Ir al Portal</a>",
+                    url=url_oferta, title=title_text, keyword=match_keyword,
+                )
+
             # Paginación: click en "Siguiente" para cargar el próximo lote de tarjetas
             if page < MAX_PAGES:
                 print("   -> Buscando botón 'Siguiente'...")
@@ -158,11 +174,20 @@ class TalentiaBot(BaseBot):
                         print("   ⚠️ Botón Siguiente no visible. Fin.")
                         break
 
+                    first_card = self.driver.find_element(By.CSS_SELECTOR, ".bubble-element.Group.cmnsr")
+                    first_text = first_card.text
+
                     self.driver.execute_script("arguments[0].scrollIntoView(true);", next_btn)
-                    self.random_sleep(1, 2)
+                    self.human_pause()
                     next_btn.click()
                     print("   -> Click realizado. Esperando carga...")
-                    self.random_sleep(4, 6)
+
+                    # La página siguiente reemplaza las tarjetas (o su contenido):
+                    # se espera a que la primera tarjeta desaparezca o cambie.
+                    self.wait_until(
+                        lambda: EC.staleness_of(first_card)(self.driver) or first_card.text != first_text,
+                        replaces=5,
+                    )
 
                 except Exception as e:
                     print(f"   ⚠️ No se pudo avanzar de página: {e}")
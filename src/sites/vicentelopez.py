@@ -1,7 +1,5 @@
 from src.sites.base import BaseBot
 from src.history import normalize_url
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
 
 
 class VicenteLopezBot(BaseBot):
@@ -9,9 +7,20 @@ class VicenteLopezBot(BaseBot):
     Bot de búsqueda para el portal de empleos del Municipio de Vicente López.
 
     Recorre hasta 5 páginas paginadas por query param (&page=X), filtrando
-    por publicaciones de la última semana. No requiere autenticación.
+    por publicaciones de la última semana. No requiere autenticación. El
+    listado se renderiza en el servidor: se procesa con el backend HTTP.
     """
 
+    USE_HTTP_BACKEND = True
+
+    LISTING_SPEC = {
+        "card": "div.item.row",
+        "fields": {
+            "title": ("h4 a", "text"),
+            "url":   ("h4 a", "href"),
+        },
+    }
+
     def login(self):
         pass  # No requiere autenticación
 
@@ -32,31 +41,20 @@ class VicenteLopezBot(BaseBot):
             print(f"\n   📄 Buscando por PÁGINA {page}")
 
             try:
-                self.driver.get(url)
-                self.random_sleep(2, 4)
-
-                try:
-                    self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.item.row")))
-                except Exception:
-                    print(f"   ⚠️ No se detectaron ofertas en página {page} (o fin de lista).")
-                    break
-
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, "div.item.row")
+                job_cards = self.fetch_listing(url)
 
                 if not job_cards:
-                    print(f"   ⚠️ Lista vacía en página {page}.")
+                    print(f"   ⚠️ No se detectaron ofertas en página {page} (o fin de lista).")
                     break
 
                 print(f"   -> Encontré {len(job_cards)} ofertas...")
 
                 for card in job_cards:
                     try:
-                        try:
-                            title_node = card.find_element(By.CSS_SELECTOR, "h4 a")
-                            title_text = title_node.text.strip()
-                            url_oferta = normalize_url(title_node.get_attribute("href"))
-                        except Exception:
+                        if not card["title"] or not card["url"]:
                             continue
+                        title_text = card["title"].strip()
+                        url_oferta = normalize_url(card["url"])
 
                         if not title_text or len(title_text) < 3:
                             continue
@@ -70,11 +68,12 @@ class VicenteLopezBot(BaseBot):
                             print(f"         ✨ ¡MATCH! Coincide con '{match_keyword}'")
                             print(f"            🔗 URL: {url_oferta}")
 
-                            self.notify(
+                            self.notify_match(
                                 f"✨ <b>¡NUEVA OFERTA EN VICENTE LÓPEZ!</b>\n\n"
                                 f"📌 <b>Cargo:</b> {title_text}\n"
                                 f"🔑 <b>Match:</b> {match_keyword}\n"
-                                f"🔗 <a href='{url_oferta}'>Ver Oferta</a>"
+                                f"🔗 <a href='{url_oferta}'>Ver Oferta</a>",
+                                url=url_oferta, title=title_text, keyword=match_keyword,
                             )
 
                     except Exception:
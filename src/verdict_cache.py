@@ -0,0 +1,187 @@
+"""
+Cache persistente de veredictos del filtro de idioma.
+
+Las ofertas descartadas por idioma no se archivan en el historial (el
+archivado lo decide el usuario desde Telegram), por lo que reaparecen en cada
+ciclo y antes se volvía a descargar y analizar su descripción cada vez.
+
+Este módulo guarda en 'verdicts.json', por clave canónica de la oferta (ver
+canonical_key), el veredicto obtenido, el hash de la descripción analizada y la
+huella de la configuración del filtro (`language_filter_fingerprint`). Un
+veredicto se reutiliza mientras:
+
+- la configuración del filtro no cambie (frases, modo o umbral), y
+- no hayan pasado VERDICT_TTL_DAYS días desde el último análisis.
+
+Vencido el plazo, la descripción se descarga de nuevo: si su hash coincide con
+el guardado, el veredicto se renueva sin volver a analizarla; si la oferta fue
+editada, se analiza otra vez.
+"""
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+
+from src.canonical import canonical_key
+
+VERDICTS_FILE = "verdicts.json"
+
+# Las entradas vencidas se conservan en disco hasta RETENTION_FACTOR veces el
+# TTL, para poder renovarlas por hash si la descripción no cambió.
+RETENTION_FACTOR = 2
+
+
+def description_hash(text):
+    """Hash corto del texto de una descripción (sin espacios de borde)."""
+    return hashlib.sha1((text or "").strip().encode("utf-8")).hexdigest()[:16]
+
+
+class VerdictCache:
+    """
+    Veredictos del filtro de idioma persistidos en disco.
+
+    Cada entrada tiene la forma:
+        {"blocked": bool, "reason": str | None, "filter": huella,
+         "hash": hash de la descripción, "checked": fecha ISO}
+
+    Al cargar se descartan las entradas más viejas que el período de retención.
+    Los cambios se acumulan en memoria y se escriben con `save()` (una vez por
+    página de resultados).
+    Es seguro usarlo desde varios hilos.
+    """
+
+    def __init__(self, path=VERDICTS_FILE):
+        self.path    = path
+        self.entries = {}
+        self._dirty  = False
+        self._lock   = threading.RLock()
+        self.load()
+
+    @staticmethod
+    def _ttl():
+        from src.config import VERDICT_TTL_DAYS
+        return timedelta(days=VERDICT_TTL_DAYS)
+
+    def load(self):
+        """Carga los veredictos desde disco y purga los que superan la retención."""
+        if not os.path.exists(self.path):
+            self.entries = {}
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"⚠️ Error cargando el cache de veredictos: {e}. Se iniciará uno nuevo.")
+            self.entries = {}
+            return
+
+        limit_date   = datetime.now() - self._ttl() * RETENTION_FACTOR
+        self.entries = {}
+        for url, entry in data.items():
+            try:
+                if datetime.fromisoformat(entry["checked"]) > limit_date:
+                    self.entries[url] = entry
+            except (KeyError, TypeError, ValueError):
+                continue
+        self._dirty = len(self.entries) != len(data)
+
+    def save(self):
+        """Persiste los veredictos si hubo cambios (escritura atómica)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = f"{self.path}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self.entries, f, indent=4)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except Exception as e:
+                print(f"⚠️ No se pudo guardar el cache de veredictos: {e}")
+
+    def _entry(self, url, fingerprint):
+        """Entrada de la URL si fue analizada con la configuración actual del filtro."""
+        entry = self.entries.get(canonical_key(url))
+        if entry is None or entry.get("filter") != fingerprint:
+            return None
+        return entry
+
+    def get(self, url, fingerprint):
+        """
+        Veredicto vigente de una oferta.
+
+        Args:
+            url (str): URL de la oferta.
+            fingerprint (str): Huella actual del filtro de idioma.
+
+        Returns:
+            tuple | None: (bloqueada, motivo), o None si no hay veredicto vigente.
+        """
+        with self._lock:
+            entry = self._entry(url, fingerprint)
+            if entry is None:
+                return None
+            try:
+                if datetime.fromisoformat(entry["checked"]) <= datetime.now() - self._ttl():
+                    return None
+            except (KeyError, TypeError, ValueError):
+                return None
+            return entry["blocked"], entry["reason"]
+
+    def get_unchanged(self, url, fingerprint, text):
+        """
+        Veredicto guardado si la descripción no cambió desde el último análisis,
+        aunque esté vencido. Lo renueva por otros VERDICT_TTL_DAYS días.
+
+        Returns:
+            tuple | None: (bloqueada, motivo), o None si la descripción es distinta.
+        """
+        with self._lock:
+            entry = self._entry(url, fingerprint)
+            if entry is None or entry.get("hash") != description_hash(text):
+                return None
+            entry["checked"] = datetime.now().isoformat()
+            self._dirty      = True
+            return entry["blocked"], entry["reason"]
+
+    def put(self, url, fingerprint, verdict, text):
+        """Registra el veredicto obtenido al analizar la descripción `text`."""
+        blocked, reason = verdict
+        with self._lock:
+            self.entries[canonical_key(url)] = {
+                "blocked": bool(blocked),
+                "reason":  reason,
+                "filter":  fingerprint,
+                "hash":    description_hash(text),
+                "checked": datetime.now().isoformat(),
+            }
+            self._dirty = True
+
+
+class CacheStats:
+    """Aciertos y fallos del cache de veredictos de un bot."""
+
+    __slots__ = ("hits", "refreshed", "misses")
+
+    def __init__(self):
+        self.hits      = 0  # Veredicto vigente: sin descarga
+        self.refreshed = 0  # Vencido pero con la misma descripción: sin análisis
+        self.misses    = 0  # Descripción nueva, editada o ilegible
+
+    @property
+    def lookups(self):
+        return self.hits + self.refreshed + self.misses
+
+    def describe(self):
+        """Resumen legible: tasa de aciertos y desglose."""
+        rate = self.hits / self.lookups if self.lookups else 0.0
+        return (
+            f"{rate:.0%} aciertos ({self.hits}/{self.lookups}), "
+            f"{self.refreshed} renovados sin cambios, {self.misses} sin veredicto previo"
+        )
+
+
+# Instancia global compartida por todos los bots
+verdict_cache = VerdictCache()
@@ -0,0 +1,139 @@
+"""
+Recepción de updates de Telegram por webhook (TELEGRAM_MODE = "webhook").
+
+Alternativa al long polling para servidores con una URL pública: Telegram
+envía cada Update como un POST JSON a TELEGRAM_WEBHOOK_URL y este módulo lo
+recibe con un servidor http.server local (WEBHOOK_HOST:WEBHOOK_PORT, detrás
+del proxy HTTPS que publique esa URL).
+
+- Cada petición debe traer el encabezado X-Telegram-Bot-Api-Secret-Token con
+  TELEGRAM_WEBHOOK_SECRET (Telegram lo agrega si se registró con setWebhook);
+  si no coincide se responde 403.
+- La petición se responde apenas se lee el JSON: el update se entrega a
+  `on_update` (UpdateListener.submit), que solo lo encola. Los comandos y los
+  archivados se procesan en el hilo principal, igual que con polling.
+"""
+import hmac
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from src.config import TELEGRAM_BOT_TOKEN
+
+SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+# Un Update de mensaje de texto pesa unos pocos KB.
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class _UpdateHandler(BaseHTTPRequestHandler):
+    """Atiende los POST de Telegram; la configuración llega por el servidor."""
+
+    def do_POST(self):
+        server = self.server
+        if self.path.rstrip("/") != server.path.rstrip("/"):
+            self._reply(404)
+            return
+
+        received = self.headers.get(SECRET_HEADER, "")
+        if not server.secret or not hmac.compare_digest(received, server.secret):
+            print(f"   ⚠️ Webhook: petición rechazada (token secreto inválido) desde {self.client_address[0]}")
+            self._reply(403)
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length <= 0 or length > MAX_BODY_BYTES:
+            self._reply(413 if length > MAX_BODY_BYTES else 400)
+            return
+
+        try:
+            update = json.loads(self.rfile.read(length))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            self._reply(400)
+            return
+        if not isinstance(update, dict) or "update_id" not in update:
+            self._reply(400)
+            return
+
+        # Se confirma antes de procesar: Telegram reintenta si la respuesta tarda.
+        self._reply(200)
+        server.on_update(update)
+
+    def _reply(self, status):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass  # Sin log por petición: los errores relevantes se imprimen arriba
+
+
+class WebhookServer:
+    """
+    Servidor HTTP local que recibe los updates del webhook.
+
+    Args:
+        on_update (callable): Recibe cada update (dict) validado.
+        secret (str): Token secreto esperado en SECRET_HEADER.
+        host (str): Interfaz donde escuchar.
+        port (int): Puerto donde escuchar (0 elige uno libre).
+        path (str): Ruta del endpoint (la de TELEGRAM_WEBHOOK_URL).
+    """
+
+    def __init__(self, on_update, secret, host="0.0.0.0", port=8443, path="/"):
+        self.httpd                = ThreadingHTTPServer((host, port), _UpdateHandler)
+        self.httpd.on_update      = on_update
+        self.httpd.secret         = secret
+        self.httpd.path           = path or "/"
+        self.httpd.daemon_threads = True
+        self._thread              = None
+
+    @property
+    def port(self):
+        return self.httpd.server_address[1]
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="telegram-webhook", daemon=True)
+        self._thread.start()
+        print(f"🌐 Webhook de Telegram escuchando en el puerto {self.port}.")
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def _api(method, **params):
+    """Llama a un método de la Bot API y retorna su respuesta JSON."""
+    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/{method}"
+    return requests.post(url, json=params, timeout=15).json()
+
+
+def set_webhook(url, secret):
+    """
+    Registra la URL pública del webhook con el token secreto.
+
+    Returns:
+        bool: True si Telegram aceptó la configuración.
+    """
+    try:
+        response = _api("setWebhook", url=url, secret_token=secret, allowed_updates=["message"])
+    except Exception as e:
+        print(f"   ⚠️ No se pudo registrar el webhook: {e}")
+        return False
+    if not response.get("ok"):
+        print(f"   ⚠️ Telegram rechazó el webhook: {response.get('description')}")
+        return False
+    return True
+
+
+def delete_webhook():
+    """Elimina el webhook registrado (getUpdates no funciona mientras exista)."""
+    try:
+        _api("deleteWebhook")
+    except Exception as e:
+        print(f"   ⚠️ No se pudo eliminar el webhook: {e}")
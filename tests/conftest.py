@@ -0,0 +1,31 @@
+import os
+import sys
+
+import pytest
+
+# Las pruebas importan el proyecto como lo hace main.py (paquete `src`).
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Los archivos que el bot crea en el directorio actual van a una carpeta temporal."""
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture
+def notifications(monkeypatch):
+    """Captura los mensajes que los bots encolan para Telegram."""
+    sent = []
+    monkeypatch.setattr("src.sites.base.queue_telegram_message", sent.append)
+    return sent
+
+
+@pytest.fixture
+def history(tmp_path, monkeypatch):
+    """Historial propio de la prueba (JSON en la carpeta temporal) en lugar del global."""
+    from src.history import JobHistory, JsonHistoryStore
+
+    job_history = JobHistory(JsonHistoryStore(str(tmp_path / "seen_jobs.json")))
+    monkeypatch.setattr("src.sites.base.history", job_history)
+    return job_history
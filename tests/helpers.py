@@ -0,0 +1,100 @@
+"""
+Utilidades compartidas por las pruebas: fixtures JSON y un servidor HTTP local.
+
+`StubServer` reemplaza a la API real de un portal: cada petición se registra y
+se responde con lo que retorne la función `respond`, de modo que un bot con
+API_BASE_URL apuntando a `server.url` se prueba sin salir a internet.
+"""
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def load_fixture(name):
+    """Lee un archivo JSON de tests/fixtures."""
+    with open(os.path.join(FIXTURES_DIR, name), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class StubRequest:
+    """Petición recibida por StubServer."""
+
+    def __init__(self, method, path, query, body):
+        self.method = method
+        self.path   = path
+        self.query  = query
+        self.body   = body
+
+    @property
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+
+    def _handle(self, method):
+        parsed = urlparse(self.path)
+        length = int(self.headers.get("Content-Length", 0) or 0)
+        body   = self.rfile.read(length) if length else b""
+        request = StubRequest(method, parsed.path, parse_qs(parsed.query), body)
+        self.server.requests.append(request)
+
+        status, payload = self.server.respond(request)
+        if isinstance(payload, str):
+            data, content_type = payload.encode("utf-8"), "text/html; charset=utf-8"
+        else:
+            data = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+            content_type = "application/json"
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer:
+    """
+    Servidor HTTP local en un puerto libre, usable como context manager.
+
+    Args:
+        respond (callable): Recibe un StubRequest y retorna (status, payload);
+                            payload es un objeto JSON, bytes crudos o un str
+                            (que se sirve como HTML).
+    """
+
+    def __init__(self, respond):
+        self.httpd                = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self.httpd.respond        = respond
+        self.httpd.requests       = []
+        self.httpd.daemon_threads = True
+        self._thread              = threading.Thread(target=self.httpd.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}"
+
+    @property
+    def requests(self):
+        return self.httpd.requests
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
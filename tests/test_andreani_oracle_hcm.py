@@ -0,0 +1,81 @@
+"""AndreaniBot contra un servidor local que imita el REST de Oracle Cloud HCM."""
+import re
+
+import pytest
+import requests
+
+from helpers import StubServer, load_fixture
+from src.canonical import canonical_key
+from src.sites.andreani import AndreaniBot
+
+PAGES = load_fixture("oracle_hcm_andreani_requisitions.json")["pages"]
+
+RESOURCE_PATH = "/hcmRestApi/resources/latest/recruitingCEJobRequisitions"
+
+
+def finder_offset(request):
+    """Offset pedido en el finder ('findReqs;siteNumber=...,offset=N,...')."""
+    return int(re.search(r"offset=(\d+)", request.query["finder"][0]).group(1))
+
+
+def oracle_api(overrides=None):
+    """
+    Responde las páginas grabadas por offset; `overrides` reemplaza la
+    respuesta de algún offset por (status, payload).
+    """
+    overrides = overrides or {}
+
+    def respond(request):
+        if request.path != RESOURCE_PATH:
+            return 404, {}
+        offset = finder_offset(request)
+        if offset in overrides:
+            return overrides[offset]
+        return 200, PAGES[offset // AndreaniBot.PAGE_SIZE]
+
+    return respond
+
+
+def fetch(respond):
+    bot = AndreaniBot()
+    with StubServer(respond) as server:
+        bot.API_BASE_URL = server.url
+        return bot.fetch_api_requisitions(), server
+
+
+def test_api_pages_through_all_requisitions():
+    requisitions, server = fetch(oracle_api())
+
+    assert len(requisitions) == 57
+    assert [finder_offset(request) for request in server.requests] == [0, 25, 50]
+    assert "siteNumber=CX_1001" in server.requests[0].query["finder"][0]
+    assert requisitions[0]["url"] == f"{server.url}/hcmUI/CandidateExperience/es/sites/CX_1001/job/31200"
+
+
+def test_empty_page_stops_and_keeps_collected():
+    empty = {"items": [{"TotalJobsCount": 57, "requisitionList": []}]}
+    requisitions, server = fetch(oracle_api({25: (200, empty)}))
+
+    assert len(requisitions) == 25
+    assert len(server.requests) == 2
+
+
+@pytest.mark.parametrize("failure", [(200, {"items": []}), (200, b"<html>"), (500, {})])
+def test_broken_later_page_keeps_collected(failure):
+    requisitions, _ = fetch(oracle_api({25: failure}))
+    assert len(requisitions) == 25
+
+
+def test_malformed_first_page_raises():
+    with pytest.raises(ValueError):
+        fetch(oracle_api({0: (200, {"items": []})}))
+
+
+def test_failing_first_page_raises():
+    with pytest.raises(requests.HTTPError):
+        fetch(oracle_api({0: (503, {})}))
+
+
+def test_requisition_urls_are_keyed_by_id():
+    url = f"{AndreaniBot.API_BASE_URL}/hcmUI/CandidateExperience/es/sites/CX_1001/job/31200?utm_source=x"
+    assert canonical_key(url) == "andreani:31200"
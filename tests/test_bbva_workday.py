@@ -0,0 +1,73 @@
+"""BBVABot contra un servidor local que imita la API de búsqueda de Workday."""
+import pytest
+
+from helpers import StubServer, load_fixture
+from src.canonical import canonical_key
+from src.sites.bbva import BBVABot
+
+PAGES = load_fixture("workday_bbva_jobs.json")["pages"]
+
+
+def workday_api(request):
+    """Responde como /wday/cxs/bbva/BBVA/jobs según el offset pedido."""
+    if request.method != "POST" or request.path != "/wday/cxs/bbva/BBVA/jobs":
+        return 404, {}
+    offset = request.json["offset"]
+    return 200, PAGES[offset // BBVABot.PAGE_SIZE]
+
+
+@pytest.fixture
+def bot():
+    return BBVABot()
+
+
+def test_api_pages_through_all_postings(bot):
+    with StubServer(workday_api) as server:
+        bot.API_BASE_URL = server.url
+        postings = bot.fetch_api_postings()
+
+    assert len(postings) == 45
+    assert [request.json["offset"] for request in server.requests] == [0, 20, 40]
+    assert all(request.json["limit"] == BBVABot.PAGE_SIZE for request in server.requests)
+    assert all(request.json["appliedFacets"] == BBVABot.APPLIED_FACETS for request in server.requests)
+
+    first = postings[0]
+    assert first["title"] == "Desarrollador Python Jr"
+    assert first["url"] == f"{server.url}/es/BBVA/job/Buenos-Aires/Desarrollador-Python-Jr_0025000"
+
+
+def test_api_respects_max_results(bot):
+    bot.MAX_RESULTS = 20
+    with StubServer(workday_api) as server:
+        bot.API_BASE_URL = server.url
+        postings = bot.fetch_api_postings()
+
+    assert len(postings) == 20
+    assert len(server.requests) == 1
+
+
+def test_api_without_job_postings_raises(bot):
+    with StubServer(lambda request: (200, {"errorCode": "S22"})) as server:
+        bot.API_BASE_URL = server.url
+        with pytest.raises(ValueError):
+            bot.fetch_api_postings()
+
+
+def test_search_falls_back_to_browser_when_api_fails(bot, history, notifications, monkeypatch):
+    browser_postings = [{
+        "title": "Desarrollador Python Jr",
+        "url":   "https://bbva.wd3.myworkdayjobs.com/es/BBVA/job/Buenos-Aires/Desarrollador-Python-Jr_0099999",
+    }]
+    monkeypatch.setattr(bot, "fetch_browser_postings", lambda: browser_postings)
+
+    with StubServer(lambda request: (500, {})) as server:
+        bot.API_BASE_URL = server.url
+        bot.search()
+
+    assert len(notifications) == 2  # Aviso de inicio + la oferta del navegador
+    assert history.is_seen(browser_postings[0]["url"])
+
+
+def test_workday_urls_are_keyed_by_requisition_id():
+    url = "https://bbva.wd3.myworkdayjobs.com/es/BBVA/job/Buenos-Aires/Desarrollador-Python-Jr_0025000?source=x"
+    assert canonical_key(url) == "bbva:0025000"
@@ -0,0 +1,122 @@
+"""BumeranBot.search_api contra una repetición offline de la API de búsqueda."""
+import copy
+from datetime import datetime
+
+import pytest
+import requests
+
+from helpers import load_fixture
+from src.sites.bumeran import BumeranBot
+
+TECNOLOGIA     = "tecnologia-sistemas-y-telecomunicaciones"
+ADMINISTRACION = "administracion-contabilidad-y-finanzas"
+
+SEARCH_KEYWORDS   = ["python", "desarrollador", "analista", "administrativo"]
+NEGATIVE_KEYWORDS = ["senior"]
+
+
+class _ReplayResponse:
+
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class ReplaySession:
+    """
+    Reemplaza la sesión HTTP: responde cada POST de searchNormalizado con la
+    página grabada de su área. Las fechas se corren para que la grabación
+    tenga siempre la misma antigüedad respecto de hoy.
+    """
+
+    def __init__(self, name="bumeran_search_replay.json"):
+        recording     = load_fixture(name)
+        recorded_at   = datetime.strptime(recording["recorded_at"], "%Y-%m-%d")
+        shift         = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - recorded_at
+        self.pages    = copy.deepcopy(recording["responses"])
+        self.requests = []
+        for page in self.pages.values():
+            for posting in page["content"]:
+                posted = datetime.strptime(posting["fechaPublicacion"], "%d-%m-%Y") + shift
+                posting["fechaPublicacion"] = posted.strftime("%d-%m-%Y")
+
+    def post(self, url, params=None, json=None, headers=None, timeout=None):
+        assert url.endswith("/api/avisos/searchNormalizado")
+        assert headers["x-site-id"] == BumeranBot.SITE_ID
+        area = next(f["value"] for f in json["filtros"] if f["id"] == "area")
+        self.requests.append((area, params["page"]))
+        return _ReplayResponse(self.pages[f"{area}:{params['page']}"])
+
+
+@pytest.fixture
+def session(monkeypatch):
+    replay = ReplaySession()
+    monkeypatch.setattr("src.http_backend.get_session", lambda: replay)
+    return replay
+
+
+def notified_urls(notifications):
+    return [message.split("<a href='")[1].split("'")[0] for message in notifications]
+
+
+def test_api_walk_stops_at_the_date_window(session, history, notifications):
+    BumeranBot().search_api(SEARCH_KEYWORDS, NEGATIVE_KEYWORDS)
+
+    # Tecnología corta en la página 1 (aviso fuera de la ventana); la página 2 no se pide.
+    assert session.requests == [(TECNOLOGIA, 0), (TECNOLOGIA, 1), (ADMINISTRACION, 0), (ADMINISTRACION, 1)]
+    assert notified_urls(notifications) == [
+        "https://www.bumeran.com.ar/empleos/desarrollador-python-jr-aliantec-1118190158.html",
+        "https://www.bumeran.com.ar/empleos/analista-de-sistemas-banco-provincia-1118189650.html",
+        "https://www.bumeran.com.ar/empleos/administrativo-de-cobranzas-distribuidora-norte-1118188000.html",
+    ]
+
+
+def test_description_in_english_is_filtered(session, history, notifications):
+    BumeranBot().search_api(SEARCH_KEYWORDS, NEGATIVE_KEYWORDS)
+    assert not any("1118189977" in url for url in notified_urls(notifications))
+
+
+def test_aviso_in_two_areas_is_notified_once(session, history, notifications):
+    BumeranBot().search_api(SEARCH_KEYWORDS, NEGATIVE_KEYWORDS)
+    assert sum("1118189650" in url for url in notified_urls(notifications)) == 1
+
+
+def test_aviso_archived_from_telegram_is_skipped(session, history, notifications):
+    # Al archivar se guarda el enlace notificado (otro número final, mismo slug).
+    history.add_job("https://www.bumeran.com.ar/empleos/desarrollador-python-jr-aliantec-2177247.html?s=abc")
+
+    BumeranBot().search_api(SEARCH_KEYWORDS, NEGATIVE_KEYWORDS)
+    assert not any("1118190158" in url for url in notified_urls(notifications))
+
+
+def test_api_failure_falls_back_to_browser(history, notifications, monkeypatch):
+    def failing_session():
+        raise requests.ConnectionError("sin red")
+
+    monkeypatch.setattr("src.http_backend.get_session", failing_session)
+    browser_calls = []
+    monkeypatch.setattr(BumeranBot, "search_browser", lambda self, *keywords: browser_calls.append(keywords))
+
+    BumeranBot().search()
+    assert len(browser_calls) == 1
+
+
+def test_api_failure_after_some_pages_does_not_fall_back(session, history, notifications, monkeypatch):
+    fetch_api_page = BumeranBot.fetch_api_page
+
+    def failing_after_first_page(self, area, page_num):
+        if self.api_pages_done:
+            raise requests.ConnectionError("se cortó la red")
+        return fetch_api_page(self, area, page_num)
+
+    monkeypatch.setattr(BumeranBot, "fetch_api_page", failing_after_first_page)
+    browser_calls = []
+    monkeypatch.setattr(BumeranBot, "search_browser", lambda self, *keywords: browser_calls.append(keywords))
+
+    BumeranBot().search()
+    assert browser_calls == []
@@ -0,0 +1,65 @@
+"""Reglas de canonicalización por sitio (src/canonical.py)."""
+import pytest
+
+from src import canonical
+from src.canonical import canonical_key, normalize_url, register_site_rules, rules_version
+from src.sites import bumeran, computrabajo, empleosit, linkedin  # noqa: F401  (registran sus reglas)
+
+
+@pytest.mark.parametrize("url, key", [
+    ("https://www.linkedin.com/jobs/view/3912345678/?refId=abc&trackingId=def", "linkedin:3912345678"),
+    ("https://ar.linkedin.com/jobs/view/desarrollador-python-3912345678?trk=public", "linkedin:3912345678"),
+    ("https://ar.computrabajo.com/ofertas-de-trabajo/oferta-de-trabajo-de-analista-"
+     "0123456789ABCDEF0123456789ABCDEF#lc=ListOffers-Score-3", "computrabajo:0123456789ABCDEF0123456789ABCDEF"),
+    ("https://www.empleosit.com.ar/display-job/123456/programador.html?searchId=9&page=2", "empleosit:123456"),
+])
+def test_site_urls_are_keyed_by_native_id(url, key):
+    assert canonical_key(url) == key
+
+
+def test_canonical_key_is_idempotent():
+    assert canonical_key("bumeran:1118190158") == "bumeran:1118190158"
+
+
+@pytest.mark.parametrize("url, key", [
+    ("https://www.bumeran.com.ar/empleos/desarrollador-python-aliantec-1118190158.html?s=1a2b",
+     "https://www.bumeran.com.ar/empleos/desarrollador-python-aliantec.html"),
+    ("https://www.bumeran.com.ar/empleos/desarrollador-python-aliantec-2177247.html",
+     "https://www.bumeran.com.ar/empleos/desarrollador-python-aliantec.html"),
+    # Clave vieja ya normalizada que termina en un año: no se toca al recalcular.
+    ("https://www.bumeran.com.ar/empleos/pasante-administrativo-2026.html",
+     "https://www.bumeran.com.ar/empleos/pasante-administrativo-2026.html"),
+])
+def test_bumeran_links_are_keyed_by_slug(url, key):
+    assert canonical_key(url) == key
+    assert canonical_key(key) == key
+
+
+def test_normalize_url_drops_tracking_and_fragment():
+    url = "https://www.empleosit.com.ar/display-job/123456/programador.html?searchId=9&page=2&ref=mail#top"
+    assert normalize_url(url) == "https://www.empleosit.com.ar/display-job/123456/programador.html?ref=mail"
+
+
+def test_unknown_site_falls_back_to_normalized_url():
+    url = "https://empleos.ejemplo.com/oferta/42?utm_source=newsletter#detalle"
+    assert canonical_key(url) == "https://empleos.ejemplo.com/oferta/42"
+
+
+@pytest.fixture
+def example_site():
+    yield "ejemplo"
+    canonical._registry.pop("ejemplo", None)
+    for cached in (canonical.rules_for, normalize_url, canonical_key):
+        cached.cache_clear()
+
+
+def test_registering_rules_clears_caches_and_changes_version(example_site):
+    url = "https://empleos.ejemplo-pruebas.com/aviso/77?sesion=1"
+    assert canonical_key(url) == "https://empleos.ejemplo-pruebas.com/aviso/77?sesion=1"
+    version = rules_version()
+
+    register_site_rules(example_site, ("ejemplo-pruebas.com",), tracking_params=("sesion",), id_pattern=r"/aviso/(\d+)")
+
+    assert rules_version() != version
+    assert canonical_key(url) == "ejemplo:77"
+    assert normalize_url(url) == "https://empleos.ejemplo-pruebas.com/aviso/77"
@@ -0,0 +1,72 @@
+"""Identificación de idioma por trigramas (src/language_id.py) y su corte de confianza."""
+import pytest
+
+from src import config
+from src.language_filter import check_description_language
+from src.language_id import get_language_identifier
+
+SPANISH = """
+Empresa de servicios financieros incorpora un desarrollador Python para su equipo de datos.
+Vas a diseñar procesos de integración, automatizar reportes y mantener las APIs internas.
+Requisitos: conocimientos sólidos de SQL, experiencia con Django o Flask y manejo de Git.
+Ofrecemos trabajo remoto, horario flexible, capacitación continua y cobertura médica.
+"""
+
+ENGLISH = """
+Our client, a fast growing fintech, is hiring a Python developer for its data platform team.
+You will design integration pipelines, automate reporting and maintain our internal APIs.
+Requirements: solid SQL skills, hands-on experience with Django or Flask and Git workflows.
+We offer fully remote work, flexible hours, ongoing training and private health coverage.
+"""
+
+PORTUGUESE = """
+Empresa do setor financeiro contrata desenvolvedor Python para o time de dados da região.
+Você vai criar processos de integração, automatizar relatórios e manter as APIs internas.
+Requisitos: conhecimentos sólidos de SQL, vivência com Django ou Flask e uso diário de Git.
+Oferecemos trabalho remoto, horário flexível, treinamentos constantes e plano de saúde.
+"""
+
+
+@pytest.mark.parametrize("text, language", [(SPANISH, "es"), (ENGLISH, "en"), (PORTUGUESE, "pt")])
+def test_descriptions_are_classified(text, language):
+    guess = get_language_identifier().identify(text)
+    assert guess.language == language
+    assert guess.confidence == 1.0
+
+
+def test_short_english_headings_are_ignored():
+    guess = get_language_identifier().identify("Requirements\nAbout the role\n" + SPANISH)
+    assert guess.language == "es"
+    assert guess.foreign_share == 0.0
+
+
+def test_empty_text_has_no_language():
+    guess = get_language_identifier().identify("Postularme\nVer más")
+    assert guess.language is None
+    assert guess.foreign_share == 0.0
+
+
+@pytest.fixture
+def ngram_mode(monkeypatch):
+    monkeypatch.setattr(config, "LANGUAGE_FILTER_MODE", "ngram")
+    return lambda cut: monkeypatch.setattr(config, "LANGUAGE_ID_MIN_CONFIDENCE", cut)
+
+
+def test_foreign_description_is_blocked(ngram_mode):
+    ngram_mode(0.6)
+    blocked, reason = check_description_language(ENGLISH)
+    assert blocked
+    assert reason.startswith("en (100%")
+    assert check_description_language(SPANISH) == (False, None)
+
+
+def test_mixed_description_respects_the_confidence_cut(ngram_mode):
+    # Mitad en español (la interfaz del portal) y mitad en inglés.
+    mixed = SPANISH + ENGLISH
+    share = get_language_identifier().identify(mixed).foreign_share
+    assert 0.4 < share < 0.6
+
+    ngram_mode(0.6)
+    assert check_description_language(mixed) == (False, None)
+    ngram_mode(0.4)
+    assert check_description_language(mixed)[0] is True
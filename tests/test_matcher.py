@@ -0,0 +1,24 @@
+"""KeywordMatcher: límites de palabra y keyword informada."""
+import pytest
+
+from src.matcher import KeywordMatcher
+
+
+@pytest.mark.parametrize("title, keyword", [
+    ("Desarrollador Python Jr", "python"),
+    ("Analista SSR", "analista"),      # 'sr' no coincide dentro de 'ssr'
+    ("Programador C# .Net", None),     # negativa con símbolos
+    ("Desarrollador Sr", None),
+    ("Soporte técnico", None),
+])
+def test_word_boundaries(title, keyword):
+    matcher = KeywordMatcher(["python", "analista", "programador", "desarrollador"], ["sr", "c#"])
+    assert matcher.match(title) == keyword
+
+
+def test_first_keyword_in_list_order_is_reported():
+    # El título nombra antes 'react', pero 'python' está primera en la lista.
+    matcher = KeywordMatcher(["python", "react", "desarrollador", "desarrollador web"], [])
+    assert matcher.match("React y Python developer") == "python"
+    assert matcher.match("Desarrollador Web") == "desarrollador"
+    assert KeywordMatcher(["desarrollador web", "desarrollador"], []).match("Desarrollador Web") == "desarrollador web"
@@ -0,0 +1,36 @@
+"""NotificationDispatcher: arranque con mensajes pendientes de la ejecución anterior."""
+import json
+import threading
+import time
+
+from src import config
+from src.notifications import DeliveryResult, NotificationDispatcher
+
+
+def test_pending_overflow_does_not_stall_startup(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "NOTIFY_QUEUE_SIZE", 3)
+    monkeypatch.setattr(config, "NOTIFY_RATE_PER_SECOND", 1000.0)
+    pending_file = tmp_path / "pending_notifications.json"
+    pending_file.write_text(json.dumps([f"pendiente {n}" for n in range(10)]), encoding="utf-8")
+
+    release = threading.Event()
+    sent    = []
+
+    def sender(message):
+        release.wait(5)
+        sent.append(message)
+        return DeliveryResult(DeliveryResult.SENT)
+
+    dispatcher = NotificationDispatcher(sender=sender, pending_file=str(pending_file))
+    started    = time.monotonic()
+    dispatcher._ensure_started()
+
+    # Con la cola llena no se espera NOTIFY_ENQUEUE_TIMEOUT_SECONDS por cada excedente.
+    assert time.monotonic() - started < 1
+    spilled = json.loads(pending_file.read_text(encoding="utf-8"))
+    assert spilled == dispatcher.failed
+    assert len(spilled) >= 10 - 3 - 1  # Cola llena, y a lo sumo uno ya en envío
+
+    release.set()
+    dispatcher.flush(timeout=5)
+    assert sent + spilled == [f"pendiente {n}" for n in range(10)]
@@ -0,0 +1,107 @@
+"""Modo webhook: WebhookServer local y su entrega de updates al UpdateListener."""
+import json
+import queue
+
+import pytest
+import requests
+
+from src import listener as listener_module
+from src.listener import UpdateListener, stop_requested
+from src.webhook import SECRET_HEADER, WebhookServer
+
+SECRET  = "s3cret-de-prueba"
+PATH    = "/telegram/webhook"
+CHAT_ID = "4242"
+
+
+def update(update_id, text):
+    return {"update_id": update_id, "message": {"message_id": update_id, "chat": {"id": int(CHAT_ID)}, "text": text}}
+
+
+@pytest.fixture
+def received():
+    # El servidor confirma antes de entregar el update: se espera con una cola.
+    return queue.Queue()
+
+
+@pytest.fixture
+def server(received):
+    webhook = WebhookServer(received.put, SECRET, host="127.0.0.1", port=0, path=PATH)
+    webhook.start()
+    yield webhook
+    webhook.close()
+
+
+def post(server, body, secret=SECRET, path=PATH):
+    headers = {"Content-Type": "application/json"}
+    if secret is not None:
+        headers[SECRET_HEADER] = secret
+    data = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+    return requests.post(f"http://127.0.0.1:{server.port}{path}", data=data, headers=headers, timeout=5)
+
+
+def test_valid_update_is_acknowledged_and_delivered(server, received):
+    assert post(server, update(1, "/vermenos")).status_code == 200
+    assert received.get(timeout=5) == update(1, "/vermenos")
+
+
+@pytest.mark.parametrize("secret", [None, "", "otro-token"])
+def test_missing_or_wrong_secret_is_rejected(server, received, secret):
+    assert post(server, update(1, "/stop"), secret=secret).status_code == 403
+    assert received.empty()
+
+
+def test_unknown_path_is_not_found(server, received):
+    assert post(server, update(1, "/stop"), path="/otra-ruta").status_code == 404
+    assert received.empty()
+
+
+@pytest.mark.parametrize("body", [b"{no es json", b"[1, 2]", json.dumps({"message": {}}).encode()])
+def test_malformed_body_is_rejected(server, received, body):
+    assert post(server, body).status_code == 400
+    assert received.empty()
+
+
+def test_oversized_body_is_rejected(server, received):
+    body = json.dumps({"update_id": 1, "padding": "x" * (1024 * 1024)}).encode()
+    assert post(server, body).status_code == 413
+    assert received.empty()
+
+
+@pytest.fixture
+def update_listener(monkeypatch):
+    sent = []
+    monkeypatch.setattr(listener_module, "TELEGRAM_CHAT_ID", CHAT_ID)
+    monkeypatch.setattr(listener_module, "send_msg", lambda chat_id, text: sent.append(text))
+    monkeypatch.setattr(listener_module, "send_long_msg", lambda chat_id, text: sent.append(text))
+    stop_requested.clear()
+    update_listener = UpdateListener()
+    update_listener.sent = sent
+    yield update_listener
+    stop_requested.clear()
+
+
+def test_redelivered_update_is_processed_once(update_listener):
+    webhook = WebhookServer(update_listener.submit, SECRET, host="127.0.0.1", port=0, path=PATH)
+    webhook.start()
+    try:
+        for _ in range(2):  # Telegram reenvía si la confirmación llegó tarde
+            assert post(webhook, update(7, "/vermenos")).status_code == 200
+    finally:
+        webhook.close()
+
+    assert update_listener.process_pending(timeout=5) == 1
+    assert len(update_listener.sent) == 1
+    assert update_listener.handled == 7
+
+
+def test_stop_from_webhook_ends_the_wait(update_listener):
+    webhook = WebhookServer(update_listener.submit, SECRET, host="127.0.0.1", port=0, path=PATH)
+    webhook.start()
+    try:
+        assert post(webhook, update(8, "/stop")).status_code == 200
+        assert update_listener.wait(5) is True
+    finally:
+        webhook.close()
+
+    assert stop_requested.is_set()